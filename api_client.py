@@ -2,6 +2,15 @@
 #
 # Historique des versions:
 #
+# Version 1.4 (2026-10-19):
+#   - pause_sync_task / resume_sync_task : pause et reprise d'une synchronisation en cours.
+#
+# Version 1.3 (2026-10-19):
+#   - get_error_report : fichiers non synchronisés lors de la dernière synchronisation.
+#
+# Version 1.2 (2026-10-19):
+#   - start_verify_task / get_verify_report : audit des destinations d'après les empreintes enregistrées.
+#
 # Version 1.1 (2025-05-20):
 #   - Ajout du bloc d'historique des versions.
 #
@@ -83,6 +92,21 @@ class ApiClient:
     def stop_sync_task(self, config_name):
         return self._make_request('POST', f'/api/sync_tasks/stop/{config_name}')
 
+    def pause_sync_task(self, config_name):
+        return self._make_request('POST', f'/api/sync_tasks/pause/{config_name}')
+
+    def resume_sync_task(self, config_name):
+        return self._make_request('POST', f'/api/sync_tasks/resume/{config_name}')
+
+    def start_verify_task(self, config_name):
+        return self._make_request('POST', f'/api/sync_tasks/verify/{config_name}')
+
+    def get_verify_report(self, config_name):
+        return self._make_request('GET', f'/api/verify_reports/{config_name}')
+
+    def get_error_report(self, config_name):
+        return self._make_request('GET', f'/api/error_reports/{config_name}')
+
     def get_sync_tasks(self):
         return self._make_request('GET', '/api/sync_tasks')
 
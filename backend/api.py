@@ -2,6 +2,101 @@
 #
 # Historique des versions:
 #
+# Version 3.53 (2026-10-19):
+#   - Option `space_margin_mb` (16) transmise à `sync_engine.py` : espace laissé libre sur la
+#     destination par les écritures planifiées.
+#
+# Version 3.52 (2026-10-19):
+#   - Le script de synchronisation est lancé avec SIGTERM, SIGUSR1 et SIGUSR2 bloqués (masque hérité) :
+#     une pause ou un arrêt demandé pendant son démarrage est mis en attente et traité par son thread de
+#     contrôle, au lieu de terminer le processus.
+#
+# Version 3.51 (2026-10-19):
+#   - Pause et reprise : `POST /api/sync_tasks/pause/<config_name>` (SIGUSR1) et
+#     `POST /api/sync_tasks/resume/<config_name>` (SIGUSR2). Le moteur s'arrête entre deux fichiers et
+#     garde en mémoire son parcours et les fichiers restant à copier ; statut "paused" (tâche active).
+#
+# Version 3.50 (2026-10-19):
+#   - Arrêt coopératif : `SyncTask.stop` envoie SIGTERM et retourne aussitôt (plus d'attente bloquante
+#     dans la requête) ; la tâche passe au statut "stopping" jusqu'à la fin du script (qui termine les
+#     copies en cours et journalise sa synthèse), puis "stopped". Un script toujours actif
+#     STOP_KILL_SECONDS après la demande est tué. Une tâche "stopping" ne peut pas être relancée.
+#
+# Version 3.49 (2026-10-19):
+#   - Statut "completed_with_errors" : le moteur termine la synchronisation malgré des fichiers en
+#     erreur (code de sortie 2) ; `GET /api/error_reports/<config_name>` retourne le rapport des
+#     fichiers non synchronisés. Une tâche n'est plus marquée "completed" à 100 % de progression
+#     tant que le processus n'est pas terminé : son code de sortie donne le statut final.
+#
+# Version 3.48 (2026-10-19):
+#   - Options `spot_check_days` (0 : désactivé), `spot_check_mb` (1024) et `spot_check_sampling`
+#     ("stratified" ou "random") du contrôle par échantillonnage transmises à `sync_engine.py`.
+#
+# Version 3.47 (2026-10-19):
+#   - Audit des destinations : `POST /api/sync_tasks/verify/<config_name>` lance `sync_engine.py
+#     --verify-only` (débit limité par l'option `verify_rate_mb`, 0 : illimité) comme une tâche de la
+#     configuration ; `GET /api/verify_reports/<config_name>` retourne le dernier rapport JSON
+#     (fichiers corrompus, manquants ou illisibles).
+#
+# Version 3.46 (2026-10-19):
+#   - Option `verify_copies` ("off", "hash", "reread") transmise à `sync_engine.py` : empreinte des
+#     copies enregistrée dans le manifeste, et relecture de vérification.
+#
+# Version 3.45 (2026-10-19):
+#   - Option `scan_cache_seconds` (cache de parcours partagé entre configurations, 0 pour le
+#     désactiver) transmise à `sync_engine.py`.
+#
+# Version 3.44 (2026-10-19):
+#   - Option `extra_destinations` (liste de chemins) : chaque entrée est transmise à `sync_engine.py`
+#     par `--extra-destination` ; la source n'est lue qu'une fois pour toutes les destinations.
+#     Validation du type de l'option dans `update_config`.
+#
+# Version 3.43 (2026-10-19):
+#   - Option `hash_cache_entries` (taille du cache persistant des empreintes, 0 pour le désactiver)
+#     transmise à `sync_engine.py`.
+#
+# Version 3.42 (2026-10-19):
+#   - Option `dedupe` ("off", "hardlink", "reflink") transmise à `sync_engine.py`.
+#
+# Version 3.41 (2026-10-19):
+#   - Option `snapshot_mode` : transmet --snapshot-mode à `sync_engine.py` (instantanés datés liés
+#     physiquement). `--max-cached-versions` est désormais reconnu par le moteur (rétention).
+#
+# Version 3.40 (2026-10-19):
+#   - Options `version_store` ("copy" ou "chunks") et `chunk_repository` (dépôt de blocs partagé)
+#     transmises à `sync_engine.py`.
+#
+# Version 3.39 (2026-10-19):
+#   - Options `version_compression` ("none", "gzip", "lzma", "zlib") et `compression_level` (-1 : défaut)
+#     transmises à `sync_engine.py`.
+#
+# Version 3.38 (2026-10-19):
+#   - Options `durability` ("none", "fsync", "batch" par défaut), `sync_batch_mb` et
+#     `sync_batch_seconds` transmises à `sync_engine.py`.
+#
+# Version 3.37 (2026-10-19):
+#   - Options `segment_workers` (0 : auto) et `segment_threshold_mb` (1024) : copie segmentée
+#     parallèle des gros fichiers, transmises à `sync_engine.py`.
+#
+# Version 3.36 (2026-10-19):
+#   - Option `low_cache_footprint` : transmet --low-cache à `sync_engine.py`.
+#
+# Version 3.35 (2026-10-19):
+#   - Les options d'E/S (`scan_workers`, `copy_workers`, `buffer_size`, `read_order`) valent par défaut
+#     « auto » : le moteur les choisit selon les périphériques source et destination.
+#
+# Version 3.34 (2026-10-19):
+#   - Transmission de l'option `copy_workers` (threads de copie du pipeline) à `sync_engine.py`.
+#
+# Version 3.33 (2026-10-19):
+#   - Transmission de l'option `scan_workers` (threads de parcours de la source) à `sync_engine.py`.
+#
+# Version 3.32 (2026-10-19):
+#   - Options du moteur par configuration : `trust_dir_mtime` et `deep_scan_days` sont transmises
+#     à `sync_engine.py` (parcours incrémental fondé sur les mtimes des répertoires).
+#   - `update_config` fusionne les données reçues avec la configuration existante, afin que les options
+#     du moteur absentes du formulaire du frontend ne soient pas perdues à chaque sauvegarde.
+#
 # Version 3.31 (Révision 4 - 2025-05-21):
 #   - Assure que tous les messages de log du backend sont en anglais pour une meilleure cohérence
 #     des journaux techniques.
@@ -108,6 +203,7 @@ from flask import Flask, request, jsonify, Blueprint
 from flask_cors import CORS
 import json
 import logging
+import signal
 import subprocess
 from pathlib import Path
 import os
@@ -122,6 +218,17 @@ CONFIGS_DIR = APP_DIR / "configs"
 LOGS_DIR = APP_DIR / "logs"
 APP_LOG_FILE = LOGS_DIR / "backend_app.log" # Renamed to clarify it's the backend log
 TASK_LOG_DIR = LOGS_DIR / "tasks"
+STATE_DIR = APP_DIR / "state" # Engine state, including audit reports
+
+# Exit code of sync_engine.py when the run finished but some files could not be synchronized
+EXIT_COMPLETED_WITH_ERRORS = 2
+FINISHED_STATUSES = ["completed", "completed_with_errors", "stopped", "error"]
+ACTIVE_STATUSES = ["running", "paused", "stopping"]
+# Delay after which a task asked to stop is killed (the script stops by itself within 30 s)
+STOP_KILL_SECONDS = 60
+# Signals handled by the script's control thread (stop, pause, resume). The script is started with
+# them blocked so that one sent while it is still starting is queued instead of killing it.
+CONTROL_SIGNALS = {signal.SIGTERM, signal.SIGUSR1, signal.SIGUSR2} if hasattr(signal, "pthread_sigmask") else set()
 
 # Ensure directories exist
 for d in [APP_DIR, CONFIGS_DIR, LOGS_DIR, TASK_LOG_DIR]:
@@ -141,11 +248,13 @@ api_bp = Blueprint('api', __name__)
 
 # --- Class to represent a synchronization task ---
 class SyncTask:
-    def __init__(self, config_name, config_data):
+    def __init__(self, config_name, config_data, verify_only=False):
         self.config_name = config_name
         self.config_data = config_data
-        self.status = "idle"  # idle, running, completed, stopped, error
+        self.verify_only = verify_only # Audit of the destinations instead of a synchronization
+        self.status = "idle"  # idle, running, paused, stopping, completed, completed_with_errors, stopped, error
         self.process = None   # Subprocess
+        self.stop_requested_at = None # When stop() sent SIGTERM
         self.start_time = None
         self.end_time = None
         self.progress = 0     # Progress in percentage
@@ -187,14 +296,53 @@ class SyncTask:
                 "--blacklist-dirs", blacklist_dirs_str,
                 "--log-file", str(self.log_file_path), # Pass log path to script
                 "--config-name", self.config_name, # Pass config name for script's internal logging
-                "--max-cached-versions", str(self.config_data.get('max_cached_versions', 2)) # Pass new parameter
+                "--max-cached-versions", str(self.config_data.get('max_cached_versions', 2)), # Pass new parameter
+                "--deep-scan-days", str(self.config_data.get('deep_scan_days', 7)),
+                "--scan-workers", str(self.config_data.get('scan_workers', 0)),
+                "--copy-workers", str(self.config_data.get('copy_workers', 0)),
+                "--buffer-size", str(self.config_data.get('buffer_size', 0)),
+                "--read-order", str(self.config_data.get('read_order', 'auto')),
+                "--segment-workers", str(self.config_data.get('segment_workers', 0)),
+                "--segment-threshold-mb", str(self.config_data.get('segment_threshold_mb', 1024)),
+                "--durability", str(self.config_data.get('durability', 'batch')),
+                "--sync-batch-mb", str(self.config_data.get('sync_batch_mb', 256)),
+                "--sync-batch-seconds", str(self.config_data.get('sync_batch_seconds', 30)),
+                "--version-compression", str(self.config_data.get('version_compression', 'none')),
+                "--compression-level", str(self.config_data.get('compression_level', -1)),
+                "--version-store", str(self.config_data.get('version_store', 'copy')),
+                "--dedupe", str(self.config_data.get('dedupe', 'off')),
+                "--hash-cache-entries", str(self.config_data.get('hash_cache_entries', 500000)),
+                "--scan-cache-seconds", str(self.config_data.get('scan_cache_seconds', 0)),
+                "--verify-copies", str(self.config_data.get('verify_copies', 'off')),
+                "--spot-check-days", str(self.config_data.get('spot_check_days', 0)),
+                "--spot-check-mb", str(self.config_data.get('spot_check_mb', 1024)),
+                "--spot-check-sampling", str(self.config_data.get('spot_check_sampling', 'stratified')),
+                "--space-margin-mb", str(self.config_data.get('space_margin_mb', 16))
             ]
+            for extra_destination in self.config_data.get('extra_destinations', []):
+                cmd.extend(["--extra-destination", str(extra_destination)])
+            if self.config_data.get('chunk_repository'):
+                cmd.extend(["--chunk-repository", str(self.config_data['chunk_repository'])])
+            if self.config_data.get('trust_dir_mtime'):
+                cmd.append("--trust-dir-mtime")
+            if self.config_data.get('low_cache_footprint'):
+                cmd.append("--low-cache")
+            if self.config_data.get('snapshot_mode'):
+                cmd.append("--snapshot-mode")
+            if self.verify_only:
+                cmd.extend(["--verify-only", "--verify-rate-mb", str(self.config_data.get('verify_rate_mb', 0))])
             
             # Open log file in write mode for the script
             # Use Popen with PIPE for stderr to capture script startup errors
             # and redirect stdout to the log file.
-            with open(self.log_file_path, 'w', encoding='utf-8') as f_log:
-                self.process = subprocess.Popen(cmd, stdout=f_log, stderr=subprocess.PIPE, text=True, bufsize=1)
+            # The child inherits the signal mask of this thread: block the control signals around the spawn.
+            previous_mask = signal.pthread_sigmask(signal.SIG_BLOCK, CONTROL_SIGNALS) if CONTROL_SIGNALS else None
+            try:
+                with open(self.log_file_path, 'w', encoding='utf-8') as f_log:
+                    self.process = subprocess.Popen(cmd, stdout=f_log, stderr=subprocess.PIPE, text=True, bufsize=1)
+            finally:
+                if previous_mask is not None:
+                    signal.pthread_sigmask(signal.SIG_SETMASK, previous_mask)
             
             # Check if the process started correctly
             time.sleep(0.1) # Give the process a very short time to start or fail
@@ -223,31 +371,55 @@ class SyncTask:
             return False
 
     def stop(self):
+        """
+        Asks the sync script to stop (SIGTERM) and returns immediately. The script finishes the files
+        being copied, writes its summary and exits on its own; update_status_from_log() then marks
+        the task "stopped". A script still running STOP_KILL_SECONDS later is killed.
+        """
         if self.process and self.process.poll() is None: # If process is still running
             try:
-                # Send termination signal to process (SIGTERM)
-                # This allows the script to shut down cleanly if it handles this signal
-                self.process.terminate() 
-                # Wait a short time for the process to terminate
-                self.process.wait(timeout=5) 
-                if self.process.poll() is not None:
-                    self.status = "stopped"
-                    logger.info(f"Task '{self.config_name}' (PID: {self.process.pid}) stopped.")
-                else:
-                    # If the process did not terminate after terminate, kill it
-                    self.process.kill()
-                    self.status = "stopped" # or "killed" if you want to distinguish
-                    logger.warning(f"Task '{self.config_name}' (PID: {self.process.pid}) killed after terminate failed.")
+                self.process.terminate()
+                self.status = "stopping"
+                self.stop_requested_at = datetime.datetime.now()
+                logger.info(f"Stop requested for task '{self.config_name}' (PID: {self.process.pid}).")
             except Exception as e:
                 logger.error(f"Error stopping task '{self.config_name}': {e}")
                 self.status = "error"
-            finally:
                 self.end_time = datetime.datetime.now()
-        elif self.status == "running": # If trying to stop a task already stopped but not cleaned up
+        elif self.status in ACTIVE_STATUSES: # If trying to stop a task already stopped but not cleaned up
              self.status = "stopped"
              self.end_time = datetime.datetime.now()
              logger.info(f"Task '{self.config_name}' already completed or stopped.")
 
+    def pause(self):
+        """
+        Pauses the sync script (SIGUSR1): it stops reading and writing once the files being copied are
+        done, and keeps its scan and copy plan in memory.
+
+        Returns:
+            bool: True if the task is now paused.
+        """
+        if not hasattr(signal, "SIGUSR1") or self.status != "running" or self.process.poll() is not None:
+            return False
+        self.process.send_signal(signal.SIGUSR1)
+        self.status = "paused"
+        logger.info(f"Task '{self.config_name}' (PID: {self.process.pid}) paused.")
+        return True
+
+    def resume(self):
+        """
+        Resumes a paused sync script (SIGUSR2), without rescanning the source.
+
+        Returns:
+            bool: True if the task is running again.
+        """
+        if self.status != "paused" or self.process.poll() is not None:
+            return False
+        self.process.send_signal(signal.SIGUSR2)
+        self.status = "running"
+        logger.info(f"Task '{self.config_name}' (PID: {self.process.pid}) resumed.")
+        return True
+
     def update_status_from_log(self):
         """
         Parses the task log file to update its status,
@@ -342,23 +514,30 @@ class SyncTask:
                     if match: self.files_deleted = int(match.group(1))
             
             # Check process status if running
-            if self.status == "running":
+            if self.status in ACTIVE_STATUSES:
                 poll_result = self.process.poll()
                 if poll_result is not None:
                     # Process terminated
                     self.end_time = datetime.datetime.now()
-                    if poll_result == 0:
+                    if self.status == "stopping":
+                        self.status = "stopped"
+                        logger.info(f"Task '{self.config_name}' stopped (code: {poll_result}).")
+                    elif poll_result == 0:
                         self.status = "completed"
                         self.progress = 100 # Ensure bar is 100% at the end
                         logger.info(f"Task '{self.config_name}' completed successfully.")
+                    elif poll_result == EXIT_COMPLETED_WITH_ERRORS:
+                        self.status = "completed_with_errors"
+                        self.progress = 100
+                        logger.warning(f"Task '{self.config_name}' completed with errors (see its error report).")
                     else:
                         self.status = "error"
                         logger.error(f"Task '{self.config_name}' terminated with an error (code: {poll_result}).")
-                # If script finishes very quickly, progress may remain at 0.
-                # If task is running and progress is 100, set to completed.
-                elif self.progress == 100:
-                    self.status = "completed" # Script indicated 100% progress, so it's likely finished.
-                    self.end_time = datetime.datetime.now()
+                elif self.status == "stopping" and \
+                        (datetime.datetime.now() - self.stop_requested_at).total_seconds() > STOP_KILL_SECONDS:
+                    self.process.kill() # The script did not stop by itself; reaped at the next update
+                    logger.warning(f"Task '{self.config_name}' (PID: {self.process.pid}) killed: not stopped "
+                                   f"{STOP_KILL_SECONDS} s after the stop request.")
 
         except Exception as e:
             logger.error(f"Error reading/updating log for task '{self.config_name}': {e}", exc_info=True)
@@ -444,8 +623,8 @@ class TaskManager:
         
         # Clean up "completed", "stopped", or "error" tasks if they have been around for a long time
         # To prevent the list from growing indefinitely. Keep the last 5 completed ones, for example.
-        finished_tasks = {name: task for name, task in self.tasks.items() if task.status in ["completed", "stopped", "error"]}
-        running_tasks = {name: task for name, task in self.tasks.items() if task.status == "running"}
+        finished_tasks = {name: task for name, task in self.tasks.items() if task.status in FINISHED_STATUSES}
+        running_tasks = {name: task for name, task in self.tasks.items() if task.status in ACTIVE_STATUSES}
 
         # Keep only the last X finished tasks (here, 5) + all running tasks
         if len(finished_tasks) > 5:
@@ -455,7 +634,7 @@ class TaskManager:
             self.tasks.update(running_tasks)
         else:
             # If less than 5 finished tasks, keep all of them
-            self.tasks = {name: task for name, task in self.tasks.items() if task.status not in ["completed", "stopped", "error"] or task in finished_tasks.values()}
+            self.tasks = {name: task for name, task in self.tasks.items() if task.status not in FINISHED_STATUSES or task in finished_tasks.values()}
             self.tasks.update(finished_tasks) # Ensure all finished tasks are included if < 5
             self.tasks.update(running_tasks) # Ensure all running tasks are included
 
@@ -497,6 +676,11 @@ def update_config(config_name):
                 logger.error(f"Missing field '{field}' in configuration.")
                 return jsonify({"error": f"Missing field '{field}'."}), 400
 
+        extra_destinations = config_data.get('extra_destinations', [])
+        if not isinstance(extra_destinations, list) or not all(isinstance(d, str) for d in extra_destinations):
+            logger.error("Invalid 'extra_destinations' in configuration.")
+            return jsonify({"error": "Field 'extra_destinations' must be a list of paths."}), 400
+
         # Ensure paths are absolute and valid (backend side)
         source_path = Path(config_data['source'])
         destination_path = Path(config_data['destination'])
@@ -507,6 +691,13 @@ def update_config(config_name):
         # Destination may not exist, sync script will create it
 
         config_path = CONFIGS_DIR / f"{config_name}.json"
+        # Keep engine options that the frontend form does not send (e.g. 'trust_dir_mtime')
+        if config_path.exists():
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    config_data = {**json.load(f), **config_data}
+            except json.JSONDecodeError:
+                logger.warning(f"Existing configuration '{config_name}' is not valid JSON, overwriting it.")
         with open(config_path, 'w', encoding='utf-8') as f:
             json.dump(config_data, f, indent=4, ensure_ascii=False)
         
@@ -534,7 +725,7 @@ def start_sync_task(config_name):
         with open(config_path, 'r', encoding='utf-8') as f:
             config_data = json.load(f)
 
-        if config_name in tasks_manager.tasks and tasks_manager.tasks[config_name].status == "running":
+        if config_name in tasks_manager.tasks and tasks_manager.tasks[config_name].status in ACTIVE_STATUSES:
             logger.info(f"Task '{config_name}' is already running.")
             return jsonify({"message": f"Task '{config_name}' is already running."}), 200
 
@@ -548,6 +739,65 @@ def start_sync_task(config_name):
         logger.error(f"Error starting task '{config_name}': {e}", exc_info=True)
         return jsonify({"error": f"Internal server error: {e}"}), 500
 
+@api_bp.route('/api/sync_tasks/verify/<config_name>', methods=['POST'])
+def start_verify_task(config_name):
+    """
+    Starts an audit of the destinations of the given configuration against their recorded digests.
+    The source is not read.
+    """
+    config_path = CONFIGS_DIR / f"{config_name}.json"
+    if not config_path.exists():
+        logger.warning(f"Attempt to start audit without configuration found: {config_name}")
+        return jsonify({"error": f"Configuration '{config_name}' not found."}), 404
+
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config_data = json.load(f)
+
+        if config_name in tasks_manager.tasks and tasks_manager.tasks[config_name].status in ACTIVE_STATUSES:
+            logger.info(f"Task '{config_name}' is already running.")
+            return jsonify({"message": f"Task '{config_name}' is already running."}), 200
+
+        task = SyncTask(config_name, config_data, verify_only=True)
+        if task.start():
+            tasks_manager.add_task(task)
+            return jsonify({"message": f"Audit of '{config_name}' started successfully.", "pid": task.process.pid}), 202
+        else:
+            return jsonify({"error": f"Failed to start audit of '{config_name}'."}), 500
+    except Exception as e:
+        logger.error(f"Error starting audit of '{config_name}': {e}", exc_info=True)
+        return jsonify({"error": f"Internal server error: {e}"}), 500
+
+@api_bp.route('/api/verify_reports/<config_name>', methods=['GET'])
+def get_verify_report(config_name):
+    """
+    Returns the report of the last audit of the given configuration.
+    """
+    report_path = STATE_DIR / f"{config_name}.audit.json"
+    if not report_path.exists():
+        return jsonify({"error": f"No audit report for '{config_name}'."}), 404
+    try:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            return jsonify(json.load(f)), 200
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Error reading audit report of '{config_name}': {e}")
+        return jsonify({"error": f"Audit report of '{config_name}' is unreadable."}), 500
+
+@api_bp.route('/api/error_reports/<config_name>', methods=['GET'])
+def get_error_report(config_name):
+    """
+    Returns the files that could not be synchronized during the last run of the given configuration.
+    """
+    report_path = STATE_DIR / f"{config_name}.errors.json"
+    if not report_path.exists():
+        return jsonify({"error": f"No error report for '{config_name}'."}), 404
+    try:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            return jsonify(json.load(f)), 200
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Error reading error report of '{config_name}': {e}")
+        return jsonify({"error": f"Error report of '{config_name}' is unreadable."}), 500
+
 @api_bp.route('/api/sync_tasks/stop/<config_name>', methods=['POST'])
 def stop_sync_task(config_name):
     """
@@ -558,12 +808,49 @@ def stop_sync_task(config_name):
         logger.warning(f"Attempt to stop a non-existent task: {config_name}")
         return jsonify({"error": f"Task '{config_name}' not found or already completed."}), 404
 
-    if task.status in ["completed", "stopped", "error"]:
+    if task.status in FINISHED_STATUSES:
         logger.info(f"Task '{config_name}' already completed or stopped.")
         return jsonify({"message": f"Task '{config_name}' is already completed or stopped."}), 200
     
-    task.stop()
-    return jsonify({"message": f"Stop signal sent for task '{config_name}'."}), 202
+    if task.status == "stopping":
+        return jsonify({"message": f"Task '{config_name}' is already stopping.", "status": task.status}), 202
+
+    task.stop() # Does not wait for the script: the task is "stopping" until it exits
+    return jsonify({"message": f"Stop requested for task '{config_name}'; it stops after the files being copied.",
+                    "status": task.status}), 202
+
+@api_bp.route('/api/sync_tasks/pause/<config_name>', methods=['POST'])
+def pause_sync_task(config_name):
+    """
+    Pauses a running synchronization task at the next file boundary.
+    """
+    task = tasks_manager.get_task(config_name)
+    if not task:
+        logger.warning(f"Attempt to pause a non-existent task: {config_name}")
+        return jsonify({"error": f"Task '{config_name}' not found or already completed."}), 404
+
+    if task.status == "paused":
+        return jsonify({"message": f"Task '{config_name}' is already paused.", "status": task.status}), 200
+    if not task.pause():
+        return jsonify({"error": f"Task '{config_name}' cannot be paused (status: {task.status})."}), 409
+    return jsonify({"message": f"Task '{config_name}' paused; it stops after the files being copied.",
+                    "status": task.status}), 200
+
+@api_bp.route('/api/sync_tasks/resume/<config_name>', methods=['POST'])
+def resume_sync_task(config_name):
+    """
+    Resumes a paused synchronization task where it stopped.
+    """
+    task = tasks_manager.get_task(config_name)
+    if not task:
+        logger.warning(f"Attempt to resume a non-existent task: {config_name}")
+        return jsonify({"error": f"Task '{config_name}' not found or already completed."}), 404
+
+    if task.status == "running":
+        return jsonify({"message": f"Task '{config_name}' is already running.", "status": task.status}), 200
+    if not task.resume():
+        return jsonify({"error": f"Task '{config_name}' cannot be resumed (status: {task.status})."}), 409
+    return jsonify({"message": f"Task '{config_name}' resumed.", "status": task.status}), 200
 
 @api_bp.route('/api/sync_tasks', methods=['GET'])
 def get_sync_tasks_status():
@@ -575,6 +862,7 @@ def get_sync_tasks_status():
         task_info = {
             "config_name": task.config_name,
             "status": task.status,
+            "verify_only": task.verify_only,
             "progress": task.progress,
             "pid": task.process.pid if task.process else None,
             "duration": int(task.get_duration()), # Ensure this method exists and returns duration in seconds
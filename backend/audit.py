@@ -0,0 +1,264 @@
+# Fichier : audit.py
+# Description : Audit d'une destination à partir des empreintes enregistrées dans son manifeste :
+#               chaque fichier est relu depuis le support et comparé, sans accéder à la source.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - RateLimiter : limitation du débit de lecture (seau à jetons partagé par les threads).
+#    - DestinationAudit : vérification parallèle (pool de threads) des fichiers d'un manifeste, par lots
+#      dans l'ordre des chemins ; la progression (dernier chemin d'un lot terminé, anomalies déjà
+#      relevées) est enregistrée après chaque lot pour reprendre un audit interrompu. Rapport : fichiers
+#      corrompus, manquants, illisibles, et fichiers sans empreinte enregistrée.
+#
+# Version 1.1 (2026-10-19)
+#    - Contrôle par échantillonnage : spot_check_sample choisit, parmi les fichiers ayant une empreinte,
+#      les moins récemment vérifiés (jamais vérifiés d'abord), au hasard ou par strates (alternance entre
+#      répertoires de premier niveau) à égalité d'ancienneté, en nombre suffisant pour que chaque fichier
+#      soit vérifié dans la période demandée, et dans la limite d'un volume de lecture par exécution.
+#    - DestinationAudit : paramètre 'paths' (vérification d'une partie du manifeste) ; sans fichier de
+#      progression, l'audit n'est pas repris.
+#
+# Version 1.2 (2026-10-19)
+#    - DestinationAudit : paramètre 'checkpoint', appelé avant la lecture de chaque fichier (pause de
+#      la synchronisation ou de l'audit ; une exception interrompt l'audit, repris au dernier lot).
+#
+############################################################################################################
+
+import bisect
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from verification import DEFAULT_BUFFER_SIZE, read_digest
+
+# Nombre de fichiers vérifiés entre deux enregistrements de la progression
+AUDIT_BATCH_SIZE = 1000
+
+# Contrôle par échantillonnage : tirage au hasard, ou réparti entre les répertoires de premier niveau
+SAMPLING_MODES = ("random", "stratified")
+
+
+class RateLimiter:
+    """
+    Seau à jetons : limite le nombre d'octets lus par seconde, tous threads confondus.
+    """
+    def __init__(self, bytes_per_second):
+        """
+        Args:
+            bytes_per_second (int): Débit maximal (0 : pas de limite).
+        """
+        self.rate = bytes_per_second
+        self._allowance = float(bytes_per_second)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, size):
+        """Attend, si nécessaire, que 'size' octets puissent être lus sans dépasser le débit."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(float(self.rate), self._allowance + (now - self._last) * self.rate)
+            self._last = now
+            self._allowance -= size
+            delay = -self._allowance / self.rate if self._allowance < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+
+def spot_check_sample(sizes, coverage, now, period_seconds, runs_per_period, budget_bytes, sampling="stratified",
+                      rng=None):
+    """
+    Choisit les fichiers à vérifier lors d'une exécution du contrôle par échantillonnage.
+
+    Les fichiers sont pris du moins récemment vérifié au plus récent (jamais vérifiés d'abord) ; tous
+    ceux dont la dernière vérification date de plus de 'period_seconds' sont retenus, et au moins
+    1/runs_per_period des fichiers à chaque exécution, pour que la rotation couvre l'arborescence dans
+    la période sans relire toute la destination lors de la première exécution.
+
+    Args:
+        sizes (dict): Taille de chaque fichier vérifiable, par chemin relatif.
+        coverage (dict): Date (epoch) de la dernière vérification réussie, par chemin relatif.
+        now (int): Date de l'exécution.
+        period_seconds (int): Délai maximal entre deux vérifications d'un même fichier.
+        runs_per_period (float): Nombre d'exécutions attendues pendant la période.
+        budget_bytes (int): Volume maximal lu par exécution (0 : illimité).
+        sampling (str): "random" ou "stratified" (départage des fichiers de même ancienneté).
+        rng (random.Random): Générateur aléatoire.
+
+    Returns:
+        tuple: (chemins retenus, nombre de fichiers échus non retenus faute de budget).
+    """
+    rng = rng or random.Random()
+    candidates = list(sizes)
+    rng.shuffle(candidates)
+    rank = {}
+    if sampling == "stratified":
+        taken = defaultdict(int)
+        for rel_path in candidates:
+            stratum = rel_path.split("/", 1)[0] if "/" in rel_path else ""
+            rank[rel_path] = taken[stratum]
+            taken[stratum] += 1
+    candidates.sort(key=lambda rel_path: (coverage.get(rel_path, 0), rank.get(rel_path, 0)))
+
+    quota = math.ceil(len(candidates) / max(runs_per_period, 1))
+    selected, used, overdue_skipped = [], 0, 0
+    for rel_path in candidates:
+        overdue = rel_path in coverage and now - coverage[rel_path] >= period_seconds
+        if len(selected) >= quota and not overdue:
+            break
+        if budget_bytes and used + sizes[rel_path] > budget_bytes:
+            overdue_skipped += overdue
+            continue
+        selected.append(rel_path)
+        used += sizes[rel_path]
+    return selected, overdue_skipped
+
+
+class DestinationAudit:
+    """
+    Vérifie les fichiers d'une destination d'après les empreintes de son manifeste.
+    """
+    def __init__(self, root, manifest, progress_file, state_stamp, workers, buffer_size=DEFAULT_BUFFER_SIZE,
+                 limiter=None, logger=None, paths=None, checkpoint=None):
+        """
+        Args:
+            root (Path): Répertoire contenant les fichiers du manifeste (miroir ou instantané publié).
+            manifest (Manifest): Manifeste de la dernière synchronisation, avec ses empreintes.
+            progress_file (Path): Fichier de progression (reprise d'un audit interrompu).
+            state_stamp (int): Identifiant de l'état audité (mtime_ns du fichier d'état) : une
+                               progression enregistrée pour un autre état est ignorée.
+            workers (int): Nombre de threads de vérification.
+            buffer_size (int): Taille des lectures.
+            limiter (RateLimiter): Limitation du débit de lecture.
+            logger (logging.Logger): Journal.
+            paths (list): Chemins à vérifier (par défaut : tout le manifeste).
+            checkpoint (callable): Appelé avant chaque fichier : attend pendant une pause, ou lève une
+                                   exception pour interrompre l'audit.
+        """
+        self.root = root
+        self.manifest = manifest
+        self.progress_file = progress_file
+        self.state_stamp = state_stamp
+        self.workers = max(1, workers)
+        self.buffer_size = buffer_size
+        self.limiter = limiter
+        self.logger = logger
+        self.paths = sorted(paths) if paths is not None else manifest.paths
+        self.checkpoint = checkpoint
+
+    def _load_progress(self):
+        """Progression d'un audit interrompu du même état, ou None."""
+        if self.progress_file is None:
+            return None
+        try:
+            with open(self.progress_file, 'r', encoding='utf-8') as f:
+                progress = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if progress.get("state_stamp") != self.state_stamp:
+            return None
+        return progress
+
+    def _save_progress(self, progress):
+        if self.progress_file is None:
+            return
+        tmp_path = self.progress_file.with_name(self.progress_file.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(progress, f)
+        os.replace(tmp_path, self.progress_file)
+
+    def _check(self, rel_path):
+        """
+        Vérifie un fichier.
+
+        Returns:
+            tuple: (résultat, détail) ; résultat "ok", "corrupt", "missing", "unverifiable" ou "error".
+        """
+        if self.checkpoint is not None:
+            self.checkpoint()
+        path = self.root / rel_path
+        expected = self.manifest.digests.get(rel_path)
+        try:
+            if expected is None:
+                os.stat(path)
+                return "unverifiable", None
+            throttle = self.limiter.consume if self.limiter is not None else None
+            actual = read_digest(path, self.buffer_size, throttle).hex()
+        except FileNotFoundError:
+            return "missing", None
+        except OSError as e:
+            return "error", str(e)
+        if actual != expected:
+            return "corrupt", actual
+        return "ok", os.stat(path).st_size
+
+    def run(self):
+        """
+        Vérifie les fichiers du manifeste (en reprenant, s'il y a lieu, un audit interrompu).
+
+        Returns:
+            dict: Rapport de l'audit (compatible JSON).
+        """
+        progress = self._load_progress()
+        resumed = progress is not None
+        if progress is None:
+            progress = {"state_stamp": self.state_stamp, "cursor": None, "started": time.time(), "checked": 0,
+                        "verified": 0, "bytes": 0, "seconds": 0.0, "unverifiable": 0, "corrupt": [],
+                        "missing": [], "errors": []}
+        else:
+            self.logger.info(f"Reprise de l'audit interrompu après « {progress['cursor']} » "
+                             f"({progress['checked']} fichier(s) déjà vérifié(s)).")
+        paths = self.paths
+        start = bisect.bisect_right(paths, progress["cursor"]) if progress["cursor"] is not None else 0
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="audit") as executor:
+            for offset in range(start, len(paths), AUDIT_BATCH_SIZE):
+                batch = paths[offset:offset + AUDIT_BATCH_SIZE]
+                batch_start = time.perf_counter()
+                for rel_path, (result, detail) in zip(batch, executor.map(self._check, batch)):
+                    if result == "ok":
+                        progress["verified"] += 1
+                        progress["bytes"] += detail
+                    elif result == "corrupt":
+                        self.logger.error(f"Fichier corrompu : {self.root / rel_path}")
+                        progress["corrupt"].append({"path": rel_path, "expected": self.manifest.digests[rel_path],
+                                                    "actual": detail})
+                    elif result == "missing":
+                        self.logger.error(f"Fichier manquant : {self.root / rel_path}")
+                        progress["missing"].append(rel_path)
+                    elif result == "error":
+                        self.logger.error(f"Fichier illisible : {self.root / rel_path} ({detail})")
+                        progress["errors"].append({"path": rel_path, "error": detail})
+                    else:
+                        progress["unverifiable"] += 1
+                progress["checked"] += len(batch)
+                progress["seconds"] += time.perf_counter() - batch_start
+                progress["cursor"] = batch[-1]
+                self._save_progress(progress)
+                self.logger.info(f"Audit : {progress['checked']}/{len(paths)} fichier(s) vérifié(s).")
+
+        if self.progress_file is not None:
+            self.progress_file.unlink(missing_ok=True)
+        seconds = progress["seconds"]
+        return {
+            "root": str(self.root),
+            "files": len(paths),
+            "checked": progress["checked"],
+            "verified": progress["verified"],
+            "unverifiable": progress["unverifiable"],
+            "bytes": progress["bytes"],
+            "seconds": round(seconds, 3),
+            "throughput_mib_s": round(progress["bytes"] / seconds / (1024 * 1024), 1) if seconds else 0.0,
+            "resumed": resumed,
+            "corrupt": progress["corrupt"],
+            "missing": progress["missing"],
+            "errors": progress["errors"],
+        }
@@ -0,0 +1,98 @@
+# Fichier : capacity.py
+# Description : Contrôle de l'espace libre de la destination avant l'écriture des fichiers
+#               (copies et versions sauvegardées dans le cache).
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - SpaceBudget : espace disponible mesuré par os.statvfs au début de la synchronisation, diminué
+#      d'une marge de sécurité ; chaque fichier planifié y est imputé (arrondi aux blocs du système de
+#      fichiers) avant d'être écrit, et une InsufficientSpaceError est levée dès que le plan dépasse
+#      l'espace disponible, au lieu d'un ENOSPC au milieu d'une copie.
+#
+# Version 1.1 (2026-10-19)
+#    - Marge de sécurité fixe et configurable (paramètre 'margin', 16 Mio par défaut) au lieu de
+#      max(64 Mio, 1 % du système de fichiers). Suppression de check_free : une destination presque
+#      pleine faisait échouer toute synchronisation, même sans rien à écrire ; seul un plan qui dépasse
+#      l'espace libre diminué de la marge est refusé.
+#
+############################################################################################################
+
+import errno
+import os
+
+# Marge laissée libre par défaut sur la destination (métadonnées, répertoires, fichier d'état)
+DEFAULT_SPACE_MARGIN = 16 * 1024 * 1024
+
+
+class InsufficientSpaceError(OSError):
+    """Levée lorsque les écritures planifiées dépassent l'espace libre de la destination."""
+
+    def __init__(self, message):
+        super().__init__(errno.ENOSPC, message)
+
+    def __str__(self):
+        return self.strerror
+
+
+def _format_bytes(size):
+    """Taille lisible (Kio, Mio, Gio...)."""
+    for unit in ("o", "Kio", "Mio", "Gio", "Tio"):
+        if abs(size) < 1024 or unit == "Tio":
+            return f"{size:.1f} {unit}" if unit != "o" else f"{size} o"
+        size /= 1024
+
+
+class SpaceBudget:
+    """
+    Espace libre de la destination, consommé au fur et à mesure que les écritures sont planifiées.
+    """
+    def __init__(self, path, margin=DEFAULT_SPACE_MARGIN):
+        """
+        Mesure l'espace libre du système de fichiers portant 'path'.
+
+        Args:
+            path (str | Path): Répertoire de destination (existant).
+            margin (int): Octets laissés libres par les écritures planifiées.
+        """
+        stats = os.statvfs(path)
+        self.path = path
+        self.block_size = stats.f_frsize or stats.f_bsize or 4096
+        self.free = stats.f_bavail * self.block_size
+        self.margin = margin
+        self.planned = 0
+
+    @property
+    def available(self):
+        """Octets encore disponibles pour les écritures planifiées."""
+        return self.free - self.margin - self.planned
+
+    def allocated_size(self, size):
+        """Taille occupée sur disque par un fichier de 'size' octets (arrondie au bloc supérieur)."""
+        return -(-size // self.block_size) * self.block_size
+
+    def reserve(self, size, description):
+        """
+        Impute au plan l'écriture d'un fichier de 'size' octets.
+
+        Args:
+            size (int): Taille du fichier (copie ou version sauvegardée).
+            description (str): Fichier concerné, pour le message d'erreur.
+
+        Raises:
+            InsufficientSpaceError: Si le plan dépasse l'espace libre ; rien n'a encore été écrit
+                                    pour ce fichier.
+        """
+        needed = self.allocated_size(size)
+        if needed and needed > self.available:  # Un fichier vide n'occupe aucun bloc
+            raise InsufficientSpaceError(
+                f"Espace insuffisant sur la destination {self.path} pour {description} : "
+                f"{_format_bytes(self.planned + needed)} à écrire, {_format_bytes(self.free)} libre(s) "
+                f"(marge de sécurité de {_format_bytes(self.margin)}).")
+        self.planned += needed
+
+    def summary(self):
+        """Résumé du plan pour le journal."""
+        return (f"{_format_bytes(self.planned)} planifié(s) sur {_format_bytes(self.free)} libre(s) "
+                f"(marge {_format_bytes(self.margin)})")
@@ -0,0 +1,563 @@
+# Fichier : chunk_store.py
+# Description : Dépôt de blocs dédupliqués pour les versions précédentes : découpage des fichiers
+#               en blocs définis par leur contenu (hachage glissant), stockage de chaque bloc unique
+#               une seule fois dans des fichiers pack, et description de chaque version par sa liste
+#               de blocs.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - Découpage par hachage polynomial glissant (fenêtre de CHUNK_WINDOW octets) : une frontière est
+#      placée là où les bits de poids fort du hachage sont nuls, entre CHUNK_MIN_SIZE et CHUNK_MAX_SIZE.
+#      Une modification locale ne déplace que les frontières voisines : les autres blocs sont retrouvés.
+#    - Calcul vectorisé des hachages avec numpy (sommes cumulées modulo 2^64), repli en Python pur
+#      donnant exactement les mêmes frontières.
+#    - ChunkStore : packs ajoutés sans verrou (un nom unique par écrivain), index de pack écrit à la
+#      fermeture du pack, index complet {empreinte SHA-256: emplacement} chargé en mémoire. Plusieurs
+#      configurations peuvent partager un même dépôt.
+#    - Recettes de version (fichier JSON <version>.chunks) et restauration avec vérification des empreintes.
+#    - Banc d'essai : python chunk_store.py --bench --size-mb 256
+#
+# Version 1.1 (2026-10-19)
+#    - Ramasse-miettes (collect_garbage) : marquage des blocs cités par les recettes de tous les
+#      répertoires de versions inscrits dans le dépôt (register_root, un fichier par configuration),
+#      puis suppression des packs sans bloc utile et réécriture de ceux dont la part inutile dépasse
+#      REPACK_MIN_DEAD_RATIO. Verrou du dépôt (flock) : partagé pendant une synchronisation, exclusif
+#      pendant le ramasse-miettes, qui est reporté (fichier gc-pending) si le dépôt est en cours d'utilisation.
+#    - Nom de pack complété d'un suffixe aléatoire (deux dépôts ouverts dans le même processus et la même
+#      seconde choisissaient le même nom).
+#
+############################################################################################################
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+
+try:
+    import fcntl  # Verrou du dépôt partagé (POSIX)
+except ImportError:  # pragma: no cover - dépend de la plateforme
+    fcntl = None
+
+try:
+    import numpy as np  # Dépendance optionnelle : accélère le découpage
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+# Découpage : tailles minimale, moyenne (2^CHUNK_AVG_BITS) et maximale d'un bloc
+CHUNK_MIN_SIZE = 256 * 1024
+CHUNK_AVG_BITS = 20
+CHUNK_MAX_SIZE = 4 * 1024 * 1024
+CHUNK_WINDOW = 48
+READ_BLOCK_SIZE = 1024 * 1024
+
+_MASK64 = (1 << 64) - 1
+_PRIME = 0x100000001B3  # Impair : inversible modulo 2^64
+_PRIME_INVERSE = pow(_PRIME, -1, 1 << 64)
+_PRIME_WINDOW = pow(_PRIME, CHUNK_WINDOW, 1 << 64)
+_CUT_SHIFT = 64 - CHUNK_AVG_BITS
+
+# Valeur associée à chaque octet (table fixe : les frontières doivent être stables d'une exécution à l'autre)
+GEAR = [int.from_bytes(hashlib.sha256(b"synchro-chunk-%d" % i).digest()[:8], "little") for i in range(256)]
+
+# Dépôt : taille au-delà de laquelle un pack est fermé, format des entrées d'index
+PACK_MAX_SIZE = 256 * 1024 * 1024
+INDEX_RECORD = struct.Struct("=32sQIIB")  # empreinte, position, taille stockée, taille d'origine, indicateurs
+FLAG_ZLIB = 0x01
+CHUNK_COMPRESSION_LEVEL = 3
+MIN_COMPRESSION_RATIO = 0.95
+RECIPE_SUFFIX = ".chunks"
+RECIPE_FORMAT_VERSION = 1
+
+# Ramasse-miettes : un pack dont cette part (en octets stockés) n'est plus citée par aucune recette est réécrit
+REPACK_MIN_DEAD_RATIO = 0.5
+ROOTS_DIR_NAME = "roots"
+LOCK_FILE_NAME = "lock"
+GC_PENDING_FILE_NAME = "gc-pending"
+
+
+class CollectionSkipped(Exception):
+    """Levée quand le ramasse-miettes ne peut pas s'exécuter sans risque (dépôt utilisé, recettes inaccessibles)."""
+
+
+_np_tables = None
+
+
+def _numpy_tables():
+    """Tables numpy (valeurs des octets, puissances du nombre premier et de son inverse), calculées une fois."""
+    global _np_tables
+    if _np_tables is None:
+        length = READ_BLOCK_SIZE + CHUNK_WINDOW
+        gear = np.array(GEAR, dtype=np.uint64)
+        powers = np.full(length, _PRIME, dtype=np.uint64)
+        powers[0] = 1
+        inverse_powers = np.full(length, _PRIME_INVERSE, dtype=np.uint64)
+        inverse_powers[0] = 1
+        with np.errstate(over="ignore"):
+            powers = np.cumprod(powers, dtype=np.uint64)
+            inverse_powers = np.cumprod(inverse_powers, dtype=np.uint64)
+        _np_tables = (gear, powers, inverse_powers)
+    return _np_tables
+
+
+def _cut_candidates_numpy(tail, block):
+    """
+    Positions (dans 'block') où le hachage de la fenêtre se terminant sur l'octet est un point de coupure.
+
+    Args:
+        tail (list): Valeurs des CHUNK_WINDOW octets précédant le bloc (0 au début du flux).
+        block (bytes): Données lues.
+
+    Returns:
+        list: Positions candidates, croissantes.
+    """
+    gear, powers, inverse_powers = _numpy_tables()
+    values = np.concatenate((np.array(tail, dtype=np.uint64), gear[np.frombuffer(block, dtype=np.uint8)]))
+    n = len(values)
+    with np.errstate(over="ignore"):
+        # h_i = somme_{j=i-w+1..i} v_j * P^(i-j) = P^i * (C_i - C_(i-w)), avec C les sommes cumulées de v_j * P^-j
+        cumulative = np.cumsum(values * inverse_powers[:n], dtype=np.uint64)
+        hashes = powers[CHUNK_WINDOW:n] * (cumulative[CHUNK_WINDOW:] - cumulative[:n - CHUNK_WINDOW])
+    return np.flatnonzero((hashes >> np.uint64(_CUT_SHIFT)) == 0).tolist()
+
+
+def _cut_candidates_python(tail, block, state):
+    """
+    Équivalent en Python pur de _cut_candidates_numpy ; 'state' conserve le hachage courant.
+    """
+    values = tail + [GEAR[byte] for byte in block]
+    h = state.get("hash", 0)
+    candidates = []
+    for i in range(len(block)):
+        h = (h * _PRIME + values[i + CHUNK_WINDOW] - values[i] * _PRIME_WINDOW) & _MASK64
+        if not h >> _CUT_SHIFT:
+            candidates.append(i)
+    state["hash"] = h
+    return candidates
+
+
+def iter_chunks(file_object, use_numpy=None):
+    """
+    Découpe un flux en blocs définis par leur contenu.
+
+    Args:
+        file_object: Fichier binaire ouvert en lecture.
+        use_numpy (bool): Force (True) ou interdit (False) le calcul vectorisé (par défaut : si disponible).
+
+    Yields:
+        bytes: Blocs successifs (leur concaténation redonne le flux).
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    tail = [0] * CHUNK_WINDOW
+    python_state = {}
+    pending = bytearray()  # Données du bloc en cours
+    while True:
+        block = file_object.read(READ_BLOCK_SIZE)
+        if not block:
+            break
+        if use_numpy:
+            candidates = _cut_candidates_numpy(tail, block)
+        else:
+            candidates = _cut_candidates_python(tail, block, python_state)
+        tail = (tail + [GEAR[byte] for byte in block[-CHUNK_WINDOW:]])[-CHUNK_WINDOW:]
+
+        start = 0  # Début, dans 'block', des données pas encore ajoutées à 'pending'
+        for position in candidates:
+            end = position + 1
+            while len(pending) + end - start > CHUNK_MAX_SIZE:
+                take = CHUNK_MAX_SIZE - len(pending)
+                pending += block[start:start + take]
+                yield bytes(pending)
+                pending.clear()
+                start += take
+            if len(pending) + end - start < CHUNK_MIN_SIZE:
+                continue
+            pending += block[start:end]
+            yield bytes(pending)
+            pending.clear()
+            start = end
+        while len(pending) + len(block) - start >= CHUNK_MAX_SIZE:
+            take = CHUNK_MAX_SIZE - len(pending)
+            pending += block[start:start + take]
+            yield bytes(pending)
+            pending.clear()
+            start += take
+        pending += block[start:]
+    if pending:
+        yield bytes(pending)
+
+
+class ChunkStore:
+    """
+    Dépôt de blocs dédupliqués, partageable entre configurations.
+
+    Structure du répertoire :
+        packs/<nom>.pack : blocs concaténés (compressés par zlib quand c'est rentable) ;
+        packs/<nom>.idx  : entrées INDEX_RECORD du pack, écrites à sa fermeture (un pack sans index,
+                           laissé par un arrêt brutal, est ignoré) ;
+        roots/<clé>.root : répertoires contenant les recettes qui citent ce dépôt (un par configuration) ;
+        lock             : verrou partagé tant que le dépôt est ouvert, exclusif pour le ramasse-miettes.
+    """
+    def __init__(self, root, fsync=False):
+        """
+        Ouvre (ou crée) le dépôt et charge son index en mémoire.
+
+        Args:
+            root (str | Path): Répertoire du dépôt.
+            fsync (bool): Synchroniser chaque pack et son index à la fermeture.
+        """
+        self.root = os.fspath(root)
+        self.packs_dir = os.path.join(self.root, "packs")
+        os.makedirs(self.packs_dir, exist_ok=True)
+        self.fsync = fsync
+        self.index = {}  # empreinte -> (nom du pack, position, taille stockée, taille d'origine, indicateurs)
+        self.new_chunks = 0
+        self.new_bytes = 0
+        self.stored_bytes = 0
+        self.reused_chunks = 0
+        self.reused_bytes = 0
+        self._lock = threading.Lock()
+        self._pack_name = None
+        self._pack_file = None
+        self._pack_records = []
+        self._pack_counter = 0
+        self._lock_file = None
+        if fcntl is not None:
+            self._lock_file = open(os.path.join(self.root, LOCK_FILE_NAME), 'a')
+            fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+        self._load_index()
+
+    def _load_index(self):
+        self.index = {}
+        for file_name in os.listdir(self.packs_dir):
+            if not file_name.endswith(".idx"):
+                continue
+            pack_name = file_name[:-len(".idx")]
+            with open(os.path.join(self.packs_dir, file_name), 'rb') as f:
+                data = f.read()
+            for offset in range(0, len(data) - INDEX_RECORD.size + 1, INDEX_RECORD.size):
+                digest, position, stored_size, size, flags = INDEX_RECORD.unpack_from(data, offset)
+                self.index.setdefault(digest, (pack_name, position, stored_size, size, flags))
+
+    def _open_pack(self):
+        self._pack_counter += 1
+        # Suffixe aléatoire : deux dépôts ouverts dans le même processus (destinations supplémentaires,
+        # ramasse-miettes) ne doivent pas écrire dans le même pack
+        self._pack_name = f"{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}-{self._pack_counter}-{os.urandom(4).hex()}"
+        self._pack_file = open(os.path.join(self.packs_dir, self._pack_name + ".pack"), 'ab')
+        self._pack_records = []
+
+    def _seal_pack(self):
+        """Ferme le pack courant et écrit son index (fichier temporaire renommé)."""
+        if self._pack_file is None:
+            return
+        self._pack_file.flush()
+        if self.fsync:
+            os.fsync(self._pack_file.fileno())
+        self._pack_file.close()
+        index_path = os.path.join(self.packs_dir, self._pack_name + ".idx")
+        with open(index_path + ".tmp", 'wb') as f:
+            f.write(b"".join(self._pack_records))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(index_path + ".tmp", index_path)
+        self._pack_file = None
+        self._pack_name = None
+
+    def _add_chunk(self, digest, chunk):
+        """Ajoute un bloc absent du dépôt au pack courant (appelé sous verrou)."""
+        compressed = zlib.compress(chunk, CHUNK_COMPRESSION_LEVEL)
+        if len(compressed) < len(chunk) * MIN_COMPRESSION_RATIO:
+            data, flags = compressed, FLAG_ZLIB
+        else:
+            data, flags = chunk, 0
+        if self._pack_file is None:
+            self._open_pack()
+        position = self._pack_file.tell()
+        self._pack_file.write(data)
+        self._pack_records.append(INDEX_RECORD.pack(digest, position, len(data), len(chunk), flags))
+        self.index[digest] = (self._pack_name, position, len(data), len(chunk), flags)
+        self.new_chunks += 1
+        self.new_bytes += len(chunk)
+        self.stored_bytes += len(data)
+        if position + len(data) >= PACK_MAX_SIZE:
+            self._seal_pack()
+
+    def store_file(self, path):
+        """
+        Ajoute au dépôt les blocs d'un fichier qui n'y sont pas encore.
+
+        Args:
+            path (str | Path): Fichier à stocker.
+
+        Returns:
+            list: Empreintes hexadécimales des blocs du fichier, dans l'ordre.
+        """
+        digests = []
+        with open(path, 'rb') as f:
+            for chunk in iter_chunks(f):
+                digest = hashlib.sha256(chunk).digest()
+                digests.append(digest.hex())
+                with self._lock:
+                    if digest in self.index:
+                        self.reused_chunks += 1
+                        self.reused_bytes += len(chunk)
+                    else:
+                        self._add_chunk(digest, chunk)
+        return digests
+
+    def save_version(self, source_path, recipe_path):
+        """
+        Stocke une version dans le dépôt et écrit sa recette (liste de blocs et métadonnées).
+
+        Args:
+            source_path (str | Path): Fichier dont la version est conservée.
+            recipe_path (str | Path): Fichier recette à créer (suffixe RECIPE_SUFFIX).
+        """
+        st = os.stat(source_path)
+        digests = self.store_file(source_path)
+        recipe = {
+            "format": RECIPE_FORMAT_VERSION,
+            "repository": os.path.abspath(self.root),
+            "size": st.st_size,
+            "mode": st.st_mode,
+            "mtime_ns": st.st_mtime_ns,
+            "chunks": digests,
+        }
+        tmp_path = f"{os.fspath(recipe_path)}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(recipe, f)
+        os.replace(tmp_path, recipe_path)
+
+    def read_chunk(self, digest):
+        """
+        Lit un bloc du dépôt et vérifie son empreinte.
+
+        Raises:
+            KeyError: Si le bloc est absent de l'index.
+            ValueError: Si le contenu lu ne correspond pas à l'empreinte.
+        """
+        pack_name, position, stored_size, _, flags = self.index[digest]
+        with open(os.path.join(self.packs_dir, pack_name + ".pack"), 'rb') as f:
+            f.seek(position)
+            data = f.read(stored_size)
+        if flags & FLAG_ZLIB:
+            data = zlib.decompress(data)
+        if hashlib.sha256(data).digest() != digest:
+            raise ValueError(f"Bloc corrompu dans le pack {pack_name} : {digest.hex()}")
+        return data
+
+    def restore(self, recipe, target_path):
+        """
+        Reconstruit une version à partir de sa recette (fichier temporaire renommé).
+
+        Args:
+            recipe (dict): Recette chargée depuis un fichier RECIPE_SUFFIX.
+            target_path (str | Path): Fichier à créer ou remplacer.
+        """
+        with self._lock:
+            self._seal_pack()  # Les blocs du pack courant doivent être lisibles
+        tmp_path = f"{os.fspath(target_path)}.restore-tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                for digest in recipe["chunks"]:
+                    f.write(self.read_chunk(bytes.fromhex(digest)))
+            os.chmod(tmp_path, recipe["mode"] & 0o7777)
+            os.utime(tmp_path, ns=(recipe["mtime_ns"], recipe["mtime_ns"]))
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def close(self):
+        """Ferme le pack courant et libère le verrou du dépôt (à appeler en fin de synchronisation)."""
+        with self._lock:
+            self._seal_pack()
+            if self._lock_file is not None:
+                self._lock_file.close() # Libère le verrou partagé
+                self._lock_file = None
+
+    def register_root(self, recipes_dir):
+        """
+        Inscrit un répertoire de recettes dans le dépôt : le ramasse-miettes conserve les blocs qu'elles citent.
+
+        Args:
+            recipes_dir (str | Path): Répertoire (parcouru récursivement) des recettes d'une configuration.
+        """
+        recipes_dir = os.path.abspath(recipes_dir)
+        roots_dir = os.path.join(self.root, ROOTS_DIR_NAME)
+        os.makedirs(roots_dir, exist_ok=True)
+        root_file = os.path.join(roots_dir, hashlib.sha256(recipes_dir.encode()).hexdigest()[:16] + ".root")
+        if not os.path.exists(root_file):
+            with open(root_file + ".tmp", 'w', encoding='utf-8') as f:
+                f.write(recipes_dir)
+            os.replace(root_file + ".tmp", root_file)
+
+    @property
+    def gc_pending(self):
+        """Un ramasse-miettes a été reporté (dépôt alors utilisé par une autre synchronisation)."""
+        return os.path.exists(os.path.join(self.root, GC_PENDING_FILE_NAME))
+
+    def _registered_roots(self):
+        """Répertoires de recettes inscrits dans le dépôt."""
+        roots_dir = os.path.join(self.root, ROOTS_DIR_NAME)
+        roots = []
+        for file_name in sorted(os.listdir(roots_dir)) if os.path.isdir(roots_dir) else []:
+            if file_name.endswith(".root"):
+                with open(os.path.join(roots_dir, file_name), 'r', encoding='utf-8') as f:
+                    roots.append(f.read())
+        return roots
+
+    def _referenced_chunks(self, roots, checkpoint):
+        """Empreintes citées par les recettes des répertoires inscrits."""
+        repository = os.path.abspath(self.root)
+        referenced = set()
+        for recipes_dir in roots:
+            if not os.path.isdir(recipes_dir):
+                # Destination démontée ou configuration supprimée : ses blocs ne peuvent pas être libérés
+                # sans risque (supprimer son fichier <dépôt>/roots/<clé>.root pour l'oublier)
+                raise CollectionSkipped(f"répertoire de recettes inaccessible : {recipes_dir}")
+            for dir_path, _, file_names in os.walk(recipes_dir):
+                for recipe_name in file_names:
+                    if not recipe_name.endswith(RECIPE_SUFFIX):
+                        continue
+                    if checkpoint is not None:
+                        checkpoint()
+                    try:
+                        recipe = load_recipe(os.path.join(dir_path, recipe_name))
+                    except FileNotFoundError:
+                        continue
+                    except (OSError, ValueError) as e:
+                        raise CollectionSkipped(f"recette illisible : {os.path.join(dir_path, recipe_name)} ({e})")
+                    if os.path.abspath(recipe.get("repository", repository)) == repository:
+                        referenced.update(recipe["chunks"])
+        return referenced
+
+    def collect_garbage(self, checkpoint=None):
+        """
+        Libère les blocs qui ne sont plus cités par aucune recette : les packs sans bloc utile sont supprimés,
+        ceux dont la part inutile atteint REPACK_MIN_DEAD_RATIO sont réécrits avec leurs seuls blocs utiles.
+        À appeler après close() : le dépôt ne doit être ouvert par aucune synchronisation.
+
+        Args:
+            checkpoint (callable): Appelé avant chaque recette lue et chaque pack traité (pause).
+
+        Returns:
+            dict: {"packs_removed", "packs_rewritten", "chunks_removed", "bytes_freed"}.
+
+        Raises:
+            CollectionSkipped: Dépôt utilisé par une autre synchronisation (le ramasse-miettes est alors
+                               reporté à la suivante), ou recettes inaccessibles.
+        """
+        pending_path = os.path.join(self.root, GC_PENDING_FILE_NAME)
+        lock_file = open(os.path.join(self.root, LOCK_FILE_NAME), 'a')
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    open(pending_path, 'a').close()
+                    raise CollectionSkipped("dépôt utilisé par une autre synchronisation, reporté")
+            roots = self._registered_roots()
+            if fcntl is None and len(roots) > 1:
+                raise CollectionSkipped("dépôt partagé, sans verrou disponible sur cette plateforme")
+            referenced = {bytes.fromhex(digest) for digest in self._referenced_chunks(roots, checkpoint)}
+            stats = {"packs_removed": 0, "packs_rewritten": 0, "chunks_removed": 0, "bytes_freed": 0}
+            for file_name in sorted(os.listdir(self.packs_dir)):
+                pack_name, extension = os.path.splitext(file_name)
+                pack_path = os.path.join(self.packs_dir, pack_name + ".pack")
+                index_path = os.path.join(self.packs_dir, pack_name + ".idx")
+                if extension == ".pack" and os.path.exists(pack_path) and not os.path.exists(index_path):
+                    # Pack sans index laissé par un arrêt brutal (aucun écrivain actif sous le verrou exclusif)
+                    stats["bytes_freed"] += os.path.getsize(pack_path)
+                    os.remove(pack_path)
+                    stats["packs_removed"] += 1
+                    continue
+                if extension != ".idx":
+                    continue
+                if checkpoint is not None:
+                    checkpoint()
+                with open(index_path, 'rb') as f:
+                    data = f.read()
+                records = [INDEX_RECORD.unpack_from(data, offset)
+                           for offset in range(0, len(data) - INDEX_RECORD.size + 1, INDEX_RECORD.size)]
+                live = [record for record in records if record[0] in referenced]
+                dead_bytes = sum(record[2] for record in records) - sum(record[2] for record in live)
+                if live and dead_bytes < sum(record[2] for record in records) * REPACK_MIN_DEAD_RATIO:
+                    continue
+                if live:
+                    self._rewrite_pack(pack_name, live)
+                    stats["packs_rewritten"] += 1
+                else:
+                    stats["packs_removed"] += 1
+                # Index supprimé avant le pack : un arrêt entre les deux laisse un pack ignoré, supprimé plus tard
+                os.remove(index_path)
+                os.remove(pack_path)
+                stats["chunks_removed"] += len(records) - len(live)
+                stats["bytes_freed"] += dead_bytes
+            try:
+                os.remove(pending_path)
+            except FileNotFoundError:
+                pass
+            self._load_index()
+            return stats
+        finally:
+            lock_file.close()
+
+    def _rewrite_pack(self, pack_name, records):
+        """Copie les blocs utiles d'un pack (sans les décompresser) dans un nouveau pack scellé."""
+        with open(os.path.join(self.packs_dir, pack_name + ".pack"), 'rb') as source:
+            self._open_pack()
+            for digest, position, stored_size, size, flags in records:
+                source.seek(position)
+                data = source.read(stored_size)
+                new_position = self._pack_file.tell()
+                self._pack_file.write(data)
+                self._pack_records.append(INDEX_RECORD.pack(digest, new_position, stored_size, size, flags))
+            self._seal_pack()
+
+
+def load_recipe(recipe_path):
+    """Charge une recette de version."""
+    with open(recipe_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def run_benchmark(size_mb):
+    """
+    Mesure le débit du découpage (numpy et Python pur) et la déduplication après une modification locale.
+    """
+    import io
+    data = bytearray(os.urandom(size_mb * 1024 * 1024))
+    modified = bytearray(data)
+    modified[len(data) // 2:len(data) // 2 + 1000] = os.urandom(1000)
+    modes = [False] + ([True] if np is not None else [])
+    for use_numpy in modes:
+        start = time.perf_counter()
+        chunks = list(iter_chunks(io.BytesIO(bytes(data)), use_numpy=use_numpy))
+        elapsed = time.perf_counter() - start
+        label = "numpy" if use_numpy else "python"
+        print(f"{label:>6} : {len(chunks)} blocs, {size_mb / max(elapsed, 1e-9):8.1f} Mio/s")
+    first = {hashlib.sha256(c).digest() for c in chunks}
+    second = [hashlib.sha256(c).digest() for c in iter_chunks(io.BytesIO(bytes(modified)), use_numpy=modes[-1])]
+    new = sum(1 for digest in second if digest not in first)
+    print(f"Après modification de 1000 octets : {new} bloc(s) nouveau(x) sur {len(second)}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Dépôt de blocs dédupliqués.")
+    parser.add_argument("--bench", action="store_true", help="Banc d'essai du découpage.")
+    parser.add_argument("--size-mb", type=int, default=64, help="Taille des données de test en Mio.")
+    args = parser.parse_args()
+    if args.bench:
+        run_benchmark(args.size_mb)
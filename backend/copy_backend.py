@@ -0,0 +1,610 @@
+# Fichier : copy_backend.py
+# Description : Copie des données d'un fichier vers un autre pour le moteur de synchronisation.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - copy_file : copie avec métadonnées (équivalent de shutil.copy2), ou, en mode « faible empreinte
+#      sur le cache », boucle de lecture/écriture avec posix_fadvise : SEQUENTIAL et NOREUSE sur la
+#      source, puis DONTNEED sur la source et la destination pour chaque tranche écrite et synchronisée.
+#    - drop_from_cache : libération des pages d'un fichier seulement lu (comparaison de contenu).
+#    - Mini banc d'essai : python copy_backend.py --bench-cache --size-mb 1024
+#
+# Version 1.1 (2026-10-19)
+#    - Copie segmentée parallèle des gros fichiers : au-delà de 'segment_threshold', le fichier est découpé
+#      en tranches de SEGMENT_SIZE copiées par plusieurs threads (copy_file_range, repli pread/pwrite)
+#      dans un fichier temporaire préalloué, renommé sur la destination seulement si toutes les tranches
+#      ont réussi.
+#    - Banc d'essai : python copy_backend.py --bench-segments --size-mb 4096 --segment-workers 8
+#
+# Version 1.2 (2026-10-19)
+#    - Préallocation des gros fichiers : au-delà de 'preallocate_threshold', même sans copie segmentée,
+#      le fichier temporaire est réservé avec posix_fallocate (extents contigus, ENOSPC détecté avant
+#      d'écrire la moindre donnée) puis renommé sur la destination.
+#
+# Version 1.3 (2026-10-19)
+#    - Toutes les copies sont écrites dans un fichier temporaire puis renommées (os.replace) sur la
+#      destination ; option fsync : synchronisation du fichier avant renommage, puis du répertoire.
+#    - copy_file retourne la taille copiée (comptabilité de la politique de durabilité).
+#
+# Version 1.4 (2026-10-19)
+#    - metadata_differs / apply_metadata : report des seules métadonnées (propriétaire, permissions,
+#      horodatages) d'un fichier source sur une destination au contenu identique, sans lire ni écrire
+#      de données. Le propriétaire n'est reporté que si le processus en a le droit (root).
+#
+# Version 1.5 (2026-10-19)
+#    - copy_file_to_many : copie d'un fichier vers plusieurs destinations en une seule lecture de la
+#      source (chaque bloc lu est écrit dans le fichier temporaire de chaque destination) ; l'échec
+#      d'une destination (écriture, espace disque) est isolé et n'interrompt pas les autres.
+#
+# Version 1.6 (2026-10-19)
+#    - Option 'hasher' de copy_file et copy_file_to_many : empreinte des données calculée pendant la
+#      copie, sur les blocs qui transitent par le processus (sans relecture de la source). Dans ce mode,
+#      copy_file n'utilise ni le chemin rapide du noyau ni la copie segmentée (hachage dans l'ordre).
+#
+# Version 1.7 (2026-10-19)
+#    - SourceChangedError et source_unchanged : détection d'un fichier source modifié pendant sa copie
+#      (taille ou mtime_ns différentes avant et après).
+#
+# Version 1.8 (2026-10-19)
+#    - temporary_path : nom temporaire limité en octets (et non en caractères) ; un nom long est coupé
+#      et complété d'une empreinte du nom complet. Un nom UTF-8 multioctet proche de 255 octets donnait
+#      un nom temporaire trop long (ENAMETOOLONG) et le fichier n'était jamais copié.
+#
+############################################################################################################
+
+import errno
+import hashlib
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+
+from durability import fsync_directory
+
+# Mode faible empreinte : tranche de données après laquelle la destination est synchronisée
+# et les pages des deux fichiers sont libérées du cache
+DONTNEED_INTERVAL = 64 * 1024 * 1024
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Copie segmentée : taille d'une tranche distribuée à un thread, et seuil par défaut
+SEGMENT_SIZE = 64 * 1024 * 1024
+DEFAULT_SEGMENT_THRESHOLD = 1024 * 1024 * 1024
+
+# Taille à partir de laquelle un fichier est préalloué (posix_fallocate) avant d'être écrit
+DEFAULT_PREALLOCATE_THRESHOLD = 64 * 1024 * 1024
+
+# Suffixe des fichiers temporaires écrits à côté de la destination avant renommage
+TEMP_SUFFIX = ".synchro-tmp"
+
+# Octets du nom de la destination conservés dans un nom temporaire : le reste (empreinte, identifiants,
+# suffixe) tient largement sous la limite de 255 octets d'un nom de fichier
+TEMP_NAME_MAX_BYTES = 160
+
+
+class SourceChangedError(OSError):
+    """Le fichier source a été modifié pendant sa copie (la copie peut être incohérente)."""
+    def __init__(self, path):
+        super().__init__(errno.EAGAIN, "Fichier source modifié pendant la copie", str(path))
+
+
+def source_unchanged(before, after):
+    """
+    Indique si un fichier source est resté inchangé pendant sa copie.
+
+    Args:
+        before (os.stat_result): Stat pris avant la copie.
+        after (os.stat_result): Stat pris après la copie.
+
+    Returns:
+        bool: True si la taille et la mtime (ns) sont identiques.
+    """
+    return (before.st_size, before.st_mtime_ns) == (after.st_size, after.st_mtime_ns)
+
+
+def _fadvise(fd, offset, length, advice):
+    """posix_fadvise sans erreur si l'appel n'est pas disponible (macOS, Windows) ou refusé."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, offset, length, advice)
+        except OSError:
+            pass
+
+
+def _copy_low_cache(src_fd, dst_fd, buffer_size, hasher=None):
+    """
+    Copie src_fd vers dst_fd sans laisser les données dans le cache de pages.
+
+    Les pages sales ne peuvent pas être libérées : chaque tranche de DONTNEED_INTERVAL octets est
+    d'abord synchronisée (fdatasync) puis libérée (DONTNEED) sur la destination et la source.
+
+    Returns:
+        int: Nombre d'octets copiés (et passés à 'hasher', s'il est fourni).
+    """
+    if hasattr(os, "posix_fadvise"):
+        _fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        _fadvise(src_fd, 0, 0, os.POSIX_FADV_NOREUSE)
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    offset = 0
+    released = 0
+    while True:
+        read = os.readv(src_fd, [buffer])
+        if not read:
+            break
+        if hasher is not None:
+            hasher.update(view[:read])
+        written = 0
+        while written < read:
+            written += os.write(dst_fd, view[written:read])
+        offset += read
+        if offset - released >= DONTNEED_INTERVAL:
+            os.fdatasync(dst_fd)
+            if hasattr(os, "posix_fadvise"):
+                _fadvise(dst_fd, released, offset - released, os.POSIX_FADV_DONTNEED)
+                _fadvise(src_fd, released, offset - released, os.POSIX_FADV_DONTNEED)
+            released = offset
+    if offset > released:
+        os.fdatasync(dst_fd)
+        if hasattr(os, "posix_fadvise"):
+            _fadvise(dst_fd, released, 0, os.POSIX_FADV_DONTNEED)
+            _fadvise(src_fd, released, 0, os.POSIX_FADV_DONTNEED)
+    return offset
+
+
+def _copy_hashed(src_fd, dst_fd, buffer_size, hasher):
+    """
+    Copie src_fd vers dst_fd en passant chaque bloc lu à 'hasher'.
+
+    Returns:
+        int: Nombre d'octets copiés.
+    """
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    copied = 0
+    while True:
+        read = os.readv(src_fd, [buffer])
+        if not read:
+            return copied
+        hasher.update(view[:read])
+        _write_all(dst_fd, view[:read])
+        copied += read
+
+
+def _copy_range(src_fd, dst_fd, offset, length, buffer_size):
+    """
+    Copie 'length' octets à partir de 'offset' (même position dans les deux fichiers), sans utiliser
+    la position courante des descripteurs : plusieurs threads peuvent copier des tranches en parallèle.
+    """
+    end = offset + length
+    if hasattr(os, "copy_file_range"):
+        try:
+            while offset < end:
+                copied = os.copy_file_range(src_fd, dst_fd, end - offset, offset, offset)
+                if copied == 0:
+                    return  # Fin de fichier (fichier source raccourci pendant la copie)
+                offset += copied
+            return
+        except OSError:
+            pass  # Non pris en charge entre ces systèmes de fichiers : repli pread/pwrite
+    while offset < end:
+        data = os.pread(src_fd, min(buffer_size, end - offset), offset)
+        if not data:
+            return
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(dst_fd, view, offset)
+            view = view[written:]
+            offset += written
+
+
+def _copy_segmented(src_fd, dst_fd, size, workers, buffer_size, low_cache):
+    """
+    Copie un fichier de 'size' octets par tranches de SEGMENT_SIZE réparties entre 'workers' threads.
+
+    Raises:
+        OSError: La première erreur rencontrée par un thread, une fois tous les threads arrêtés.
+    """
+    next_segment = [0]
+    errors = []
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if errors or next_segment[0] >= size:
+                    return
+                offset = next_segment[0]
+                next_segment[0] += SEGMENT_SIZE
+            try:
+                length = min(SEGMENT_SIZE, size - offset)
+                _copy_range(src_fd, dst_fd, offset, length, buffer_size)
+                if low_cache:
+                    os.fdatasync(dst_fd)
+                    _fadvise(dst_fd, offset, length, os.POSIX_FADV_DONTNEED)
+                    _fadvise(src_fd, offset, length, os.POSIX_FADV_DONTNEED)
+            except OSError as e:
+                with lock:
+                    errors.append(e)
+                return
+
+    threads = [threading.Thread(target=worker, name=f"segment-{i}", daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _preallocate(fd, size):
+    """Réserve 'size' octets pour le fichier (extents contigus si possible), sinon fixe sa taille."""
+    if size <= 0:
+        return
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError as e:
+            if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL, errno.ENOSYS):
+                raise  # ENOSPC en particulier : détecté avant d'écrire la moindre donnée
+    os.ftruncate(fd, size)
+
+
+def temporary_path(dst_path, tag=None):
+    """
+    Chemin temporaire, dans le répertoire de la destination, pour un renommage atomique.
+
+    Args:
+        dst_path (str | Path): Fichier destination.
+        tag (str): Distingue les fichiers temporaires d'un même fichier (par défaut : processus et thread).
+
+    Returns:
+        str: Chemin temporaire, terminé par TEMP_SUFFIX.
+    """
+    directory, name = os.path.split(os.fspath(dst_path))
+    encoded = os.fsencode(name)
+    if len(encoded) > TEMP_NAME_MAX_BYTES:
+        # Coupé en octets (os.fsdecode conserve un caractère multioctet tronqué sous forme d'octets
+        # isolés) et complété d'une empreinte du nom complet, pour que deux noms longs restent distincts
+        name = f"{os.fsdecode(encoded[:TEMP_NAME_MAX_BYTES])}~{hashlib.sha256(encoded).hexdigest()[:8]}"
+    if tag is None:
+        tag = f"{os.getpid()}.{threading.get_ident()}"
+    return os.path.join(directory, f".{name}.{tag}{TEMP_SUFFIX}")
+
+
+def copy_file(src_path, dst_path, buffer_size=DEFAULT_BUFFER_SIZE, low_cache=False,
+              segment_workers=1, segment_threshold=DEFAULT_SEGMENT_THRESHOLD,
+              preallocate_threshold=DEFAULT_PREALLOCATE_THRESHOLD, fsync=False, hasher=None):
+    """
+    Copie un fichier et ses métadonnées (permissions, horodatages), comme shutil.copy2.
+
+    Les données sont écrites dans un fichier temporaire du répertoire de destination, renommé sur
+    la destination une fois complet : une interruption ne laisse jamais de fichier tronqué sous le
+    nom définitif (l'ancienne version reste en place).
+
+    Args:
+        src_path (str | Path): Fichier source.
+        dst_path (str | Path): Fichier destination (écrasé s'il existe).
+        buffer_size (int): Taille des lectures en mode faible empreinte.
+        low_cache (bool): Mode « faible empreinte sur le cache » (posix_fadvise) ; sinon, la copie
+                          utilise le chemin rapide du noyau (sendfile/copy_file_range) de shutil.
+        segment_workers (int): Threads de copie d'un même gros fichier (1 : pas de copie segmentée).
+        segment_threshold (int): Taille à partir de laquelle un fichier est copié par tranches.
+        preallocate_threshold (int): Taille à partir de laquelle le fichier est préalloué avant écriture.
+        fsync (bool): Synchroniser le fichier avant le renommage, puis son répertoire.
+        hasher (hashlib hash): Objet de hachage mis à jour avec les données copiées (copie séquentielle
+                               par le processus, sans copie segmentée).
+
+    Returns:
+        int: Taille du fichier copié.
+    """
+    size = os.stat(src_path).st_size
+    tmp_path = temporary_path(dst_path)
+    try:
+        if hasher is not None:
+            with open(src_path, 'rb') as src, open(tmp_path, 'wb') as tmp:
+                if size >= preallocate_threshold:
+                    _preallocate(tmp.fileno(), size)
+                if low_cache:
+                    size = _copy_low_cache(src.fileno(), tmp.fileno(), buffer_size, hasher)
+                else:
+                    size = _copy_hashed(src.fileno(), tmp.fileno(), buffer_size, hasher)
+                os.ftruncate(tmp.fileno(), size)  # Préallocation plus grande qu'une source raccourcie
+                if fsync:
+                    os.fsync(tmp.fileno())
+        elif size >= preallocate_threshold or (segment_workers > 1 and size >= segment_threshold):
+            workers = segment_workers if size >= segment_threshold else 1
+            _write_preallocated(src_path, tmp_path, size, max(1, workers), buffer_size, low_cache, fsync)
+        elif low_cache:
+            with open(src_path, 'rb') as src, open(tmp_path, 'wb') as tmp:
+                _copy_low_cache(src.fileno(), tmp.fileno(), buffer_size)
+                if fsync:
+                    os.fsync(tmp.fileno())
+        else:
+            shutil.copyfile(src_path, tmp_path)
+            if fsync:
+                _fsync_path(tmp_path)
+        shutil.copystat(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if fsync:
+        fsync_directory(os.path.dirname(os.path.abspath(dst_path)))
+    return size
+
+
+def _write_all(fd, data):
+    """Écrit tout le bloc (os.write peut n'en écrire qu'une partie)."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _discard(path):
+    """Supprime un fichier temporaire, sans erreur s'il a déjà disparu."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def copy_file_to_many(src_path, dst_paths, buffer_size=DEFAULT_BUFFER_SIZE, low_cache=False,
+                      preallocate_threshold=DEFAULT_PREALLOCATE_THRESHOLD, fsync=False, hasher=None):
+    """
+    Copie un fichier et ses métadonnées vers plusieurs destinations en ne lisant la source qu'une fois.
+
+    Chaque bloc lu est écrit dans le fichier temporaire de chaque destination ; chaque fichier
+    complet est ensuite renommé sur sa destination, comme pour copy_file. Une destination en échec
+    (écriture impossible, espace insuffisant) est abandonnée sans interrompre les autres.
+
+    Args:
+        src_path (str | Path): Fichier source.
+        dst_paths (list): Fichiers destination (écrasés s'ils existent).
+        buffer_size (int): Taille des lectures de la source.
+        low_cache (bool): Libérer du cache de pages la source et les destinations après la copie.
+        preallocate_threshold (int): Taille à partir de laquelle les fichiers sont préalloués.
+        fsync (bool): Synchroniser chaque fichier avant renommage, puis son répertoire.
+        hasher (hashlib hash): Objet de hachage mis à jour avec chaque bloc lu de la source.
+
+    Returns:
+        tuple: (taille copiée, dictionnaire {destination: exception} des destinations en échec).
+
+    Raises:
+        OSError: Si la source ne peut pas être lue (aucune destination n'est alors modifiée).
+    """
+    size = os.stat(src_path).st_size
+    outputs = {}  # destination -> (chemin temporaire, descripteur)
+    errors = {}
+
+    def abandon(dst_path, error):
+        tmp_path, fd = outputs.pop(dst_path)
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        _discard(tmp_path)
+        if error is not None:
+            errors[dst_path] = error
+
+    try:
+        for dst_path in dst_paths:
+            tmp_path = temporary_path(dst_path)
+            try:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            except OSError as e:
+                errors[dst_path] = e
+                continue
+            outputs[dst_path] = (tmp_path, fd)
+            if size >= preallocate_threshold:
+                try:
+                    _preallocate(fd, size)
+                except OSError as e:
+                    abandon(dst_path, e)
+        copied = 0
+        with open(src_path, 'rb') as src:
+            if low_cache and hasattr(os, "posix_fadvise"):
+                _fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                _fadvise(src.fileno(), 0, 0, os.POSIX_FADV_NOREUSE)
+            while outputs:
+                block = src.read(buffer_size)
+                if not block:
+                    break
+                if hasher is not None:
+                    hasher.update(block)
+                for dst_path, (_, fd) in list(outputs.items()):
+                    try:
+                        _write_all(fd, block)
+                    except OSError as e:
+                        abandon(dst_path, e)
+                copied += len(block)
+        for dst_path, (tmp_path, fd) in list(outputs.items()):
+            try:
+                os.ftruncate(fd, copied)  # Préallocation plus grande qu'une source raccourcie entre-temps
+                if fsync:
+                    os.fsync(fd)
+                if low_cache and hasattr(os, "posix_fadvise"):
+                    _fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                outputs.pop(dst_path)
+                os.close(fd)  # Peut signaler une erreur d'écriture différée (NFS)
+            except OSError as e:
+                if dst_path in outputs:
+                    abandon(dst_path, e)
+                else:
+                    _discard(tmp_path)
+                    errors[dst_path] = e
+                continue
+            try:
+                shutil.copystat(src_path, tmp_path)
+                os.replace(tmp_path, dst_path)
+                if fsync:
+                    fsync_directory(os.path.dirname(os.path.abspath(dst_path)))
+            except OSError as e:
+                _discard(tmp_path)
+                errors[dst_path] = e
+    except BaseException:
+        for dst_path in list(outputs):
+            abandon(dst_path, None)
+        raise
+    if low_cache:
+        drop_from_cache(src_path)
+    return copied, errors
+
+
+def _fsync_path(path):
+    """Synchronise sur disque le contenu d'un fichier désigné par son chemin."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_preallocated(src_path, tmp_path, size, workers, buffer_size, low_cache, fsync):
+    """
+    Copie par tranches ('workers' threads) dans le fichier temporaire préalloué.
+    """
+    with open(src_path, 'rb') as src, open(tmp_path, 'wb') as tmp:
+        if low_cache and hasattr(os, "posix_fadvise"):
+            _fadvise(src.fileno(), 0, 0, os.POSIX_FADV_NOREUSE)
+        _preallocate(tmp.fileno(), size)
+        _copy_segmented(src.fileno(), tmp.fileno(), size, workers, buffer_size, low_cache)
+        os.ftruncate(tmp.fileno(), size)
+        if fsync:
+            os.fsync(tmp.fileno())
+
+
+def drop_from_cache(path):
+    """
+    Libère du cache de pages les pages propres d'un fichier (lu mais non modifié), par exemple
+    après une comparaison de contenu en mode faible empreinte.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        _fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _can_chown():
+    """Seul root peut attribuer un fichier à un autre propriétaire."""
+    return hasattr(os, "chown") and hasattr(os, "geteuid") and os.geteuid() == 0
+
+
+def metadata_differs(src_st, dst_st):
+    """
+    Indique si les métadonnées reportables d'un fichier source diffèrent de celles de la destination.
+
+    Args:
+        src_st (os.stat_result): Stat du fichier source.
+        dst_st (os.stat_result): Stat du fichier destination.
+
+    Returns:
+        bool: True si les permissions, la mtime ou (en tant que root) le propriétaire diffèrent.
+    """
+    if stat.S_IMODE(src_st.st_mode) != stat.S_IMODE(dst_st.st_mode) or src_st.st_mtime_ns != dst_st.st_mtime_ns:
+        return True
+    return _can_chown() and (src_st.st_uid, src_st.st_gid) != (dst_st.st_uid, dst_st.st_gid)
+
+
+def apply_metadata(src_st, dst_path):
+    """
+    Reporte propriétaire (si possible), permissions et horodatages d'un fichier source sur la destination.
+
+    Args:
+        src_st (os.stat_result): Stat du fichier source.
+        dst_path (str | Path): Fichier destination (son contenu n'est pas touché).
+    """
+    if _can_chown():
+        os.chown(dst_path, src_st.st_uid, src_st.st_gid)  # Avant chmod : chown efface les bits setuid/setgid
+    os.chmod(dst_path, stat.S_IMODE(src_st.st_mode))
+    os.utime(dst_path, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
+
+
+def _cached_kib():
+    """Taille du cache de pages (Cached dans /proc/meminfo), en Kio."""
+    with open("/proc/meminfo", encoding="ascii") as meminfo:
+        for line in meminfo:
+            if line.startswith("Cached:"):
+                return int(line.split()[1])
+    return 0
+
+
+def run_cache_benchmark(size_mb, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Mesure la croissance du cache de pages et la durée d'une copie, avec et sans le mode faible empreinte.
+    Le fichier source est créé puis libéré du cache avant chaque copie.
+    """
+    with tempfile.TemporaryDirectory(prefix="synchro_bench_") as workdir:
+        source = os.path.join(workdir, "source.bin")
+        with open(source, 'wb') as f:
+            block = os.urandom(1024 * 1024)
+            for _ in range(size_mb):
+                f.write(block)
+            f.flush()
+            os.fsync(f.fileno())
+        for low_cache in (False, True):
+            destination = os.path.join(workdir, f"copy_{int(low_cache)}.bin")
+            if hasattr(os, "posix_fadvise"):
+                with open(source, 'rb') as f:
+                    _fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            before = _cached_kib()
+            start = time.perf_counter()
+            copy_file(source, destination, buffer_size, low_cache=low_cache)
+            with open(destination, 'rb') as f:
+                os.fsync(f.fileno())
+            elapsed = time.perf_counter() - start
+            growth_mb = (_cached_kib() - before) / 1024
+            mode = "faible empreinte" if low_cache else "standard        "
+            print(f"{mode} : {size_mb} Mio en {elapsed:6.2f} s, croissance du cache de pages : {growth_mb:8.1f} Mio")
+            os.remove(destination)
+
+
+def run_segment_benchmark(size_mb, segment_workers, directory=None):
+    """
+    Compare la durée de copie d'un gros fichier en un seul flux et en copie segmentée parallèle.
+    """
+    with tempfile.TemporaryDirectory(prefix="synchro_bench_", dir=directory) as workdir:
+        source = os.path.join(workdir, "source.bin")
+        with open(source, 'wb') as f:
+            block = os.urandom(1024 * 1024)
+            for _ in range(size_mb):
+                f.write(block)
+        for workers in (1, segment_workers):
+            destination = os.path.join(workdir, f"copy_{workers}.bin")
+            start = time.perf_counter()
+            copy_file(source, destination, segment_workers=workers, segment_threshold=0)
+            with open(destination, 'rb') as f:
+                os.fsync(f.fileno())
+            elapsed = time.perf_counter() - start
+            print(f"{workers:>2} thread(s) : {size_mb} Mio en {elapsed:6.2f} s ({size_mb / max(elapsed, 1e-9):8.1f} Mio/s)")
+            os.remove(destination)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Banc d'essai du module de copie.")
+    parser.add_argument("--bench-cache", action="store_true", help="Mesure l'effet du mode faible empreinte.")
+    parser.add_argument("--bench-segments", action="store_true", help="Mesure l'effet de la copie segmentée.")
+    parser.add_argument("--size-mb", type=int, default=1024, help="Taille du fichier de test en Mio.")
+    parser.add_argument("--segment-workers", type=int, default=8, help="Threads de la copie segmentée.")
+    parser.add_argument("--dir", default=None, help="Répertoire de travail (sur le volume à mesurer).")
+    args = parser.parse_args()
+    if args.bench_cache:
+        run_cache_benchmark(args.size_mb)
+    if args.bench_segments:
+        run_segment_benchmark(args.size_mb, args.segment_workers, args.dir)
@@ -0,0 +1,178 @@
+# Fichier : dedupe.py
+# Description : Détection des fichiers identiques de la source pendant la copie : le premier
+#               exemplaire est copié, les suivants deviennent des liens physiques ou des clones
+#               (reflink) de cette copie dans la destination.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - DuplicateIndex : regroupement par taille des fichiers copiés pendant la synchronisation ; un
+#      fichier n'est haché que si un autre fichier de même taille a déjà été vu, puis comparé par
+#      empreinte SHA-256 aux fichiers de ce groupe.
+#    - Mode "hardlink" : lien physique seulement si les métadonnées (mode, mtime, propriétaire) sont
+#      identiques, puisque l'inode est partagé ; mode "reflink" : clone (ioctl FICLONE, btrfs/XFS)
+#      portant ses propres métadonnées. Repli sur une copie si le lien ou le clone échoue.
+#
+# Version 1.1 (2026-10-19)
+#    - copy_or_link : le fichier est inscrit dans son groupe dans la même section critique que la lecture
+#      des candidats, et son empreinte calculée à la demande. Deux threads de copie traitant au même
+#      moment deux fichiers identiques copiaient chacun le sien ; le second attend désormais la copie du
+#      premier pour s'y relier.
+#
+# Version 1.2 (2026-10-19)
+#    - Nom temporaire du lien construit par copy_backend.temporary_path (limité en octets).
+#
+############################################################################################################
+
+import hashlib
+import os
+import shutil
+import threading
+
+from copy_backend import temporary_path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+DEDUPE_MODES = ("off", "hardlink", "reflink")
+
+# _IOW(0x94, 9, int) : clone de toutes les données d'un fichier (Linux)
+FICLONE = 0x40049409
+
+# Les fichiers plus petits ne sont pas dédupliqués (hachage plus coûteux que la copie)
+DEDUPE_MIN_SIZE = 1024
+
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def file_digest(path):
+    """Empreinte SHA-256 (binaire) du contenu d'un fichier."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(HASH_BUFFER_SIZE)
+            if not block:
+                break
+            digest.update(block)
+    return digest.digest()
+
+
+def _metadata_key(st):
+    """Métadonnées qu'un lien physique partagerait entre les deux fichiers."""
+    return (st.st_mode, st.st_mtime_ns, st.st_uid, st.st_gid)
+
+
+class _Original:
+    """Premier exemplaire d'un contenu, copié dans la destination."""
+    def __init__(self, src_path, dst_path, st):
+        self.src_path = src_path
+        self.dst_path = dst_path
+        self.metadata = _metadata_key(st)
+        self.digest = None
+        self.copied = threading.Event()  # Positionné quand la copie est terminée (réussie ou non)
+        self.ok = False
+        self.digest_lock = threading.Lock()
+
+
+class DuplicateIndex:
+    """
+    Index des contenus copiés pendant une synchronisation, partagé par les threads de copie.
+    """
+    def __init__(self, mode, digest_function=file_digest, min_size=DEDUPE_MIN_SIZE, logger=None):
+        """
+        Args:
+            mode (str): "hardlink" ou "reflink".
+            digest_function (callable): Calcule l'empreinte d'un fichier source à partir de son chemin
+                                        (permet de réutiliser un cache d'empreintes).
+            min_size (int): Taille minimale d'un fichier dédupliqué.
+            logger (logging.Logger): Journal des liens créés.
+        """
+        self.mode = mode
+        self.digest_function = digest_function
+        self.min_size = min_size
+        self.logger = logger
+        self.files_linked = 0
+        self.bytes_saved = 0
+        self._by_size = {}
+        self._lock = threading.Lock()
+
+    def _digest_of(self, original):
+        with original.digest_lock:
+            if original.digest is None:
+                original.digest = self.digest_function(original.src_path)
+            return original.digest
+
+    def copy_or_link(self, src_path, dst_path, copy_function):
+        """
+        Copie un fichier, ou le relie à la copie déjà faite d'un fichier source identique.
+
+        Args:
+            src_path (Path): Fichier source.
+            dst_path (Path): Fichier destination.
+            copy_function (callable): Effectue la copie réelle (src_path, dst_path).
+
+        Returns:
+            bool: True si le fichier a été relié (aucune donnée copiée), False s'il a été copié.
+        """
+        st = os.stat(src_path)
+        if st.st_size < self.min_size:
+            copy_function(src_path, dst_path)
+            return False
+
+        # Inscrit dans son groupe dans la même section critique que la lecture des candidats : un fichier
+        # identique traité au même moment par un autre thread le voit et attend sa copie au lieu de copier
+        # lui aussi. L'empreinte n'est calculée qu'en cas de comparaison (_digest_of).
+        original = _Original(src_path, dst_path, st)
+        with self._lock:
+            group = self._by_size.setdefault(st.st_size, [])
+            candidates = list(group)
+            group.append(original)
+        try:
+            for candidate in candidates:
+                if self._digest_of(candidate) != self._digest_of(original):
+                    continue
+                candidate.copied.wait()
+                if candidate.ok and self._link(candidate, dst_path, st, src_path):
+                    original.ok = True # Contenu identique : peut à son tour servir d'original
+                    with self._lock:
+                        self.files_linked += 1
+                        self.bytes_saved += st.st_size
+                    if self.logger is not None:
+                        self.logger.info(f"Doublon relié ({self.mode}) : {src_path} -> {candidate.dst_path}")
+                    return True
+            copy_function(src_path, dst_path)
+            original.ok = True
+            return False
+        finally:
+            original.copied.set()
+
+    def _link(self, original, dst_path, st, src_path):
+        """
+        Crée dst_path comme lien physique ou clone de la copie d'origine (fichier temporaire renommé).
+
+        Returns:
+            bool: True en cas de succès, False s'il faut copier.
+        """
+        if self.mode == "hardlink" and _metadata_key(st) != original.metadata:
+            return False  # L'inode partagé ne peut pas porter deux jeux de métadonnées
+        tmp_path = temporary_path(dst_path, f"dedupe.{threading.get_ident()}")
+        try:
+            if self.mode == "hardlink":
+                os.link(original.dst_path, tmp_path)
+            else:
+                if fcntl is None:
+                    return False
+                with open(original.dst_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                shutil.copystat(src_path, tmp_path)
+            os.replace(tmp_path, dst_path)
+            return True
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
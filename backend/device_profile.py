@@ -0,0 +1,202 @@
+# Fichier : device_profile.py
+# Description : Identification du type de périphérique (disque rotatif, SSD, NVMe, réseau) portant
+#               un chemin, et choix des paramètres d'entrées/sorties adaptés.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - identify_device : st_dev -> /proc/self/mountinfo (type de système de fichiers, source du montage)
+#      -> /sys/dev/block/<majeur>:<mineur> -> queue/rotational.
+#    - choose_io_settings : concurrence de copie, threads de parcours, taille des tampons et ordre
+#      de lecture à partir des profils source et destination.
+#
+# Version 1.1 (2026-10-19)
+#    - Disques rotatifs : ordre de lecture "physical" (position du premier extent, repli sur l'inode).
+#
+# Version 1.2 (2026-10-19)
+#    - segment_workers : threads de copie d'un même gros fichier (1 sur disque rotatif : un seul flux
+#      séquentiel ; plusieurs sur NVMe, SSD et réseau où les requêtes en parallèle remplissent la file).
+#
+############################################################################################################
+
+import os
+from pathlib import Path
+
+MOUNTINFO_PATH = Path("/proc/self/mountinfo")
+SYS_DEV_BLOCK = Path("/sys/dev/block")
+SYS_CLASS_BLOCK = Path("/sys/class/block")
+
+# Systèmes de fichiers dont chaque opération est un aller-retour réseau
+NETWORK_FSTYPES = {
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "ceph", "glusterfs", "lustre", "davfs",
+    "fuse.sshfs", "fuse.rclone", "fuse.glusterfs", "fuse.s3fs", "fuse.gcsfuse",
+}
+
+KIB = 1024
+MIB = 1024 * KIB
+
+# Paramètres par type de périphérique :
+#   copy_workers : flux de copie simultanés ; scan_workers : threads de parcours ;
+#   buffer_size : taille des lectures ; read_order : "physical" ou "inode" (limiter les déplacements
+#   de tête) ou "path" ; segment_workers : threads de copie d'un même gros fichier.
+DEVICE_PROFILES = {
+    "rotational": {"copy_workers": 1, "scan_workers": 2, "buffer_size": 8 * MIB, "read_order": "physical",
+                   "segment_workers": 1},
+    "ssd": {"copy_workers": 4, "scan_workers": 4, "buffer_size": 1 * MIB, "read_order": "path",
+            "segment_workers": 4},
+    "nvme": {"copy_workers": 16, "scan_workers": 8, "buffer_size": 4 * MIB, "read_order": "path",
+             "segment_workers": 8},
+    "network": {"copy_workers": 8, "scan_workers": 16, "buffer_size": 4 * MIB, "read_order": "path",
+                "segment_workers": 4},
+    "unknown": {"copy_workers": 2, "scan_workers": 2, "buffer_size": 1 * MIB, "read_order": "path",
+                "segment_workers": 1},
+}
+
+
+class DeviceInfo:
+    """
+    Description du périphérique portant un chemin.
+    """
+    def __init__(self, path, dev, kind, fstype=None, mount_point=None, mount_source=None, block_device=None):
+        self.path = path
+        self.dev = dev
+        self.kind = kind  # Clé de DEVICE_PROFILES
+        self.fstype = fstype
+        self.mount_point = mount_point
+        self.mount_source = mount_source
+        self.block_device = block_device
+
+    def __str__(self):
+        details = ", ".join(str(part) for part in (self.block_device or self.mount_source, self.fstype,
+                                                   self.mount_point) if part)
+        return f"{self.kind} ({details})" if details else self.kind
+
+
+def _existing_ancestor(path):
+    """Retourne le premier ancêtre existant du chemin (la destination peut ne pas encore exister)."""
+    path = Path(path)
+    while not path.exists() and path != path.parent:
+        path = path.parent
+    return path
+
+
+def _find_mount(dev):
+    """
+    Recherche dans /proc/self/mountinfo le montage dont le numéro de périphérique est 'dev'.
+
+    Returns:
+        tuple: (type de système de fichiers, point de montage, source du montage), ou (None, None, None).
+    """
+    wanted = f"{os.major(dev)}:{os.minor(dev)}"
+    try:
+        lines = MOUNTINFO_PATH.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return None, None, None
+    found = (None, None, None)
+    for line in lines:
+        # Format : id parent majeur:mineur racine point_de_montage options [champs optionnels] - type source options
+        fields = line.split()
+        if len(fields) < 7 or fields[2] != wanted or "-" not in fields:
+            continue
+        separator = fields.index("-")
+        fstype = fields[separator + 1] if len(fields) > separator + 1 else None
+        source = fields[separator + 2] if len(fields) > separator + 2 else None
+        found = (fstype, fields[4].replace("\\040", " "), source)  # Le dernier montage l'emporte
+    return found
+
+
+def _block_device_dir(dev, mount_source):
+    """
+    Retrouve le répertoire sysfs du périphérique bloc, via le numéro de périphérique puis,
+    pour les systèmes de fichiers à numéro anonyme (btrfs...), via la source du montage.
+    """
+    candidate = SYS_DEV_BLOCK / f"{os.major(dev)}:{os.minor(dev)}"
+    if candidate.exists():
+        return candidate.resolve()
+    if mount_source and mount_source.startswith("/dev/"):
+        candidate = SYS_CLASS_BLOCK / Path(os.path.realpath(mount_source)).name
+        if candidate.exists():
+            return candidate.resolve()
+    return None
+
+
+def _read_rotational(block_dir):
+    """
+    Lit queue/rotational du périphérique (ou de son disque parent s'il s'agit d'une partition).
+
+    Returns:
+        bool: True si rotatif, False sinon, None si inconnu.
+    """
+    for directory in (block_dir, block_dir.parent):
+        flag = directory / "queue" / "rotational"
+        if flag.exists():
+            try:
+                return flag.read_text().strip() == "1"
+            except OSError:
+                return None
+    return None
+
+
+def identify_device(path):
+    """
+    Identifie le type de périphérique portant un chemin.
+
+    Args:
+        path (str | Path): Chemin à examiner (son premier ancêtre existant s'il n'existe pas).
+
+    Returns:
+        DeviceInfo: Le type ("rotational", "ssd", "nvme", "network" ou "unknown") et ses détails.
+    """
+    path = _existing_ancestor(path)
+    dev = os.stat(path).st_dev
+    fstype, mount_point, mount_source = _find_mount(dev)
+    if fstype in NETWORK_FSTYPES or (mount_source and mount_source.startswith("//")):
+        return DeviceInfo(path, dev, "network", fstype, mount_point, mount_source)
+
+    block_dir = _block_device_dir(dev, mount_source)
+    if block_dir is None:
+        return DeviceInfo(path, dev, "unknown", fstype, mount_point, mount_source)
+    rotational = _read_rotational(block_dir)
+    block_name = block_dir.name
+    if rotational:
+        kind = "rotational"
+    elif rotational is None:
+        kind = "unknown"
+    elif block_name.startswith("nvme") or block_dir.parent.name.startswith("nvme"):
+        kind = "nvme"
+    else:
+        kind = "ssd"
+    return DeviceInfo(path, dev, kind, fstype, mount_point, mount_source, block_name)
+
+
+def choose_io_settings(source_info, destination_info):
+    """
+    Combine les profils de la source et de la destination.
+
+    Le côté le plus lent impose la concurrence de copie (un disque rotatif à l'une des extrémités
+    implique un seul flux séquentiel) ; le parcours et l'ordre de lecture dépendent de la source.
+
+    Args:
+        source_info (DeviceInfo): Périphérique de la source.
+        destination_info (DeviceInfo): Périphérique de la destination.
+
+    Returns:
+        dict: {"copy_workers", "scan_workers", "buffer_size", "read_order", "segment_workers"}.
+    """
+    source = DEVICE_PROFILES[source_info.kind]
+    destination = DEVICE_PROFILES[destination_info.kind]
+    return {
+        "copy_workers": min(source["copy_workers"], destination["copy_workers"]),
+        "scan_workers": source["scan_workers"],
+        "buffer_size": max(source["buffer_size"], destination["buffer_size"]),
+        "read_order": source["read_order"],
+        "segment_workers": min(source["segment_workers"], destination["segment_workers"]),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+    for argument in sys.argv[1:] or ["."]:
+        info = identify_device(argument)
+        print(f"{argument}: {info} -> {DEVICE_PROFILES[info.kind]}")
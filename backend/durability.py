@@ -0,0 +1,129 @@
+# Fichier : durability.py
+# Description : Politique de durabilité des écritures de la destination (aucune synchronisation,
+#               fsync par fichier, ou synchronisation groupée du système de fichiers).
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - DurabilityPolicy : "none" (le noyau écrit quand il veut), "fsync" (chaque fichier et son
+#      répertoire sont synchronisés avant d'être comptés comme copiés), "batch" (syncfs du système de
+#      fichiers de destination tous les N Mio ou toutes les N secondes, et à la fin de la synchronisation).
+#    - syncfs via la libc (ctypes), repli sur os.sync.
+#
+############################################################################################################
+
+import ctypes
+import ctypes.util
+import os
+import threading
+import time
+
+DURABILITY_MODES = ("none", "fsync", "batch")
+
+# Politique "batch" : volume écrit et délai maximal entre deux synchronisations
+DEFAULT_BATCH_BYTES = 256 * 1024 * 1024
+DEFAULT_BATCH_SECONDS = 30
+
+_libc = None
+
+
+def _syncfs_function():
+    """Retourne la fonction syncfs de la libc, ou None si elle n'est pas disponible."""
+    global _libc
+    if _libc is None:
+        try:
+            _libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        except OSError:
+            _libc = False
+    return getattr(_libc, "syncfs", None) if _libc else None
+
+
+def sync_filesystem(path):
+    """
+    Écrit sur disque les données en attente du système de fichiers portant 'path' (syncfs),
+    ou de tous les systèmes de fichiers (os.sync) si syncfs n'est pas disponible.
+    """
+    syncfs = _syncfs_function()
+    if syncfs is not None:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if syncfs(fd) == 0:
+                return
+        finally:
+            os.close(fd)
+    os.sync()
+
+
+def fsync_directory(path):
+    """Synchronise un répertoire (rend durables les créations et renommages qu'il contient)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # Certains systèmes de fichiers refusent fsync sur un répertoire
+    finally:
+        os.close(fd)
+
+
+class DurabilityPolicy:
+    """
+    Décide quand les écritures de la destination sont rendues durables.
+    Les méthodes peuvent être appelées depuis plusieurs threads de copie.
+    """
+    def __init__(self, mode, root, batch_bytes=DEFAULT_BATCH_BYTES, batch_seconds=DEFAULT_BATCH_SECONDS):
+        """
+        Args:
+            mode (str): "none", "fsync" ou "batch".
+            root (str | Path): Répertoire de destination (désigne le système de fichiers à synchroniser).
+            batch_bytes (int): Politique "batch" : octets écrits entre deux synchronisations.
+            batch_seconds (float): Politique "batch" : délai maximal entre deux synchronisations.
+        """
+        if mode not in DURABILITY_MODES:
+            raise ValueError(f"Politique de durabilité inconnue : {mode}")
+        self.mode = mode
+        self.root = root
+        self.batch_bytes = batch_bytes
+        self.batch_seconds = batch_seconds
+        self.syncs = 0
+        self._pending_bytes = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    @property
+    def fsync_files(self):
+        """True si chaque fichier doit être synchronisé avant son renommage."""
+        return self.mode == "fsync"
+
+    def file_committed(self, size):
+        """
+        Signale qu'un fichier de 'size' octets a été écrit et renommé sur la destination.
+        En politique "batch", déclenche une synchronisation si un seuil est atteint.
+        """
+        if self.mode != "batch":
+            return
+        with self._lock:
+            self._pending_bytes += size
+            due = (self._pending_bytes >= self.batch_bytes
+                   or time.monotonic() - self._last_sync >= self.batch_seconds)
+        # Un seul thread synchronise à la fois ; les autres continuent de copier
+        if due and self._sync_lock.acquire(blocking=False):
+            try:
+                self._sync()
+            finally:
+                self._sync_lock.release()
+
+    def flush(self):
+        """Rend durables toutes les écritures en attente (fin de synchronisation, avant l'état)."""
+        if self.mode != "batch":
+            return
+        with self._sync_lock:
+            self._sync()
+
+    def _sync(self):
+        with self._lock:
+            self._pending_bytes = 0
+            self._last_sync = time.monotonic()
+        sync_filesystem(self.root)
+        self.syncs += 1
@@ -0,0 +1,54 @@
+# Fichier : file_errors.py
+# Description : Classement des erreurs rencontrées en copiant un fichier : transitoires (nouvelle
+#               tentative après une attente), permanentes (fichier ignoré et signalé) ou propres à la
+#               destination (destination écartée de la synchronisation).
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - classify_error : "transient", "permanent" ou "destination" selon le code errno.
+#    - retry_delays : attentes (exponentielles) entre deux tentatives.
+#
+############################################################################################################
+
+import errno
+
+# Erreurs qui peuvent disparaître d'elles-mêmes (verrou, ressource occupée, réseau, support lent)
+TRANSIENT_ERRNOS = frozenset(code for code in (
+    errno.EAGAIN, errno.EBUSY, errno.EINTR, errno.ETIMEDOUT, errno.EIO, errno.ENOLCK,
+    getattr(errno, "ESTALE", None), errno.ECONNRESET, errno.ECONNABORTED, errno.ENOBUFS, errno.ENOMEM,
+    errno.ETXTBSY,
+) if code is not None)
+
+# Erreurs qui toucheront tous les fichiers de la destination : inutile de poursuivre vers elle
+DESTINATION_ERRNOS = frozenset(code for code in (
+    errno.ENOSPC, getattr(errno, "EDQUOT", None), errno.EROFS, errno.ENODEV, errno.ENOTCONN,
+) if code is not None)
+
+# Nouvelles tentatives d'une opération en erreur transitoire, et première attente (doublée à chaque fois)
+RETRY_ATTEMPTS = 4
+RETRY_BACKOFF = 0.5
+
+
+def classify_error(error):
+    """
+    Classe une erreur d'entrée/sortie.
+
+    Args:
+        error (OSError): L'erreur rencontrée.
+
+    Returns:
+        str: "transient" (à réessayer), "destination" (la destination est inutilisable) ou
+             "permanent" (propre au fichier : droits, nom, fichier disparu...).
+    """
+    if isinstance(error, TimeoutError) or error.errno in TRANSIENT_ERRNOS:
+        return "transient"
+    if error.errno in DESTINATION_ERRNOS:
+        return "destination"
+    return "permanent"
+
+
+def retry_delays():
+    """Attentes successives (secondes) avant chacune des RETRY_ATTEMPTS - 1 nouvelles tentatives."""
+    return [RETRY_BACKOFF * 2 ** attempt for attempt in range(RETRY_ATTEMPTS - 1)]
@@ -0,0 +1,142 @@
+# Fichier : hash_cache.py
+# Description : Cache persistant et borné des empreintes de contenu des fichiers, indexé par
+#               (périphérique, inode, taille, mtime_ns), pour ne pas relire un fichier inchangé.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - HashCache : dictionnaire ordonné (éviction LRU au-delà de 'max_entries'), partagé par les threads,
+#      chargé et enregistré (fichier temporaire + renommage) en enregistrements binaires de taille fixe.
+#    - Une empreinte n'est mise en cache que si le fichier n'a pas changé pendant sa lecture.
+#    - Statistiques : succès, échecs, octets hachés.
+#
+############################################################################################################
+
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+# Enregistrement : dev, inode, taille, mtime_ns, empreinte SHA-256
+CACHE_RECORD = struct.Struct("=QQQq32s")
+CACHE_MAGIC = b"SYNHC001"
+
+DEFAULT_MAX_ENTRIES = 500_000
+HASH_BUFFER_SIZE = 1024 * 1024
+
+
+def _cache_key(st):
+    return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class HashCache:
+    """
+    Empreintes SHA-256 des fichiers, réutilisées tant que l'identité et les métadonnées du fichier
+    (périphérique, inode, taille, mtime) sont inchangées.
+    """
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Charge le cache s'il existe (un fichier illisible est ignoré).
+
+        Args:
+            path (Path): Fichier du cache.
+            max_entries (int): Nombre maximal d'empreintes conservées (les moins récemment utilisées
+                               sont évincées).
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.bytes_hashed = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self):
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return
+        if not data.startswith(CACHE_MAGIC):
+            return
+        body = memoryview(data)[len(CACHE_MAGIC):]
+        usable = len(body) - len(body) % CACHE_RECORD.size
+        for dev, ino, size, mtime_ns, digest in CACHE_RECORD.iter_unpack(body[:usable]):
+            self._entries[(dev, ino, size, mtime_ns)] = digest
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self):
+        """Enregistre le cache, des entrées les moins récemment utilisées aux plus récentes."""
+        with self._lock:
+            records = [CACHE_RECORD.pack(*key, digest) for key, digest in self._entries.items()]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(CACHE_MAGIC)
+            f.write(b"".join(records))
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, st):
+        """
+        Retourne l'empreinte en cache d'un fichier d'après son stat, ou None.
+        """
+        key = _cache_key(st)
+        with self._lock:
+            digest = self._entries.get(key)
+            if digest is not None:
+                self._entries.move_to_end(key)
+        return digest
+
+    def digest(self, path):
+        """
+        Empreinte SHA-256 (binaire) d'un fichier, lue dans le cache si le fichier n'a pas changé.
+
+        Args:
+            path (str | Path): Fichier à hacher.
+
+        Returns:
+            bytes: Empreinte de 32 octets.
+        """
+        st = os.stat(path)
+        key = _cache_key(st)
+        with self._lock:
+            digest = self._entries.get(key)
+            if digest is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return digest
+            self.misses += 1
+
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(HASH_BUFFER_SIZE)
+                if not block:
+                    break
+                hasher.update(block)
+            after = os.fstat(f.fileno())
+        digest = hasher.digest()
+        with self._lock:
+            self.bytes_hashed += st.st_size
+            if _cache_key(after) == key:  # Pas de modification pendant la lecture
+                self._entries[key] = digest
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return digest
+
+    def store(self, st, digest):
+        """Enregistre l'empreinte d'un fichier calculée ailleurs (pendant une copie, par exemple)."""
+        key = _cache_key(st)
+        with self._lock:
+            self._entries[key] = digest
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,355 @@
+# Fichier : manifest_diff.py
+# Description : Manifeste colonnaire d'un parcours de la source et calcul du différentiel
+#               entre deux exécutions (ajouts, modifications, suppressions).
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - Classe Manifest : colonnes (chemin relatif, taille, mtime_ns, mode, inode, device) triées par chemin.
+#    - diff_manifests : jointure vectorisée (numpy) sur les identifiants de chemin avec comparaison
+#      des colonnes, et repli en Python pur si numpy n'est pas installé.
+#    - Mini banc d'essai exécutable (python manifest_diff.py --bench 1000000 10000000 50000000).
+#
+# Version 1.1 (2026-10-19)
+#    - Manifest.from_rows et Manifest.rows_by_directory : réutilisation des entrées d'un répertoire
+#      inchangé lors d'un parcours incrémental.
+#
+# Version 1.2 (2026-10-19)
+#    - Seuil NUMPY_MIN_ENTRIES : les petits lots (un répertoire à la fois dans le pipeline du moteur)
+#      restent en Python pur, où la conversion en tableaux coûterait plus que la jointure.
+#
+# Version 1.3 (2026-10-19)
+#    - Colonnes uid et gid ; catégorie "metadata" du différentiel : fichiers de même taille et de même
+#      mtime dont seuls les permissions ou le propriétaire ont changé (aucune donnée à recopier).
+#
+# Version 1.4 (2026-10-19)
+#    - Attribut 'digests' du manifeste : empreintes SHA-256 (hexadécimales) des fichiers copiés, par
+#      chemin relatif, hors colonnes numériques ; sérialisé avec le manifeste.
+#
+# Version 1.5 (2026-10-19)
+#    - Manifest.without : copie du manifeste sans certains chemins (fichiers dont la copie a échoué,
+#      à reprendre lors de la prochaine synchronisation).
+#
+############################################################################################################
+
+import time
+
+try:
+    import numpy as np  # Dépendance optionnelle : accélère le différentiel
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    np = None
+
+
+# Colonnes numériques conservées pour chaque fichier, dans l'ordre de stockage
+MANIFEST_COLUMNS = ("size", "mtime_ns", "mode", "ino", "dev", "uid", "gid")
+
+# Colonnes dont la différence signifie que le contenu du fichier doit être recopié
+CONTENT_COLUMNS = ("size", "mtime_ns")
+
+# Colonnes dont la seule différence se reporte sans recopier le contenu (chmod, chown)
+METADATA_COLUMNS = ("mode", "uid", "gid")
+
+# En dessous de ce nombre total d'entrées, le différentiel en Python pur est plus rapide
+NUMPY_MIN_ENTRIES = 10_000
+
+
+class Manifest:
+    """
+    Liste colonnaire des fichiers vus lors d'un parcours de la source.
+
+    Les chemins sont relatifs à la racine de la source (séparateur '/') et triés :
+    la position d'un chemin dans la colonne 'paths' sert d'identifiant pour la jointure.
+    """
+    def __init__(self, paths=None, columns=None, digests=None):
+        """
+        Initialise le manifeste à partir de colonnes déjà triées par chemin.
+
+        Args:
+            paths (list): Chemins relatifs triés.
+            columns (dict): Dictionnaire {nom de colonne: séquence}, une entrée par chemin.
+            digests (dict): Empreintes SHA-256 hexadécimales connues, par chemin relatif.
+        """
+        self.paths = paths if paths is not None else []
+        columns = columns or {}
+        self.columns = {name: columns.get(name, [0] * len(self.paths)) for name in MANIFEST_COLUMNS}
+        self.digests = digests if digests is not None else {}
+        self._arrays = None
+
+    @classmethod
+    def from_entries(cls, entries):
+        """
+        Construit un manifeste à partir d'un itérable de (chemin relatif, os.stat_result).
+
+        Args:
+            entries (iterable): Couples (str, os.stat_result), dans un ordre quelconque.
+
+        Returns:
+            Manifest: Le manifeste trié par chemin.
+        """
+        return cls.from_rows((rel_path, st.st_size, st.st_mtime_ns, st.st_mode, st.st_ino, st.st_dev,
+                              st.st_uid, st.st_gid)
+                             for rel_path, st in entries)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Construit un manifeste à partir de lignes (chemin relatif, *valeurs des MANIFEST_COLUMNS).
+
+        Args:
+            rows (iterable): Tuples dans l'ordre ("path",) + MANIFEST_COLUMNS, dans un ordre quelconque.
+
+        Returns:
+            Manifest: Le manifeste trié par chemin.
+        """
+        rows = sorted(rows, key=lambda row: row[0])
+        paths = [row[0] for row in rows]
+        columns = {name: [row[position + 1] for row in rows] for position, name in enumerate(MANIFEST_COLUMNS)}
+        return cls(paths, columns)
+
+    def rows_by_directory(self):
+        """
+        Regroupe les lignes du manifeste par répertoire parent relatif ("" pour la racine).
+
+        Returns:
+            dict: {répertoire relatif: [tuples au format de from_rows]}.
+        """
+        grouped = {}
+        columns = [self.columns[name] for name in MANIFEST_COLUMNS]
+        for index, rel_path in enumerate(self.paths):
+            parent, _, _ = rel_path.rpartition("/")
+            grouped.setdefault(parent, []).append((rel_path,) + tuple(column[index] for column in columns))
+        return grouped
+
+    def __len__(self):
+        return len(self.paths)
+
+    def get(self, rel_path):
+        """
+        Retourne les colonnes d'un chemin sous forme de dictionnaire, ou None s'il est absent.
+        """
+        index = self._index_of(rel_path)
+        if index is None:
+            return None
+        return {name: int(self.columns[name][index]) for name in MANIFEST_COLUMNS}
+
+    def _index_of(self, rel_path):
+        """Recherche dichotomique d'un chemin dans la colonne triée."""
+        low, high = 0, len(self.paths)
+        while low < high:
+            middle = (low + high) // 2
+            if self.paths[middle] < rel_path:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.paths) and self.paths[low] == rel_path:
+            return low
+        return None
+
+    def as_arrays(self):
+        """
+        Retourne (et met en cache) les colonnes converties en tableaux numpy.
+
+        Returns:
+            tuple: (tableau des chemins, dictionnaire {colonne: tableau int64}).
+        """
+        if self._arrays is None:
+            paths = np.asarray(self.paths, dtype=str) if self.paths else np.empty(0, dtype=str)
+            columns = {name: np.asarray(self.columns[name], dtype=np.int64) for name in MANIFEST_COLUMNS}
+            self._arrays = (paths, columns)
+        return self._arrays
+
+    def without(self, rel_paths):
+        """
+        Retourne une copie du manifeste sans les chemins donnés (ni leurs empreintes).
+
+        Args:
+            rel_paths (set): Chemins relatifs à retirer.
+
+        Returns:
+            Manifest: Le nouveau manifeste (celui-ci n'est pas modifié).
+        """
+        kept = [index for index, rel_path in enumerate(self.paths) if rel_path not in rel_paths]
+        columns = {name: [self.columns[name][index] for index in kept] for name in MANIFEST_COLUMNS}
+        digests = {rel_path: digest for rel_path, digest in self.digests.items() if rel_path not in rel_paths}
+        return Manifest([self.paths[index] for index in kept], columns, digests)
+
+    def to_dict(self):
+        """Sérialise le manifeste en dictionnaire compatible JSON."""
+        return {
+            "paths": list(self.paths),
+            "columns": {name: [int(value) for value in self.columns[name]] for name in MANIFEST_COLUMNS},
+            "digests": dict(self.digests),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruit un manifeste sérialisé par to_dict()."""
+        return cls(data.get("paths", []), data.get("columns", {}), data.get("digests", {}))
+
+
+class ManifestDiff:
+    """
+    Résultat d'un différentiel : listes de chemins relatifs, chacune triée.
+    """
+    def __init__(self, added, changed, unchanged, deleted, metadata=None):
+        self.added = added
+        self.changed = changed
+        self.unchanged = unchanged
+        self.deleted = deleted
+        self.metadata = metadata if metadata is not None else [] # Seules les métadonnées ont changé
+
+    def __repr__(self):
+        return (f"ManifestDiff(added={len(self.added)}, changed={len(self.changed)}, "
+                f"metadata={len(self.metadata)}, unchanged={len(self.unchanged)}, deleted={len(self.deleted)})")
+
+
+def _diff_python(previous, current):
+    """
+    Différentiel en Python pur : fusion des deux colonnes de chemins triées.
+    """
+    added, changed, unchanged, deleted, metadata = [], [], [], [], []
+    prev_paths, cur_paths = previous.paths, current.paths
+    prev_cols = [previous.columns[name] for name in CONTENT_COLUMNS]
+    cur_cols = [current.columns[name] for name in CONTENT_COLUMNS]
+    prev_meta = [previous.columns[name] for name in METADATA_COLUMNS]
+    cur_meta = [current.columns[name] for name in METADATA_COLUMNS]
+    i, j = 0, 0
+    while i < len(prev_paths) and j < len(cur_paths):
+        prev_path, cur_path = prev_paths[i], cur_paths[j]
+        if prev_path == cur_path:
+            if any(prev_col[i] != cur_col[j] for prev_col, cur_col in zip(prev_cols, cur_cols)):
+                changed.append(cur_path)
+            elif any(prev_col[i] != cur_col[j] for prev_col, cur_col in zip(prev_meta, cur_meta)):
+                metadata.append(cur_path)
+            else:
+                unchanged.append(cur_path)
+            i += 1
+            j += 1
+        elif prev_path < cur_path:
+            deleted.append(prev_path)
+            i += 1
+        else:
+            added.append(cur_path)
+            j += 1
+    deleted.extend(prev_paths[i:])
+    added.extend(cur_paths[j:])
+    return ManifestDiff(added, changed, unchanged, deleted, metadata)
+
+
+def _diff_numpy(previous, current):
+    """
+    Différentiel vectorisé : jointure par recherche dichotomique des chemins courants
+    dans la colonne triée précédente, puis comparaison des colonnes en bloc.
+    """
+    prev_paths, prev_cols = previous.as_arrays()
+    cur_paths, cur_cols = current.as_arrays()
+    if len(prev_paths) == 0 or len(cur_paths) == 0:
+        return ManifestDiff(list(current.paths), [], [], list(previous.paths))
+
+    positions = np.searchsorted(prev_paths, cur_paths)
+    positions = np.minimum(positions, len(prev_paths) - 1)
+    found = prev_paths[positions] == cur_paths
+
+    cur_ids = np.flatnonzero(found)
+    prev_ids = positions[found]
+    differs = np.zeros(len(cur_ids), dtype=bool)
+    for name in CONTENT_COLUMNS:
+        differs |= prev_cols[name][prev_ids] != cur_cols[name][cur_ids]
+    meta_differs = np.zeros(len(cur_ids), dtype=bool)
+    for name in METADATA_COLUMNS:
+        meta_differs |= prev_cols[name][prev_ids] != cur_cols[name][cur_ids]
+    meta_differs &= ~differs
+
+    seen = np.zeros(len(prev_paths), dtype=bool)
+    seen[prev_ids] = True
+
+    return ManifestDiff(
+        added=cur_paths[~found].tolist(),
+        changed=cur_paths[cur_ids[differs]].tolist(),
+        unchanged=cur_paths[cur_ids[~(differs | meta_differs)]].tolist(),
+        deleted=prev_paths[~seen].tolist(),
+        metadata=cur_paths[cur_ids[meta_differs]].tolist(),
+    )
+
+
+def diff_manifests(previous, current, use_numpy=None):
+    """
+    Calcule les listes de travail entre le manifeste de l'exécution précédente et le courant.
+
+    Args:
+        previous (Manifest): Manifeste enregistré lors de la dernière synchronisation réussie.
+        current (Manifest): Manifeste du parcours en cours.
+        use_numpy (bool): Force (True) ou interdit (False) le chemin vectorisé. Par défaut, numpy est
+                          utilisé s'il est installé et que les manifestes sont assez grands.
+
+    Returns:
+        ManifestDiff: Fichiers ajoutés, modifiés (taille ou mtime différents), aux seules métadonnées
+                      modifiées (permissions, propriétaire), inchangés et supprimés.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None and len(previous) + len(current) >= NUMPY_MIN_ENTRIES
+    if use_numpy:
+        if np is None:
+            raise RuntimeError("numpy n'est pas installé : différentiel vectorisé indisponible.")
+        return _diff_numpy(previous, current)
+    return _diff_python(previous, current)
+
+
+def _synthetic_manifests(count, change_ratio=0.01):
+    """
+    Génère deux manifestes synthétiques de 'count' entrées pour le banc d'essai :
+    ~1 % de fichiers modifiés, ~1 % supprimés et ~1 % ajoutés.
+    """
+    step = max(1, int(1 / change_ratio))
+    prev_paths = [f"d{i % 1000:03d}/f{i:09d}" for i in range(count)]
+    prev_paths.sort()
+    prev_sizes = list(range(count))
+    prev_mtimes = [1_700_000_000_000_000_000] * count
+    cur_paths, cur_sizes, cur_mtimes = [], [], []
+    for i, path in enumerate(prev_paths):
+        if i % step == 1:
+            continue  # Supprimé
+        cur_paths.append(path)
+        cur_sizes.append(prev_sizes[i] + (1 if i % step == 0 else 0))  # Modifié
+        cur_mtimes.append(prev_mtimes[i])
+    cur_paths.extend(f"new/f{i:09d}" for i in range(0, count, step))  # Ajoutés
+    cur_sizes.extend([0] * (len(cur_paths) - len(cur_sizes)))
+    cur_mtimes.extend([0] * (len(cur_paths) - len(cur_mtimes)))
+    order = sorted(range(len(cur_paths)), key=cur_paths.__getitem__)
+    previous = Manifest(prev_paths, {"size": prev_sizes, "mtime_ns": prev_mtimes})
+    current = Manifest([cur_paths[k] for k in order],
+                       {"size": [cur_sizes[k] for k in order], "mtime_ns": [cur_mtimes[k] for k in order]})
+    return previous, current
+
+
+def run_benchmark(sizes):
+    """
+    Compare la durée du différentiel Python pur et vectorisé pour chaque taille demandée.
+    """
+    for count in sizes:
+        previous, current = _synthetic_manifests(count)
+        start = time.perf_counter()
+        result = diff_manifests(previous, current, use_numpy=False)
+        python_sec = time.perf_counter() - start
+        line = f"{count:>12,} entrées | Python pur: {python_sec:8.2f} s"
+        if np is not None:
+            previous.as_arrays()
+            current.as_arrays()  # Conversion hors chronométrage : le manifeste est déjà colonnaire
+            start = time.perf_counter()
+            vector_result = diff_manifests(previous, current, use_numpy=True)
+            numpy_sec = time.perf_counter() - start
+            assert repr(vector_result) == repr(result)
+            line += f" | numpy: {numpy_sec:8.2f} s | accélération: x{python_sec / max(numpy_sec, 1e-9):.1f}"
+        else:
+            line += " | numpy non installé"
+        print(f"{line} | {result!r}")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Banc d'essai du différentiel de manifestes.")
+    parser.add_argument("--bench", type=int, nargs="+", default=[1_000_000, 10_000_000, 50_000_000],
+                        help="Nombres d'entrées à tester.")
+    args = parser.parse_args()
+    run_benchmark(args.bench)
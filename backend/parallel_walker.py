@@ -0,0 +1,80 @@
+# Fichier : parallel_walker.py
+# Description : Parcours parallèle d'une arborescence par un groupe de threads alimentés
+#               par une file de répertoires à traiter.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - parallel_walk : chaque thread retire un répertoire de la file, le traite (scandir/stat via le
+#      rappel fourni) et y ajoute les sous-répertoires découverts. Utile sur NFS/SMB/FUSE où chaque
+#      readdir et chaque stat est un aller-retour réseau : os.scandir et os.stat libèrent le GIL.
+#    - Avec un seul worker, parcours séquentiel en profondeur dans le thread appelant.
+#
+############################################################################################################
+
+import queue
+import threading
+
+
+def parallel_walk(root, visit, workers=1):
+    """
+    Parcourt une arborescence en appelant visit() sur chaque élément, en parallèle.
+
+    L'ordre d'appel de visit() n'est pas déterministe avec plusieurs workers : l'appelant
+    doit trier les résultats qu'il accumule s'il a besoin d'un ordre stable.
+
+    Args:
+        root: Élément de départ (typiquement la description du répertoire racine).
+        visit (callable): Traite un élément et retourne l'itérable de ses éléments enfants
+                          (les sous-répertoires à parcourir). Doit être sûr vis-à-vis des threads.
+        workers (int): Nombre de threads de parcours.
+
+    Raises:
+        Exception: La première exception levée par visit() est relancée dans le thread appelant,
+                   une fois les autres workers arrêtés.
+    """
+    if workers <= 1:
+        stack = [root]
+        while stack:
+            children = list(visit(stack.pop()))
+            stack.extend(reversed(children))
+        return
+
+    work_queue = queue.Queue()
+    lock = threading.Lock()
+    done = threading.Event()
+    state = {"pending": 1, "error": None}
+
+    def worker():
+        while True:
+            item = work_queue.get()
+            if item is None or done.is_set():
+                return
+            try:
+                children = list(visit(item))
+            except BaseException as e:
+                with lock:
+                    if state["error"] is None:
+                        state["error"] = e
+                done.set()
+                return
+            with lock:
+                state["pending"] += len(children) - 1
+                finished = state["pending"] == 0
+            for child in children:
+                work_queue.put(child)
+            if finished:
+                done.set()
+
+    work_queue.put(root)
+    threads = [threading.Thread(target=worker, name=f"walker-{i}", daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    done.wait()
+    for _ in threads:
+        work_queue.put(None)  # Réveille les workers en attente pour qu'ils se terminent
+    for thread in threads:
+        thread.join()
+    if state["error"] is not None:
+        raise state["error"]
@@ -0,0 +1,140 @@
+# Fichier : pipeline.py
+# Description : Primitives pour enchaîner des étapes concurrentes (threads) reliées par des files
+#               bornées, avec contre-pression et arrêt de toutes les étapes à la première erreur.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - Classe Pipeline : création de files bornées, put/get interruptibles, lancement des étapes
+#      dans des threads et propagation de la première exception au thread appelant.
+#
+# Version 1.1 (2026-10-19)
+#    - Pipeline.poll : retrait d'un élément avec une attente bornée (regroupement de lots).
+#
+############################################################################################################
+
+import queue
+import threading
+import time
+
+# Délai d'attente maximal d'une opération de file avant de vérifier si le pipeline a été interrompu
+POLL_INTERVAL_SEC = 0.1
+
+# Marqueur de fin de flux transmis d'une étape à la suivante
+END_OF_STREAM = object()
+
+
+class PipelineAborted(Exception):
+    """Levée dans une étape lorsque le pipeline est interrompu par une autre étape."""
+
+
+class Pipeline:
+    """
+    Ensemble d'étapes exécutées dans des threads et reliées par des files bornées.
+
+    Une file pleine bloque l'étape productrice (contre-pression) ; une erreur dans une étape
+    interrompt toutes les autres et est relancée par join().
+    """
+    def __init__(self):
+        self.aborted = threading.Event()
+        self._error = None
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def queue(self, maxsize):
+        """Crée une file bornée à 'maxsize' éléments."""
+        return queue.Queue(maxsize=maxsize)
+
+    def put(self, work_queue, item):
+        """
+        Ajoute un élément à une file en attendant qu'une place se libère.
+
+        Raises:
+            PipelineAborted: Si le pipeline est interrompu pendant l'attente.
+        """
+        while True:
+            if self.aborted.is_set():
+                raise PipelineAborted()
+            try:
+                work_queue.put(item, timeout=POLL_INTERVAL_SEC)
+                return
+            except queue.Full:
+                continue
+
+    def get(self, work_queue):
+        """
+        Retire un élément d'une file en attendant qu'il soit disponible.
+
+        Raises:
+            PipelineAborted: Si le pipeline est interrompu pendant l'attente.
+        """
+        while True:
+            if self.aborted.is_set():
+                raise PipelineAborted()
+            try:
+                return work_queue.get(timeout=POLL_INTERVAL_SEC)
+            except queue.Empty:
+                continue
+
+    def poll(self, work_queue, timeout):
+        """
+        Retire un élément d'une file s'il est disponible avant 'timeout' secondes.
+
+        Returns:
+            L'élément, ou None si la file est restée vide.
+
+        Raises:
+            PipelineAborted: Si le pipeline est interrompu pendant l'attente.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.aborted.is_set():
+                raise PipelineAborted()
+            remaining = deadline - time.monotonic()
+            try:
+                return work_queue.get(timeout=max(0, min(POLL_INTERVAL_SEC, remaining)))
+            except queue.Empty:
+                if remaining <= POLL_INTERVAL_SEC:
+                    return None
+
+    def fail(self, error):
+        """Enregistre la première erreur et interrompt toutes les étapes."""
+        with self._lock:
+            if self._error is None:
+                self._error = error
+        self.aborted.set()
+
+    def spawn(self, name, target, *args):
+        """
+        Lance une étape dans un thread. Une exception dans l'étape interrompt le pipeline.
+
+        Args:
+            name (str): Nom du thread (pour le débogage).
+            target (callable): Fonction de l'étape.
+            *args: Arguments transmis à target.
+        """
+        def run():
+            try:
+                target(*args)
+            except PipelineAborted:
+                pass
+            except BaseException as e:
+                self.fail(e)
+
+        thread = threading.Thread(target=run, name=name, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+        return thread
+
+    def join(self):
+        """
+        Attend la fin de toutes les étapes.
+
+        Raises:
+            Exception: La première erreur survenue dans une étape.
+        """
+        for thread in self._threads:
+            thread.join()
+        if self._error is not None:
+            raise self._error
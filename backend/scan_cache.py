@@ -0,0 +1,173 @@
+# Fichier : scan_cache.py
+# Description : Cache de parcours partagé entre configurations (et entre processus) : contenu d'un
+#               répertoire (noms, types, stats) réutilisable tant que sa mtime est inchangée, pendant
+#               une durée limitée.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - list_directory : lecture d'un répertoire (scandir + stat) en liste d'entrées sérialisables.
+#    - ScanCache : base SQLite (mode WAL, plusieurs processus) indexée par chemin absolu ; une entrée
+#      n'est réutilisée que si le répertoire a le même périphérique, le même inode et la même mtime,
+#      et qu'elle date de moins de 'max_age' secondes. Écritures regroupées par transactions.
+#
+# Version 1.1 (2026-10-19)
+#    - list_directory : paramètre 'on_error' ; une entrée dont le stat échoue (fichier supprimé entre la
+#      lecture du répertoire et son stat, droits...) est signalée et omise au lieu d'interrompre la lecture.
+#
+# Version 1.2 (2026-10-19)
+#    - Entrées indexées par le chemin en octets (os.fsencode) : un nom non UTF-8 (octets conservés en
+#      « surrogateescape ») ne pouvait pas être lié à la requête SQLite, et l'exception interrompait la
+#      synchronisation. Un chemin impossible à encoder est traité comme absent du cache.
+#
+############################################################################################################
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+# Les entrées plus anciennes sont purgées à l'ouverture, quelle que soit la durée choisie par l'appelant
+MAX_SCAN_CACHE_AGE = 3600
+
+# Une mtime de répertoire trop proche de l'instant présent n'est pas fiable (granularité des horodatages)
+MTIME_RACE_WINDOW_NS = 2_000_000_000
+
+# Nombre de répertoires enregistrés par transaction
+WRITE_BATCH_SIZE = 500
+
+# Champs de os.stat_result conservés pour chaque entrée (même ordre que les lignes du manifeste)
+CachedStat = namedtuple("CachedStat", "st_size st_mtime_ns st_mode st_ino st_dev st_uid st_gid")
+
+
+def _key(path):
+    """Clé d'un répertoire dans la base : son chemin en octets (None s'il ne peut pas être encodé)."""
+    try:
+        return os.fsencode(path)
+    except UnicodeError:
+        return None
+
+
+def _cached_stat(st):
+    return CachedStat(st.st_size, st.st_mtime_ns, st.st_mode, st.st_ino, st.st_dev, st.st_uid, st.st_gid)
+
+
+def list_directory(path, on_error=None):
+    """
+    Lit un répertoire.
+
+    Args:
+        path (str | Path): Répertoire à lire.
+        on_error (callable): Appelée avec (chemin de l'entrée, OSError) pour une entrée illisible, qui est
+                             alors omise. Sans rappel, l'erreur est levée.
+
+    Returns:
+        list: Entrées (nom, type, stat) ; type "file", "dir" ou "other" (stat None pour "other").
+              Les liens symboliques sont suivis, comme par DirEntry.is_file()/is_dir()/stat().
+
+    Raises:
+        OSError: Le répertoire lui-même est illisible.
+    """
+    listing = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    listing.append((entry.name, "file", _cached_stat(entry.stat())))
+                elif entry.is_dir():
+                    listing.append((entry.name, "dir", _cached_stat(entry.stat())))
+                else:
+                    listing.append((entry.name, "other", None))
+            except OSError as e:
+                if on_error is None:
+                    raise
+                on_error(entry.path, e)
+    return listing
+
+
+class ScanCache:
+    """
+    Contenus de répertoires lus récemment, partagés par toutes les configurations.
+    """
+    def __init__(self, path, max_age):
+        """
+        Ouvre (ou crée) la base du cache et purge les entrées périmées.
+
+        Args:
+            path (Path): Fichier de la base SQLite.
+            max_age (int): Âge maximal (secondes) d'une entrée réutilisée.
+        """
+        self.max_age = min(max_age, MAX_SCAN_CACHE_AGE)
+        self.hits = 0
+        self.misses = 0
+        self._pending = []
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=OFF")  # Simple cache : une perte ne coûte qu'un scandir
+        with self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, dev INTEGER, ino INTEGER, "
+                             "mtime_ns INTEGER, scanned_at REAL, entries TEXT)")
+            self._db.execute("DELETE FROM dirs WHERE scanned_at < ?", (time.time() - MAX_SCAN_CACHE_AGE,))
+
+    def lookup(self, path, dir_stat):
+        """
+        Retourne le contenu en cache d'un répertoire, s'il est encore valable.
+
+        Args:
+            path (str | Path): Chemin absolu du répertoire.
+            dir_stat (os.stat_result): Stat actuel du répertoire.
+
+        Returns:
+            list: Entrées au format de list_directory, ou None.
+        """
+        key = _key(path)
+        with self._lock:
+            row = None if key is None else self._db.execute(
+                "SELECT dev, ino, mtime_ns, scanned_at, entries FROM dirs WHERE path = ?", (key,)).fetchone()
+            if (row is None or (row[0], row[1], row[2]) != (dir_stat.st_dev, dir_stat.st_ino, dir_stat.st_mtime_ns)
+                    or time.time() - row[3] > self.max_age):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return [(name, kind, CachedStat(*st) if st is not None else None) for name, kind, st in json.loads(row[4])]
+
+    def store(self, path, dir_stat, listing):
+        """
+        Enregistre le contenu d'un répertoire qui vient d'être lu (écrit par lots).
+
+        Args:
+            path (str | Path): Chemin absolu du répertoire.
+            dir_stat (os.stat_result): Stat du répertoire obtenu avant sa lecture.
+            listing (list): Entrées au format de list_directory.
+        """
+        if time.time_ns() - dir_stat.st_mtime_ns <= MTIME_RACE_WINDOW_NS:
+            return  # Répertoire peut-être encore en cours de modification
+        key = _key(path)
+        if key is None:
+            return
+        record = (key, dir_stat.st_dev, dir_stat.st_ino, dir_stat.st_mtime_ns, time.time(),
+                  json.dumps(listing, separators=(",", ":")))
+        with self._lock:
+            self._pending.append(record)
+            if len(self._pending) >= WRITE_BATCH_SIZE:
+                self._write_pending()
+
+    def _write_pending(self):
+        try:
+            with self._db:
+                self._db.executemany("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?, ?)", self._pending)
+        except sqlite3.OperationalError:
+            pass  # Base verrouillée trop longtemps par un autre processus : ces entrées ne sont pas partagées
+        self._pending = []
+
+    def close(self):
+        """Enregistre les entrées en attente et ferme la base."""
+        with self._lock:
+            if self._pending:
+                self._write_pending()
+            self._db.close()
@@ -0,0 +1,180 @@
+# Fichier : snapshots.py
+# Description : Instantanés datés de la destination (arborescences complètes dont les fichiers
+#               inchangés sont des liens physiques vers l'instantané précédent) et politique de
+#               rétention des versions et des instantanés.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - Instantanés dans <destination>/snapshots/<AAAA-MM-JJ_HHMMSS> : construits sous un nom temporaire
+#      (.<nom>.partial) puis publiés par renommage ; lien symbolique <destination>/latest.
+#    - prune_snapshots : conserve les instantanés les plus récents.
+#    - prune_versions : conserve, pour chaque nom de fichier, les versions les plus récentes de .cache
+#      (brutes, compressées ou recettes du dépôt de blocs).
+#
+# Version 1.1 (2026-10-19)
+#    - prune_snapshots, prune_versions : paramètre 'checkpoint', appelé avant chaque suppression
+#      (pause de la synchronisation).
+#
+# Version 1.2 (2026-10-19)
+#    - Versions rangées sous .cache/versions/<répertoire relatif>/<nom>.<horodatage> (version_path) :
+#      prune_versions regroupe les versions par chemin relatif, et non plus par nom de fichier (deux
+#      fichiers de même nom dans des répertoires différents s'évinçaient). Les versions de l'ancienne
+#      disposition (à la racine de .cache, sans chemin relatif) ne sont plus supprimées par la rétention.
+#
+############################################################################################################
+
+import os
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+SNAPSHOTS_DIR_NAME = "snapshots"
+LATEST_LINK_NAME = "latest"
+SNAPSHOT_NAME_FORMAT = "%Y-%m-%d_%H%M%S"
+PARTIAL_SUFFIX = ".partial"
+VERSIONS_DIR_NAME = "versions"
+
+# <nom du fichier>.<horodatage>[.gz|.xz|.zz|.chunks]
+VERSION_NAME_PATTERN = re.compile(r"^(?P<name>.+)\.(?P<timestamp>\d+)(?:\.gz|\.xz|\.zz|\.chunks)?$")
+
+
+def list_snapshots(snapshots_dir):
+    """
+    Retourne les instantanés complets, du plus ancien au plus récent.
+
+    Args:
+        snapshots_dir (Path): Répertoire des instantanés.
+
+    Returns:
+        list: Chemins des instantanés (les instantanés partiels, préfixés par '.', sont ignorés).
+    """
+    if not snapshots_dir.is_dir():
+        return []
+    return sorted(entry for entry in snapshots_dir.iterdir()
+                  if entry.is_dir() and not entry.name.startswith("."))
+
+
+def remove_partial_snapshots(snapshots_dir):
+    """
+    Supprime les instantanés partiels laissés par une synchronisation interrompue.
+
+    Returns:
+        int: Nombre d'instantanés partiels supprimés.
+    """
+    if not snapshots_dir.is_dir():
+        return 0
+    removed = 0
+    for entry in snapshots_dir.iterdir():
+        if entry.name.startswith(".") and entry.name.endswith(PARTIAL_SUFFIX):
+            shutil.rmtree(entry, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def new_snapshot_paths(snapshots_dir):
+    """
+    Choisit le nom du nouvel instantané.
+
+    Returns:
+        tuple: (chemin de construction temporaire, chemin définitif).
+    """
+    name = datetime.now().strftime(SNAPSHOT_NAME_FORMAT)
+    final_path = snapshots_dir / name
+    suffix = 1
+    while final_path.exists():
+        suffix += 1
+        final_path = snapshots_dir / f"{name}-{suffix}"
+    return snapshots_dir / f".{final_path.name}{PARTIAL_SUFFIX}", final_path
+
+
+def publish_snapshot(partial_path, final_path, destination):
+    """
+    Publie un instantané construit (renommage) et fait pointer <destination>/latest vers lui.
+    """
+    os.replace(partial_path, final_path)
+    link_path = destination / LATEST_LINK_NAME
+    tmp_link = destination / f".{LATEST_LINK_NAME}.tmp"
+    if tmp_link.is_symlink():
+        tmp_link.unlink()
+    os.symlink(os.path.relpath(final_path, destination), tmp_link)
+    os.replace(tmp_link, link_path)
+
+
+def prune_snapshots(snapshots_dir, keep, checkpoint=None):
+    """
+    Supprime les instantanés les plus anciens.
+
+    Args:
+        snapshots_dir (Path): Répertoire des instantanés.
+        keep (int): Nombre d'instantanés conservés (au moins 1 : le plus récent).
+        checkpoint (callable): Appelé avant chaque suppression (attend pendant une pause).
+
+    Returns:
+        list: Noms des instantanés supprimés.
+    """
+    snapshots = list_snapshots(snapshots_dir)
+    obsolete = snapshots[:max(0, len(snapshots) - max(1, keep))]
+    for snapshot in obsolete:
+        if checkpoint is not None:
+            checkpoint()
+        shutil.rmtree(snapshot)
+    return [snapshot.name for snapshot in obsolete]
+
+
+def version_path(cache_dir, rel_path, timestamp):
+    """
+    Chemin d'une version conservée : .cache/versions/<chemin relatif>.<horodatage>.
+
+    Args:
+        cache_dir (Path): Répertoire .cache de la destination.
+        rel_path (Path): Chemin du fichier relatif à la destination.
+        timestamp (int): Horodatage de la version (secondes).
+
+    Returns:
+        Path: Chemin de la version (sans suffixe de compression ni de recette).
+    """
+    path = cache_dir / VERSIONS_DIR_NAME / rel_path
+    return path.with_name(f"{path.name}.{timestamp}")
+
+
+def prune_versions(cache_dir, keep, checkpoint=None):
+    """
+    Conserve, pour chaque fichier (chemin relatif), les 'keep' versions les plus récentes du répertoire cache.
+    Les versions de l'ancienne disposition, à la racine de .cache, ne sont pas supprimées : leur nom ne
+    permet pas de savoir à quel fichier elles appartiennent.
+
+    Args:
+        cache_dir (Path): Répertoire .cache de la destination.
+        keep (int): Nombre de versions conservées par fichier.
+        checkpoint (callable): Appelé avant chaque suppression (attend pendant une pause).
+
+    Returns:
+        int: Nombre de versions supprimées.
+    """
+    versions = {}
+    for dir_path, _, file_names in os.walk(cache_dir / VERSIONS_DIR_NAME):
+        for file_name in file_names:
+            match = VERSION_NAME_PATTERN.match(file_name)
+            if match:
+                versions.setdefault((dir_path, match.group("name")), []).append(
+                    (int(match.group("timestamp")), os.path.join(dir_path, file_name)))
+    removed = 0
+    for entries in versions.values():
+        entries.sort(reverse=True)
+        for _, path in entries[keep:]:
+            if checkpoint is not None:
+                checkpoint()
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+    return removed
+
+
+def snapshots_dir_of(destination):
+    """Répertoire des instantanés d'une destination."""
+    return Path(destination) / SNAPSHOTS_DIR_NAME
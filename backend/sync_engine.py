@@ -3,6 +3,231 @@
 #
 # Historique des versions :
 #
+# Version 3.15 (2026-10-19)
+#    - Plan d'espace : plus de contrôle de l'espace libre au début de la synchronisation (une destination
+#      presque pleine faisait échouer même une exécution sans rien à écrire) ; seules les écritures
+#      planifiées qui dépassent l'espace libre diminué de la marge sont refusées. Marge configurable
+#      (--space-margin-mb, 16 Mio par défaut).
+#
+# Version 3.14 (2026-10-19)
+#    - Étape de comparaison : les répertoires parcourus sont regroupés (jusqu'à NUMPY_MIN_ENTRIES entrées,
+#      ou COMPARE_GROUP_SECONDS au plus) et comparés en un seul différentiel, qui peut ainsi emprunter le
+#      chemin vectorisé (numpy) ; les lots d'un seul répertoire ne l'atteignaient presque jamais.
+#
+# Version 3.13 (2026-10-19)
+#    - Dépôt de blocs : le répertoire .cache de la destination y est inscrit (register_root) et le
+#      ramasse-miettes (_collect_chunks) libère, après la rétention, les blocs que plus aucune recette
+#      ne cite ; reporté si le dépôt partagé est utilisé par une autre synchronisation.
+#
+# Version 3.12 (2026-10-19)
+#    - Anciennes versions rangées selon leur chemin relatif (.cache/versions/<répertoire>/<nom>.<horodatage>,
+#      snapshots.version_path) : la rétention ne confond plus les fichiers de même nom.
+#
+# Version 3.11 (2026-10-19)
+#    - Mode instantanés : fichiers et répertoires supprimés comptés d'après la différence des manifestes
+#      (les fichiers des répertoires supprimés de la source étaient omis).
+#
+# Version 3.10 (2026-10-19)
+#    - Mode miroir sans manifeste précédent (_cleanup_obsolete) : snapshots/ et latest ne sont plus
+#      supprimés, l'historique d'un passage en mode instantanés est conservé.
+#
+# Version 3.9 (2026-10-19)
+#    - Parcours de la source : un répertoire ou une entrée illisible (droits, erreur d'E/S) n'interrompt
+#      plus la synchronisation. Il est signalé dans le rapport d'erreurs (terminée avec des erreurs) et
+#      son contenu précédent est conservé : ni copié, ni supprimé de la destination. Un fichier disparu
+#      entre la lecture du répertoire et son stat est traité comme supprimé.
+#
+# Version 3.8 (2026-10-19)
+#    - Signaux de commande bloqués dès le début de main() (un signal reçu avant aurait terminé le
+#      processus) et thread de contrôle démarré aussi pour l'audit (--verify-only), qui respecte la
+#      pause et l'arrêt entre deux fichiers (reprise au dernier lot vérifié).
+#    - Pause respectée après le pipeline : suppression des obsolètes, compression des versions,
+#      rétention et contrôle par échantillonnage (_wait_if_paused).
+#
+# Version 3.7 (2026-10-19)
+#    - Pause (SIGUSR1) et reprise (SIGUSR2) : les étapes du pipeline s'arrêtent entre deux fichiers
+#      (copies en cours terminées) et n'effectuent plus de lectures ni d'écritures ; le parcours, la
+#      comparaison et les files de fichiers à copier restent en mémoire et la reprise continue sans
+#      reparcourir la source.
+#    - Signaux de commande (SIGTERM, SIGUSR1, SIGUSR2) traités par un thread de contrôle (sigwait) au
+#      lieu d'un gestionnaire de signal : ils peuvent être journalisés.
+#
+# Version 3.6 (2026-10-19)
+#    - Arrêt coopératif sur SIGTERM (request_stop) : aucun nouveau fichier n'est comparé ni copié
+#      (SyncCancelled entre deux fichiers), les copies en cours se terminent et sont rendues durables,
+#      la synthèse et le rapport d'erreurs sont écrits, l'état précédent est conservé (la copie reprend
+#      à la synchronisation suivante) ; code de sortie 3. Au-delà de STOP_GRACE_SECONDS, l'arrêt est
+#      forcé : les fichiers temporaires sont supprimés au démarrage suivant (marqueur .running).
+#
+# Version 3.5 (2026-10-19)
+#    - Isolation des erreurs par fichier : les erreurs d'E/S sont classées (file_errors.classify_error).
+#      Les erreurs transitoires (EIO, EAGAIN, ETIMEDOUT...) sont réessayées avec une attente exponentielle ;
+#      un fichier en erreur permanente (droits, fichier disparu...) ou transitoire persistante est ignoré,
+#      enregistré, retiré du manifeste (repris à la prochaine synchronisation) et la synchronisation
+#      continue. Seules les erreurs propres à la destination (espace, lecture seule...) l'écartent.
+#    - Rapport d'erreurs <config>.errors.json, ligne "Fichiers en erreur" de la synthèse, et code de
+#      sortie : 0 (succès), 2 (terminée avec des erreurs), 1 (erreur fatale).
+#
+# Version 3.4 (2026-10-19)
+#    - Copies cohérentes des fichiers modifiés pendant leur copie : la source est relue (stat) avant et
+#      après chaque copie ; si sa taille ou sa mtime a changé, la copie est refaite après une attente
+#      croissante (STABLE_COPY_ATTEMPTS tentatives). Un fichier qui change encore est différé : il est
+#      repris après la phase de copie (_copy_deferred), sans bloquer le pipeline, et sa dernière copie
+#      est conservée s'il change toujours.
+#
+# Version 3.3 (2026-10-19)
+#    - Contrôle par échantillonnage (--spot-check-days, --spot-check-mb, --spot-check-sampling) : à la
+#      fin de chaque synchronisation, un échantillon de fichiers de la destination est relu et comparé
+#      aux empreintes du manifeste. La rotation (fichiers les moins récemment vérifiés d'abord) vérifie
+#      chaque fichier dans le délai demandé, dans la limite d'un volume de lecture par exécution ; la
+#      date de dernière vérification de chaque fichier est conservée dans l'état ("spot_check").
+#
+# Version 3.2 (2026-10-19)
+#    - Mode audit (--verify-only, module audit) : chaque fichier de chaque destination est relu et
+#      comparé à l'empreinte enregistrée dans son manifeste, en parallèle, sans accéder à la source.
+#      Débit limitable (--verify-rate-mb), reprise d'un audit interrompu (<état>.audit-progress.json),
+#      rapport JSON des fichiers corrompus, manquants ou illisibles (<config>.audit.json).
+#
+# Version 3.1 (2026-10-19)
+#    - Vérification des copies (module verification, --verify-copies) : en mode "hash", l'empreinte
+#      SHA-256 des données est calculée pendant la copie (sans relire la source) ; en mode "reread",
+#      chaque copie est en plus relue depuis le support (O_DIRECT, ou après libération de ses pages du
+#      cache) et comparée, un écart entraînant une nouvelle copie (VERIFY_RETRIES fois au plus). Les
+#      empreintes sont enregistrées dans le manifeste de l'état (reprises pour les fichiers inchangés) ;
+#      le volume et le débit de relecture sont rapportés à part.
+#
+# Version 3.0 (2026-10-19)
+#    - Cache de parcours partagé (module scan_cache, --scan-cache-seconds) : le contenu lu d'un
+#      répertoire (noms, types, stats) est enregistré dans ~/.synchro/scan_cache.db et réutilisé par
+#      toute configuration dont la source recouvre ce répertoire, tant que sa mtime est inchangée et
+#      pendant la durée choisie. Désactivé par défaut (0) : comme avec --trust-dir-mtime, la
+#      modification d'un fichier existant ne change pas la mtime de son répertoire.
+#
+# Version 2.9 (2026-10-19)
+#    - Destinations multiples (--extra-destination, répétable) : la source est parcourue une seule fois
+#      et chaque fichier à copier n'est lu qu'une fois, ses données étant écrites en parallèle vers
+#      toutes les destinations qui en ont besoin (copy_backend.copy_file_to_many). Chaque destination
+#      est un SyncEngine (self.replicas) avec son propre état (<config>.<empreinte du chemin>.json),
+#      ses statistiques, sa synthèse et son journal (logger enfant) ; une destination en échec est
+#      écartée sans interrompre les autres.
+#    - run_sync découpé en _begin_run / _run_pipeline / _finish_run (ou _abandon_run) par destination.
+#
+# Version 2.8 (2026-10-19)
+#    - Mises à jour de métadonnées seules : un fichier dont seuls les permissions ou le propriétaire
+#      ont changé d'après le manifeste (désormais avec uid/gid), ou dont le contenu s'avère identique
+#      à la destination malgré une mtime différente (touch), reçoit os.chown/os.chmod/os.utime au lieu
+#      d'être ignoré ou recopié. Compteur "Métadonnées mises à jour" dans la synthèse.
+#
+# Version 2.7 (2026-10-19)
+#    - Cache persistant des empreintes de contenu (module hash_cache, --hash-cache-entries), indexé
+#      par (périphérique, inode, taille, mtime_ns) et borné (éviction LRU) : la comparaison de contenu
+#      avec la destination et la déduplication réutilisent les empreintes des fichiers inchangés au
+#      lieu de les relire. Succès et échecs du cache dans la synthèse.
+#
+# Version 2.6 (2026-10-19)
+#    - Déduplication optionnelle des fichiers identiques de la source (module dedupe, --dedupe hardlink
+#      ou reflink) : regroupement par taille, confirmation par empreinte SHA-256, copie du premier
+#      exemplaire puis lien physique ou clone pour les suivants. Octets économisés dans la synthèse.
+#
+# Version 2.5 (2026-10-19)
+#    - Mode instantanés (--snapshot-mode, module snapshots) : chaque synchronisation produit une
+#      arborescence complète datée dans <destination>/snapshots ; les fichiers inchangés d'après le
+#      manifeste sont des liens physiques vers l'instantané précédent (à la manière de --link-dest),
+#      seuls les fichiers ajoutés ou modifiés sont écrits. L'instantané est construit sous un nom
+#      temporaire puis publié par renommage ; <destination>/latest pointe vers le plus récent.
+#    - Rétention : l'option --max-cached-versions, déjà transmise par l'API mais refusée par argparse,
+#      est désormais prise en compte : versions conservées par fichier dans .cache, ou nombre
+#      d'instantanés précédents conservés en mode instantanés.
+#    - L'état enregistre la disposition de la destination (miroir ou instantané de référence) : un
+#      changement de mode ou un instantané disparu invalide le manifeste précédent.
+#
+# Version 2.4 (2026-10-19)
+#    - Format de versions optionnel en dépôt de blocs dédupliqués (module chunk_store,
+#      --version-store chunks) : l'ancienne version d'un fichier modifié est découpée en blocs définis
+#      par leur contenu ; seuls les blocs absents du dépôt sont écrits, et la version est décrite par
+#      une recette <nom>.<horodatage>.chunks dans .cache. Le dépôt (--chunk-repository, par défaut
+#      .cache/chunks dans la destination) peut être partagé par plusieurs configurations.
+#
+# Version 2.3 (2026-10-19)
+#    - Compression optionnelle des versions du répertoire .cache (module version_store,
+#      --version-compression gzip/lzma/zlib, --compression-level) : les versions créées pendant la
+#      copie sont compressées par un groupe de threads en arrière-plan, pendant la phase de suppression ;
+#      la synchronisation attend la fin des compressions avant d'enregistrer l'état.
+#
+# Version 2.2 (2026-10-19)
+#    - Écritures atomiques : chaque copie (et chaque version sauvegardée) est écrite dans un fichier
+#      temporaire puis renommée ; un fichier tronqué n'apparaît jamais sous son nom définitif.
+#    - Politique de durabilité (module durability, --durability) : "none", "fsync" (fichier et
+#      répertoire synchronisés à chaque copie) ou "batch" (défaut : syncfs de la destination tous les
+#      --sync-batch-mb Mio ou --sync-batch-seconds secondes). Dans tous les modes sauf "none", les
+#      écritures sont synchronisées avant l'enregistrement de l'état : après un arrêt brutal, l'état
+#      précédent désigne encore comme modifiés les fichiers dont la copie n'était pas durable.
+#    - Marqueur <config>.running dans le répertoire d'état : s'il subsiste au démarrage (arrêt brutal),
+#      les fichiers temporaires orphelins sont supprimés de la destination.
+#
+# Version 2.1 (2026-10-19)
+#    - Contrôle de l'espace libre de la destination (module capacity) : os.statvfs avant toute écriture,
+#      puis chaque fichier à copier est imputé au plan (taille du fichier, plus la version sauvegardée
+#      dans le cache pour un fichier modifié) avant d'être transmis aux threads de copie. Dès que le plan
+#      dépasse l'espace libre, la synchronisation s'arrête avec un message clair, sans fichier partiel.
+#    - Les fichiers d'au moins 64 Mio sont préalloués (posix_fallocate) avant d'être écrits.
+#
+# Version 2.0 (2026-10-19)
+#    - Copie segmentée parallèle des gros fichiers (copy_backend) : au-delà de --segment-threshold-mb,
+#      un fichier est copié par --segment-workers threads (0 : selon les périphériques) dans un fichier
+#      temporaire préalloué, renommé sur la destination une fois toutes les tranches copiées. Évite qu'un
+#      seul fichier de plusieurs dizaines de Go n'occupe qu'un flux pendant que les autres threads attendent.
+#
+# Version 1.9 (2026-10-19)
+#    - Mode « faible empreinte sur le cache » optionnel (--low-cache) : les copies passent par
+#      copy_backend.copy_file avec posix_fadvise (SEQUENTIAL/NOREUSE en lecture, DONTNEED après écriture
+#      et synchronisation), et les fichiers lus pour une comparaison de contenu sont libérés du cache.
+#
+# Version 1.8 (2026-10-19)
+#    - Ordre de lecture physique sur source rotative (module read_scheduler) : les fichiers à copier
+#      sont regroupés par lots de READ_BATCH_SIZE (tous répertoires confondus) et triés par position
+#      du premier extent (FIEMAP) ou par inode, au lieu de l'ordre des noms renvoyé par scandir.
+#    - Étape de pré-lecture : un thread demande au noyau de charger le fichier suivant
+#      (POSIX_FADV_WILLNEED) pendant que le fichier courant est écrit.
+#
+# Version 1.7 (2026-10-19)
+#    - Ordonnancement des E/S selon les périphériques (module device_profile) : source et destination
+#      sont identifiées (st_dev, /proc/self/mountinfo, queue/rotational) pour choisir le nombre de
+#      threads de parcours et de copie, la taille des tampons et l'ordre de lecture.
+#    - Chaque choix reste surchargeable par configuration (--scan-workers, --copy-workers, --buffer-size,
+#      --read-order) ; 0 / "auto" signifie « selon le périphérique ».
+#    - La comparaison de contenu utilise la taille de tampon choisie (au lieu des 8 Kio de filecmp).
+#    - Ordre de lecture "inode" (disques rotatifs) : les fichiers de chaque répertoire sont copiés
+#      par numéro d'inode croissant.
+#
+# Version 1.6 (2026-10-19)
+#    - Synchronisation en pipeline (module pipeline) : parcours -> comparaison -> copie -> validation,
+#      étapes concurrentes reliées par des files bornées (contre-pression). La copie commence dès les
+#      premiers répertoires parcourus ; le total de fichiers est connu à la fin du parcours.
+#    - La comparaison se fait par répertoire (différentiel du lot avec les entrées précédentes du même
+#      répertoire). Nombre de threads de copie configurable (--copy-workers).
+#    - _copy_file_and_version retourne l'action effectuée ; seuls les messages reçus par l'étape de
+#      validation (thread principal) modifient les compteurs et la progression.
+#
+# Version 1.5 (2026-10-19)
+#    - Parcours de la source par un groupe de threads (module parallel_walker), nombre de threads
+#      configurable par configuration (--scan-workers). Le manifeste et la liste des répertoires
+#      restent triés, quel que soit l'ordre de parcours.
+#
+# Version 1.4 (2026-10-19)
+#    - Parcours incrémental optionnel (--trust-dir-mtime) : les mtimes des répertoires sont enregistrés
+#      dans l'état ; un répertoire dont la mtime n'a pas changé n'est pas relu, ses fichiers sont repris
+#      du manifeste précédent (seuls ses sous-répertoires sont re-stat-és).
+#    - Parcours complet forcé tous les --deep-scan-days jours, ou si la blacklist a changé.
+#
+# Version 1.3 (2026-10-19)
+#    - Un seul parcours de la source produit un manifeste colonnaire (module manifest_diff).
+#    - Le manifeste de la dernière synchronisation réussie est conservé dans l'état par configuration
+#      (~/.synchro/state/<config>.json) ; le différentiel avec le parcours courant donne en bloc
+#      les fichiers ajoutés, modifiés, inchangés et supprimés.
+#    - Les fichiers inchangés (taille et mtime identiques) ne sont plus relus ni comparés.
+#    - Sans manifeste précédent, comportement historique : comparaison de contenu et nettoyage complet.
+#
 # Version 1.2 (2025-05-20)
 #    - Ajout de compteurs pour les statistiques de synchronisation (répertoires/fichiers ajoutés/modifiés).
 #    - Implémentation du calcul et de l'écriture de la progression dans le fichier de log.
@@ -24,13 +249,83 @@
 
 import os
 import shutil
+import signal
+import hashlib
 import logging
 from pathlib import Path
 from datetime import datetime
 import sys
-import filecmp
+import json
+import threading
 import time # Import the time module
 
+from audit import SAMPLING_MODES, DestinationAudit, RateLimiter, spot_check_sample
+from capacity import DEFAULT_SPACE_MARGIN, InsufficientSpaceError, SpaceBudget
+from chunk_store import RECIPE_SUFFIX, ChunkStore, CollectionSkipped
+from copy_backend import (TEMP_SUFFIX, SourceChangedError, apply_metadata, copy_file, copy_file_to_many,
+                          drop_from_cache, metadata_differs, source_unchanged)
+from dedupe import DEDUPE_MODES, DuplicateIndex, file_digest
+from device_profile import DeviceInfo, choose_io_settings, identify_device
+from durability import DEFAULT_BATCH_SECONDS, DURABILITY_MODES, DurabilityPolicy
+from file_errors import classify_error, retry_delays
+from hash_cache import DEFAULT_MAX_ENTRIES, HashCache
+from manifest_diff import NUMPY_MIN_ENTRIES, Manifest, diff_manifests
+from parallel_walker import parallel_walk
+from pipeline import END_OF_STREAM, Pipeline, PipelineAborted
+from read_scheduler import prefetch, read_order_key
+from scan_cache import ScanCache, list_directory
+from snapshots import (LATEST_LINK_NAME, list_snapshots, new_snapshot_paths, prune_snapshots, prune_versions,
+                       publish_snapshot, remove_partial_snapshots, snapshots_dir_of, version_path)
+from verification import VERIFY_MODES, VERIFY_RETRIES, CopyVerifier, VerificationError
+from version_store import COMPRESSION_ALGORITHMS, VersionCompressor
+
+# Répertoire de l'état persistant par configuration (manifeste de la dernière synchronisation, etc.)
+STATE_DIR = Path.home() / ".synchro" / "state"
+STATE_FORMAT_VERSION = 1
+
+# Cache de parcours partagé par toutes les configurations
+SCAN_CACHE_FILE = STATE_DIR.parent / "scan_cache.db"
+
+# Une mtime de répertoire trop proche du début du parcours n'est pas fiable (granularité des horodatages)
+DIR_MTIME_RACE_WINDOW_NS = 2_000_000_000
+
+# Capacité des files entre étapes du pipeline (lots de répertoires, puis fichiers à copier/valider)
+SCAN_QUEUE_SIZE = 64
+COPY_QUEUE_SIZE = 256
+COMMIT_QUEUE_SIZE = 1024
+
+# Comparaison : attente maximale (secondes) pour regrouper des répertoires parcourus en un seul différentiel
+COMPARE_GROUP_SECONDS = 0.5
+
+# Ordres "inode"/"physical" : nombre de fichiers accumulés avant tri, et avance de la pré-lecture
+READ_BATCH_SIZE = 1000
+PREFETCH_DEPTH = 2
+
+# Source modifiée pendant sa copie : nombre de copies tentées, et première attente (doublée à chaque fois)
+STABLE_COPY_ATTEMPTS = 3
+STABLE_COPY_BACKOFF = 0.5
+
+# Codes de sortie du script : synchronisation complète, erreur fatale, ou terminée avec des fichiers
+# (ou des destinations) non synchronisés
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+EXIT_COMPLETED_WITH_ERRORS = 2
+EXIT_STOPPED = 3
+
+# Pause (SIGUSR1) : intervalle de vérification d'un arrêt demandé pendant l'attente de la reprise (SIGUSR2)
+PAUSE_POLL_SECONDS = 0.5
+
+# Arrêt demandé (SIGTERM) : délai laissé aux copies en cours pour se terminer avant l'arrêt forcé (les
+# fichiers temporaires sont alors supprimés au démarrage de la synchronisation suivante)
+STOP_GRACE_SECONDS = 30
+
+# Signaux de commande (arrêt coopératif, pause, reprise), traités par le thread de contrôle (voir main)
+CONTROL_SIGNALS = {signal.SIGTERM, signal.SIGUSR1, signal.SIGUSR2} if hasattr(signal, "pthread_sigmask") else set()
+
+
+class SyncCancelled(Exception):
+    """Levée entre deux fichiers lorsqu'un arrêt de la synchronisation a été demandé (SIGTERM)."""
+
 
 def create_logger(config_name, log_file_path):
     """
@@ -69,11 +364,34 @@ def create_logger(config_name, log_file_path):
     return logger
 
 
+def replica_state_name(config_name, destination):
+    """
+    Nom de l'état persistant d'une destination supplémentaire, propre à son chemin.
+
+    Args:
+        config_name (str): Le nom de la configuration.
+        destination (str): Chemin de la destination supplémentaire.
+
+    Returns:
+        str: "<config>.<8 premiers caractères du SHA-1 du chemin résolu>".
+    """
+    digest = hashlib.sha1(str(Path(destination).resolve()).encode("utf-8")).hexdigest()
+    return f"{config_name}.{digest[:8]}"
+
+
 class SyncEngine:
     """
     Classe principale pour la synchronisation de fichiers et répertoires.
     """
-    def __init__(self, source, destination, frequency_hours, blacklist_files, blacklist_dirs, config_name, log_file_path):
+    def __init__(self, source, destination, frequency_hours, blacklist_files, blacklist_dirs, config_name, log_file_path,
+                 trust_dir_mtime=False, deep_scan_days=7, scan_workers=0, copy_workers=0, buffer_size=0,
+                 read_order="auto", low_cache=False, segment_workers=0, segment_threshold_mb=1024,
+                 durability="batch", sync_batch_mb=256, sync_batch_seconds=DEFAULT_BATCH_SECONDS,
+                 version_compression="none", compression_level=-1, version_store="copy", chunk_repository=None,
+                 max_cached_versions=2, snapshot_mode=False, dedupe="off", hash_cache_entries=DEFAULT_MAX_ENTRIES,
+                 scan_cache_seconds=0, verify_copies="off", spot_check_days=0, spot_check_mb=1024,
+                 spot_check_sampling="stratified", space_margin_mb=DEFAULT_SPACE_MARGIN // (1024 * 1024),
+                 state_name=None, logger=None):
         """
         Initialise le moteur de synchronisation.
 
@@ -85,15 +403,94 @@ class SyncEngine:
             blacklist_dirs (list): Liste des noms de répertoires à exclure.
             config_name (str): Nom de la configuration (pour le logger).
             log_file_path (Path): Chemin du fichier de log.
+            trust_dir_mtime (bool): Ne pas relire les répertoires dont la mtime est inchangée.
+            deep_scan_days (int): Intervalle (jours) entre deux parcours complets forcés.
+            scan_workers (int): Nombre de threads de parcours de la source (0 : selon le périphérique).
+            copy_workers (int): Nombre de threads de copie (0 : selon les périphériques).
+            buffer_size (int): Taille des tampons de lecture en octets (0 : selon les périphériques).
+            read_order (str): "path", "inode", "physical" ou "auto" (selon le périphérique source).
+            low_cache (bool): Copier sans remplir le cache de pages (posix_fadvise).
+            segment_workers (int): Threads de copie d'un même gros fichier (0 : selon les périphériques).
+            segment_threshold_mb (int): Taille (Mio) à partir de laquelle un fichier est copié par tranches.
+            durability (str): Politique de durabilité : "none", "fsync" ou "batch".
+            sync_batch_mb (int): Politique "batch" : Mio écrits entre deux synchronisations.
+            sync_batch_seconds (int): Politique "batch" : secondes maximales entre deux synchronisations.
+            version_compression (str): Compression des versions du cache : "none", "gzip", "lzma" ou "zlib".
+            compression_level (int): Niveau de compression (-1 : défaut de l'algorithme).
+            version_store (str): Format des versions : "copy" (copie complète) ou "chunks" (dépôt de blocs).
+            chunk_repository (str): Répertoire du dépôt de blocs (par défaut : .cache/chunks).
+            max_cached_versions (int): Versions conservées par fichier (ou instantanés précédents conservés).
+            snapshot_mode (bool): Produire un instantané daté par synchronisation au lieu d'un miroir.
+            dedupe (str): Fichiers identiques de la source : "off", "hardlink" ou "reflink".
+            hash_cache_entries (int): Empreintes conservées dans le cache persistant (0 : pas de cache).
+            scan_cache_seconds (int): Âge maximal des répertoires repris du cache de parcours partagé
+                                      (0 : pas de cache).
+            verify_copies (str): Vérification des copies : "off", "hash" (empreinte calculée pendant la
+                                 copie) ou "reread" (copie relue et comparée à cette empreinte).
+            spot_check_days (int): Contrôle par échantillonnage : délai (jours) en lequel chaque fichier
+                                   de la destination est relu et vérifié (0 : pas de contrôle).
+            spot_check_mb (int): Volume maximal (Mio) relu par le contrôle à chaque exécution (0 : illimité).
+            spot_check_sampling (str): "random" ou "stratified" (réparti entre répertoires de premier niveau).
+            space_margin_mb (int): Espace (Mio) laissé libre sur la destination par les écritures planifiées.
+            state_name (str): Nom de l'état persistant (par défaut : config_name ; voir replica_state_name).
+            logger (logging.Logger): Journal à utiliser (par défaut : créé pour la configuration).
         """
         self.source = Path(source).resolve()
         self.destination = Path(destination).resolve()
         self.frequency_hours = frequency_hours
         self.blacklist_files = blacklist_files
         self.blacklist_dirs = blacklist_dirs
+        self.trust_dir_mtime = trust_dir_mtime
+        self.deep_scan_days = deep_scan_days
+        # Valeurs demandées par la configuration ; résolues selon les périphériques par _configure_io()
+        self.scan_workers = scan_workers
+        self.copy_workers = copy_workers
+        self.buffer_size = buffer_size
+        self.read_order = read_order
+        self.low_cache = low_cache
+        self.segment_workers = segment_workers
+        self.segment_threshold = segment_threshold_mb * 1024 * 1024
+        self.durability = DurabilityPolicy(durability, self.destination, sync_batch_mb * 1024 * 1024,
+                                           sync_batch_seconds)
+        self.version_compression = version_compression
+        self.compression_level = compression_level
+        self.new_versions = [] # Versions créées pendant cette synchronisation (à compresser)
+        self.version_store = version_store
+        self.chunk_repository = Path(chunk_repository) if chunk_repository else self.destination / ".cache" / "chunks"
+        self.chunk_store = None # Ouvert par run_sync en mode "chunks"
+        self.max_cached_versions = max_cached_versions
+        self.snapshot_mode = snapshot_mode
+        self.snapshots_dir = snapshots_dir_of(self.destination)
+        self.previous_snapshot = None # Instantané de référence pour les liens physiques
+        self.snapshot_path = None # Chemin définitif de l'instantané en cours
+        self.target = self.destination # Racine où sont écrits les fichiers (miroir, ou instantané en cours)
+        self.dedupe = dedupe
+        self.duplicates = None # DuplicateIndex de la synchronisation en cours (mode dedupe)
+        self.hash_cache_entries = hash_cache_entries
+        self.hash_cache = None # HashCache chargé par run_sync
+        self.scan_cache_seconds = scan_cache_seconds
+        self.scan_cache = None # ScanCache ouvert par run_sync
+        self.verify_copies = verify_copies
+        self.verifier = None # CopyVerifier de la synchronisation en cours (mode "reread")
+        self.new_digests = {} # Empreintes des fichiers copiés pendant cette synchronisation
+        self.spot_check_days = spot_check_days
+        self.spot_check_mb = spot_check_mb
+        self.spot_check_sampling = spot_check_sampling
+        self.space_margin = space_margin_mb * 1024 * 1024
+        self.budget = None # SpaceBudget de la synchronisation en cours
         self.config_name = config_name
-        self.logger = create_logger(config_name, log_file_path) # Utiliser le chemin direct
+        self.state_name = state_name or config_name
+        self.logger = logger if logger is not None else create_logger(config_name, log_file_path) # Utiliser le chemin direct
         self.cache_dir = self.destination / ".cache"  # Répertoire cache pour les versions précédentes
+        self.state_file = STATE_DIR / f"{self.state_name}.json"  # État persistant de la destination
+        self.running_marker = STATE_DIR / f"{self.state_name}.running"  # Présent pendant une synchronisation
+        self.replicas = [] # Moteurs des destinations supplémentaires, synchronisées dans le même passage
+        self.failure = None # Erreur ayant écarté cette destination pendant la synchronisation en cours
+        self.stop_event = threading.Event() # Arrêt demandé (request_stop), vérifié entre deux fichiers
+        self.resume_event = threading.Event() # Effacé pendant une pause (pause/resume)
+        self.resume_event.set()
+        self._failure_lock = threading.Lock()
+        self.hash_cache_file = STATE_DIR / f"{config_name}.hashes"  # Cache des empreintes de contenu
         self.logger.info(f"SyncEngine initialisé pour config: '{config_name}'")
 
         # Statistiques de synchronisation
@@ -102,6 +499,16 @@ class SyncEngine:
         self.files_modified = 0
         self.files_deleted = 0 # Pourrait être ajouté si la suppression est suivie
         self.dirs_deleted = 0 # Pourrait être ajouté si la suppression est suivie
+        self.files_unchanged = 0 # Fichiers écartés par le différentiel de manifestes
+        self.files_metadata_updated = 0 # Fichiers dont seules les métadonnées ont été reportées
+        self.dirs_scanned = 0 # Répertoires relus (scandir) lors du parcours
+        self.dirs_reused = 0 # Répertoires repris de l'état précédent (mtime inchangée)
+        self.dirs_from_scan_cache = 0 # Répertoires repris du cache de parcours partagé
+        self.deferred = [] # Copies différées (source, destination, action) : source modifiée pendant la copie
+        self.accept_unstable = False # Reprise des copies différées : conserver la copie d'une source qui change encore
+        self.spot_checked = 0 # Fichiers relus par le contrôle par échantillonnage
+        self.spot_check_failures = [] # Fichiers corrompus, manquants ou illisibles trouvés par ce contrôle
+        self.file_errors = [] # Fichiers non synchronisés : {"path", "errno", "error", "class"}
 
         # Pour la progression
         self.total_files_to_process = 0
@@ -121,6 +528,58 @@ class SyncEngine:
             self.dirs_added += 1 # Compter le répertoire de destination comme ajouté
         self.cache_dir.mkdir(parents=True, exist_ok=True) # Créer le répertoire cache
 
+    def _configure_io(self):
+        """
+        Choisit les paramètres d'E/S d'après les périphériques source et destination.
+        Les valeurs fixées par la configuration (non nulles, différentes de "auto") sont conservées.
+        """
+        try:
+            source_device = identify_device(self.source)
+            destination_device = identify_device(self.destination)
+        except OSError as e:
+            self.logger.warning(f"Identification des périphériques impossible ({e}), profil par défaut.")
+            unknown_device = DeviceInfo(None, None, "unknown")
+            settings = choose_io_settings(unknown_device, unknown_device)
+        else:
+            self.logger.info(f"Périphérique source : {source_device} ; destination : {destination_device}")
+            settings = choose_io_settings(source_device, destination_device)
+
+        self.scan_workers = self.scan_workers if self.scan_workers > 0 else settings["scan_workers"]
+        self.copy_workers = self.copy_workers if self.copy_workers > 0 else settings["copy_workers"]
+        self.buffer_size = self.buffer_size if self.buffer_size > 0 else settings["buffer_size"]
+        self.read_order = self.read_order if self.read_order != "auto" else settings["read_order"]
+        self.segment_workers = self.segment_workers if self.segment_workers > 0 else settings["segment_workers"]
+        self.logger.info(f"Paramètres d'E/S : {self.scan_workers} thread(s) de parcours, {self.copy_workers} de copie, "
+                         f"tampon de {self.buffer_size // 1024} Kio, ordre de lecture '{self.read_order}', "
+                         f"{self.segment_workers} thread(s) par fichier au-delà de "
+                         f"{self.segment_threshold // (1024 * 1024)} Mio.")
+
+    def _files_identical(self, first_path, second_path):
+        """
+        Compare le contenu de deux fichiers : par empreintes si le cache d'empreintes est actif (aucune
+        lecture pour un fichier inchangé depuis son dernier hachage), sinon par blocs de
+        self.buffer_size octets.
+
+        Returns:
+            bool: True si les deux fichiers ont le même contenu.
+        """
+        if os.stat(first_path).st_size != os.stat(second_path).st_size:
+            return False
+        try:
+            if self.hash_cache is not None:
+                return self.hash_cache.digest(first_path) == self.hash_cache.digest(second_path)
+            with open(first_path, 'rb') as first, open(second_path, 'rb') as second:
+                while True:
+                    first_block = first.read(self.buffer_size)
+                    if first_block != second.read(self.buffer_size):
+                        return False
+                    if not first_block:
+                        return True
+        finally:
+            if self.low_cache:
+                drop_from_cache(first_path)
+                drop_from_cache(second_path)
+
     def _is_excluded_file(self, file_path):
         """
         Vérifie si un fichier doit être exclu de la synchronisation.
@@ -152,81 +611,1011 @@ class SyncEngine:
         """
         Copie un fichier de la source vers la destination.
         Si le fichier existe déjà dans la destination, il est versionné.
+        Peut être appelée depuis plusieurs threads de copie : ne modifie aucun compteur.
 
         Args:
             src_file_path (Path): Chemin du fichier source.
             dest_file_path (Path): Chemin du fichier de destination.
+
+        Returns:
+            str: "added", "modified", "metadata", "identical", ou "deferred" si la source a changé
+                 pendant chaque tentative de copie (voir _copy_deferred).
+
+        Raises:
+            Exception: L'erreur de copie, une fois les erreurs transitoires réessayées (_retry_transient).
+        """
+        try:
+            result = self._retry_transient(self._prepare_copy, src_file_path, dest_file_path)
+        except SourceChangedError:
+            return self._defer_copy(src_file_path, dest_file_path, "metadata") # Recopie d'un fichier relié
+        if result not in ("added", "modified"):
+            return result
+        try:
+            if self.duplicates is not None:
+                self._retry_transient(self.duplicates.copy_or_link, src_file_path, dest_file_path,
+                                      self._copy_to_destination)
+            else:
+                self._retry_transient(self._copy_to_destination, src_file_path, dest_file_path)
+            self._log_copy(src_file_path, dest_file_path, result)
+            return result
+        except SourceChangedError:
+            return self._defer_copy(src_file_path, dest_file_path, result)
+        except Exception as e:
+            self.logger.error(f"Erreur lors de la copie du fichier : {e}")
+            raise  # Relaisser l'exception pour être gérée plus haut
+
+    def _retry_transient(self, function, *args):
+        """
+        Appelle une opération d'entrée/sortie sur un fichier en la réessayant, après une attente
+        croissante (retry_delays), tant qu'elle échoue sur une erreur transitoire (classify_error).
+
+        Raises:
+            OSError: L'erreur non transitoire, ou la dernière erreur transitoire une fois les tentatives
+                     épuisées. SourceChangedError et VerificationError, qui ont leurs propres tentatives,
+                     ne sont pas réessayées.
+        """
+        for delay in retry_delays() + [None]:
+            try:
+                return function(*args)
+            except (SourceChangedError, VerificationError):
+                raise
+            except OSError as e:
+                if delay is None or classify_error(e) != "transient":
+                    raise
+                self.logger.warning(f"Erreur transitoire, nouvelle tentative dans {delay:g} s : {e}")
+                time.sleep(delay)
+
+    def _prepare_copy(self, src_file_path, dest_file_path):
+        """
+        Prépare la copie d'un fichier : compare la source à la destination existante et en sauvegarde
+        l'ancienne version si elle diffère. Les données ne sont pas copiées.
+
+        Returns:
+            str: "added" ou "modified" (copie à faire), "metadata" ou "identical" (rien à copier).
         """
-        file_action = "copié/mis à jour" # Default action
         if dest_file_path.exists():
             # Comparer les fichiers pour voir s'ils sont différents
-            if not filecmp.cmp(src_file_path, dest_file_path, shallow=False):
+            if not self._files_identical(src_file_path, dest_file_path):
                 # Le fichier de destination existe et est différent du fichier source
                 self.logger.info(f"Fichier modifié : {src_file_path}. Versionnement de l'ancienne version.")
                 timestamp = int(time.time()) # Get timestamp
-                versioned_path = self.cache_dir / f"{dest_file_path.name}.{timestamp}"
+                versioned_path = version_path(self.cache_dir, dest_file_path.relative_to(self.target), timestamp)
                 try:
-                    shutil.copy2(dest_file_path, versioned_path)
+                    versioned_path.parent.mkdir(parents=True, exist_ok=True)
+                    if self.chunk_store is not None:
+                        # Seuls les blocs absents du dépôt sont écrits ; la recette décrit la version
+                        versioned_path = versioned_path.with_name(versioned_path.name + RECIPE_SUFFIX)
+                        self.chunk_store.save_version(dest_file_path, versioned_path)
+                    else:
+                        size = copy_file(dest_file_path, versioned_path, self.buffer_size, self.low_cache,
+                                         self.segment_workers, self.segment_threshold,
+                                         fsync=self.durability.fsync_files)
+                        self.durability.file_committed(size)
+                        self.new_versions.append(versioned_path)
                     self.logger.info(f"Ancienne version sauvegardée : {dest_file_path} -> {versioned_path}")
-                    self.files_modified += 1 # Incrémenter le compteur de fichiers modifiés
-                    file_action = "modifié"
+                    return "modified"
                 except Exception as e:
                     self.logger.error(f"Erreur lors du versionnement du fichier : {e}")
                     raise  # Relaisser l'exception pour être gérée plus haut
-            else:
-                # Fichier identique, pas besoin de copier ou versionner
-                self.logger.info(f"Fichier identique, ignoré : {src_file_path}")
-                self.processed_files_count += 1 # Compter quand même comme traité pour la progression
-                self._report_progress()
-                return # Sortir si le fichier est identique
+            # Contenu identique : seules les métadonnées (touch, chmod) peuvent différer
+            if self._update_metadata(src_file_path, dest_file_path):
+                return "metadata"
+            self.logger.info(f"Fichier identique, ignoré : {src_file_path}")
+            return "identical"
+        if self.previous_snapshot is not None:
+            # Mode instantanés : l'ancienne version reste dans l'instantané précédent
+            if (self.previous_snapshot / dest_file_path.relative_to(self.target)).exists():
+                return "modified"
+        return "added"
+
+    def _log_copy(self, src_file_path, dest_file_path, result):
+        """Journalise une copie terminée ("added" ou "modified")."""
+        file_action = "modifié" if result == "modified" else "copié/mis à jour"
+        self.logger.info(f"Fichier {file_action} : {src_file_path} -> {dest_file_path}")
+
+    def _update_metadata(self, src_file_path, dest_file_path):
+        """
+        Reporte les métadonnées du fichier source sur une destination au contenu identique, sans copie.
+        Une destination partagée par lien physique (doublon relié) est recopiée pour ne pas modifier
+        les autres chemins du même inode.
+
+        Returns:
+            bool: True si des métadonnées ont été mises à jour, False si elles étaient déjà identiques.
+        """
+        src_st = os.stat(src_file_path)
+        dest_st = os.stat(dest_file_path)
+        if not metadata_differs(src_st, dest_st):
+            return False
+        if dest_st.st_nlink > 1:
+            self._copy_to_destination(src_file_path, dest_file_path)
         else:
-            self.files_added += 1 # Incrémenter le compteur de fichiers ajoutés
+            apply_metadata(src_st, dest_file_path)
+        self.logger.info(f"Métadonnées mises à jour : {src_file_path} -> {dest_file_path}")
+        return True
 
+    def _defer_copy(self, src_file_path, dest_file_path, action):
+        """
+        Diffère la copie d'un fichier source qui change pendant sa copie (reprise par _copy_deferred).
+
+        Returns:
+            str: "deferred".
+        """
+        self.logger.warning(f"Fichier source en cours de modification, copie différée : {src_file_path}")
+        self.deferred.append((src_file_path, dest_file_path, action))
+        return "deferred"
+
+    def _record_file_error(self, src_file_path, error, label="Fichier ignoré"):
+        """
+        Enregistre un fichier dont la copie a échoué : il est ignoré pour cette synchronisation, retiré
+        du manifeste enregistré (donc repris à la suivante) et signalé dans le rapport d'erreurs.
+        """
+        error_class = classify_error(error)
+        reason = "erreur transitoire persistante" if error_class == "transient" else "erreur permanente"
+        self.logger.error(f"{label} ({reason}) : {src_file_path} ({error})")
+        with self._failure_lock:
+            self.file_errors.append({"path": src_file_path.relative_to(self.source).as_posix(),
+                                     "errno": error.errno, "error": str(error), "class": error_class})
+
+    def _record_scan_error(self, src_path, error):
+        """
+        Enregistre, pour chaque destination, un répertoire ou un fichier source illisible lors du parcours :
+        son contenu est conservé en destination tel qu'à la synchronisation précédente, et il est signalé
+        dans le rapport d'erreurs.
+        """
+        for engine in [self] + self.replicas:
+            engine._record_file_error(src_path, error, "Entrée source illisible, conservée")
+
+    def _copy_to_destination(self, src_file_path, dest_file_path):
+        """
+        Copie un fichier source vers la destination, en s'assurant que la source n'a pas changé pendant
+        la copie (taille et mtime relues avant et après) : sinon, la copie est refaite après une attente
+        croissante, STABLE_COPY_ATTEMPTS fois au plus.
+
+        Raises:
+            SourceChangedError: La source a changé pendant chaque tentative (hors reprise des copies
+                                différées, où la dernière copie est conservée).
+            VerificationError: La copie diffère toujours après VERIFY_RETRIES nouvelles tentatives.
+        """
+        for attempt in range(1, STABLE_COPY_ATTEMPTS + 1):
+            before = os.stat(src_file_path)
+            self._copy_data(src_file_path, dest_file_path)
+            if source_unchanged(before, os.stat(src_file_path)):
+                return
+            if attempt < STABLE_COPY_ATTEMPTS:
+                self.logger.info(f"Fichier source modifié pendant la copie (tentative {attempt}), nouvelle copie : "
+                                 f"{src_file_path}")
+                time.sleep(STABLE_COPY_BACKOFF * 2 ** (attempt - 1))
+        if not self.accept_unstable:
+            raise SourceChangedError(src_file_path)
+        self.logger.warning(f"Fichier source toujours en cours de modification, dernière copie conservée : "
+                            f"{src_file_path}")
+
+    def _copy_data(self, src_file_path, dest_file_path):
+        """
+        Copie le contenu d'un fichier source vers la destination selon les réglages d'E/S et de durabilité.
+        Avec la vérification des copies, l'empreinte des données est calculée pendant la copie et, en
+        mode "reread", comparée à celle de la copie relue ; un écart entraîne une nouvelle copie.
+
+        Raises:
+            VerificationError: La copie diffère toujours après VERIFY_RETRIES nouvelles tentatives.
+        """
+        if self.verify_copies == "off":
+            size = copy_file(src_file_path, dest_file_path, self.buffer_size, self.low_cache,
+                             self.segment_workers, self.segment_threshold, fsync=self.durability.fsync_files)
+            self.durability.file_committed(size)
+            return
+        for attempt in range(1, VERIFY_RETRIES + 2):
+            hasher = hashlib.sha256()
+            size = copy_file(src_file_path, dest_file_path, self.buffer_size, self.low_cache,
+                             fsync=self.durability.fsync_files, hasher=hasher)
+            self.durability.file_committed(size)
+            if self._copy_verified(dest_file_path, hasher.digest(), attempt):
+                return
+        raise VerificationError(dest_file_path, attempt)
+
+    def _copy_verified(self, dest_file_path, digest, attempt=1):
+        """
+        Vérifie (mode "reread") une copie d'après l'empreinte calculée pendant la copie, et enregistre
+        cette empreinte pour le manifeste si la copie est correcte.
+
+        Returns:
+            bool: True si la copie est correcte (ou n'a pas à être relue).
+        """
+        if self.verifier is not None and not self.verifier.verify(dest_file_path, digest):
+            self.logger.warning(f"Copie différente de la source à la relecture (tentative {attempt}) : "
+                                f"{dest_file_path}")
+            return False
+        rel_path = dest_file_path.relative_to(self.target).as_posix()
+        self.new_digests[rel_path] = digest.hex()
+        if self.hash_cache is not None:
+            self.hash_cache.store(os.stat(dest_file_path), digest)
+        return True
+
+    def _load_state(self):
+        """
+        Charge l'état persistant de la configuration.
+
+        Returns:
+            dict: L'état enregistré, ou un dictionnaire vide s'il est absent, illisible,
+                  ou s'il concerne d'autres répertoires source/destination.
+        """
+        if not self.state_file.exists():
+            return {}
         try:
-            shutil.copy2(src_file_path, dest_file_path)
-            self.logger.info(f"Fichier {file_action} : {src_file_path} -> {dest_file_path}")
-            self.processed_files_count += 1
-            self._report_progress()
-        except Exception as e:
-            self.logger.error(f"Erreur lors de la copie du fichier : {e}")
-            raise  # Relaisser l'exception pour être gérée plus haut
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"État de la configuration illisible, ignoré : {self.state_file} ({e})")
+            return {}
+        if (state.get("format") != STATE_FORMAT_VERSION
+                or state.get("source") != str(self.source)
+                or state.get("destination") != str(self.destination)):
+            self.logger.info("État enregistré obsolète (format ou chemins différents), ignoré.")
+            return {}
+        return state
 
-    def _sync_directory(self, src_dir, dest_dir):
+    def _save_state(self, state):
         """
-        Synchronise un répertoire de la source vers la destination.
-        Gère la création de répertoires, la copie de fichiers et la suppression des fichiers obsolètes.
+        Enregistre l'état de la configuration de façon atomique (fichier temporaire + renommage).
 
         Args:
-            src_dir (Path): Chemin du répertoire source.
-            dest_dir (Path): Chemin du répertoire de destination.
+            state (dict): L'état à enregistrer.
         """
-        if self._is_excluded_dir(src_dir):
-            self.logger.info(f"Répertoire exclu : {src_dir}")
-            return
+        state = dict(state, format=STATE_FORMAT_VERSION, source=str(self.source), destination=str(self.destination))
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_file.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            if self.durability.mode != "none":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.state_file)
+
+    def _prepare_snapshot(self):
+        """
+        Mode instantanés : supprime les instantanés partiels, choisit l'instantané de référence
+        (le plus récent) et crée le répertoire de construction du nouvel instantané.
+        """
+        removed = remove_partial_snapshots(self.snapshots_dir)
+        if removed:
+            self.logger.info(f"{removed} instantané(s) partiel(s) supprimé(s).")
+        snapshots = list_snapshots(self.snapshots_dir)
+        self.previous_snapshot = snapshots[-1] if snapshots else None
+        self.target, self.snapshot_path = new_snapshot_paths(self.snapshots_dir)
+        self.target.mkdir(parents=True)
+        self.logger.info(f"Nouvel instantané : {self.snapshot_path.name} "
+                         f"(référence : {self.previous_snapshot.name if self.previous_snapshot else 'aucune'}).")
+
+    def _remove_stale_temporaries(self):
+        """
+        Supprime de la destination les fichiers temporaires laissés par une synchronisation interrompue.
+        """
+        removed = 0
+        for directory, _, file_names in os.walk(self.destination):
+            for file_name in file_names:
+                if file_name.endswith(TEMP_SUFFIX):
+                    try:
+                        os.remove(os.path.join(directory, file_name))
+                        removed += 1
+                    except OSError as e:
+                        self.logger.warning(f"Fichier temporaire non supprimé : {file_name} ({e})")
+        self.logger.info(f"Synchronisation précédente interrompue : {removed} fichier(s) temporaire(s) supprimé(s).")
+
+    def _needs_deep_scan(self, previous_state):
+        """
+        Indique si le parcours doit relire tous les répertoires.
+
+        Args:
+            previous_state (dict): L'état de la dernière synchronisation réussie.
+
+        Returns:
+            bool: True si le parcours incrémental n'est pas activé ou pas sûr.
+        """
+        if not self.trust_dir_mtime or "dir_mtimes" not in previous_state or "manifest" not in previous_state:
+            return True
+        if previous_state.get("blacklist") != [sorted(self.blacklist_files), sorted(self.blacklist_dirs)]:
+            self.logger.info("Blacklist modifiée depuis la dernière synchronisation : parcours complet.")
+            return True
+        last_deep_scan = previous_state.get("last_deep_scan", 0)
+        if time.time() - last_deep_scan >= self.deep_scan_days * 24 * 3600:
+            self.logger.info(f"Dernier parcours complet il y a plus de {self.deep_scan_days} jour(s) : parcours complet.")
+            return True
+        return False
+
+    def _scan_source(self, previous_state=None, deep_scan=True, previous_files=None, on_directory=None):
+        """
+        Parcourt la source une seule fois en respectant la blacklist.
+        En mode incrémental, un répertoire dont la mtime est celle enregistrée n'est pas relu :
+        ses fichiers et sous-répertoires sont repris de l'état précédent.
+
+        Args:
+            previous_state (dict): L'état de la dernière synchronisation réussie.
+            deep_scan (bool): Relire tous les répertoires, sans se fier aux mtimes.
+            previous_files (dict): Lignes du manifeste précédent groupées par répertoire
+                                   (Manifest.rows_by_directory), calculées ici si absentes.
+            on_directory (callable): Appelée depuis les threads de parcours avec
+                                     (répertoire relatif, lignes de fichiers, sous-répertoires relatifs)
+                                     pour chaque répertoire traité.
+
+        Un répertoire ou une entrée illisible est signalé (_record_scan_error) sans interrompre le parcours :
+        son contenu est repris de l'état précédent, pour n'être ni copié ni supprimé de la destination.
+
+        Returns:
+            tuple: (Manifest des fichiers, liste triée des répertoires relatifs,
+                    dictionnaire {répertoire relatif: mtime_ns}, liste triée des entrées illisibles).
+        """
+        previous_state = previous_state or {}
+        previous_mtimes = {} if deep_scan else previous_state.get("dir_mtimes", {})
+        previous_subdirs = {}
+        if previous_files is None:
+            previous_files = (Manifest.from_dict(previous_state["manifest"]).rows_by_directory()
+                              if "manifest" in previous_state else {})
+        for rel_dir in previous_state.get("dirs", []):
+            parent, _, _ = rel_dir.rpartition("/")
+            previous_subdirs.setdefault(parent, []).append(rel_dir)
+
+        file_rows = []
+        dir_paths = []
+        dir_mtimes = {}
+        unreadable = []
+        lock = threading.Lock()
+        scan_start_ns = time.time_ns()
+
+        def read_directory(directory):
+            errors = []
+            listing = list_directory(directory, on_error=lambda path, error: errors.append((Path(path), error)))
+            return listing, errors
 
-        # Créer le répertoire de destination s'il n'existe pas
-        if not dest_dir.exists():
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            self.dirs_added += 1 # Compter le répertoire comme ajouté
-            self.logger.info(f"Répertoire créé : {dest_dir}")
+        def keep_previous(rel_dir, rows, children, stat_subdirs):
+            # Contenu du répertoire d'après l'état précédent. Sous un répertoire illisible (stat_subdirs
+            # False), les sous-répertoires sont repris sans être lus (dir_stat None).
+            for row in previous_files.get(rel_dir, []):
+                if not self._is_excluded_file(Path(row[0])):
+                    rows.append(row)
+            for rel_subdir in previous_subdirs.get(rel_dir, []):
+                subdir_stat = None
+                if stat_subdirs:
+                    try:
+                        subdir_stat = os.stat(self.source / rel_subdir)
+                    except FileNotFoundError:
+                        continue
+                    except OSError as e:
+                        self._record_scan_error(self.source / rel_subdir, e)
+                        with lock:
+                            unreadable.append(rel_subdir)
+                children.append((self.source / rel_subdir, rel_subdir, subdir_stat))
 
+        def visit(item):
+            directory, rel_dir, dir_stat = item
+            rows = []
+            children = []
+            mtime_ns = dir_stat.st_mtime_ns if dir_stat is not None else None
 
-        # Parcourir les fichiers et répertoires dans le répertoire source
-        for entry in os.scandir(src_dir):
-            src_path = Path(entry.path)
-            dest_path = dest_dir / entry.name
+            cached = False
+            readable = dir_stat is not None # Sinon, contenu dans un répertoire illisible
+            if not readable or previous_mtimes.get(rel_dir) == mtime_ns:
+                reused = True
+                keep_previous(rel_dir, rows, children, readable)
+            else:
+                reused = False
+                prefix = f"{rel_dir}/" if rel_dir else ""
+                listing = self.scan_cache.lookup(directory, dir_stat) if self.scan_cache is not None else None
+                cached = listing is not None
+                entry_errors = []
+                if not cached:
+                    try:
+                        listing, entry_errors = self._retry_transient(read_directory, directory)
+                    except FileNotFoundError:
+                        listing = [] # Supprimé depuis la lecture de son parent : son contenu est supprimé
+                        readable = False
+                    except OSError as e:
+                        # Répertoire illisible : son contenu précédent est conservé (ni copié, ni supprimé)
+                        self._record_scan_error(Path(directory), e)
+                        with lock:
+                            unreadable.append(rel_dir)
+                        readable = False
+                        listing = []
+                        keep_previous(rel_dir, rows, children, False)
+                    if self.scan_cache is not None and readable and not entry_errors:
+                        self.scan_cache.store(directory, dir_stat, listing)
+                for entry_path, error in entry_errors:
+                    rel_path = f"{prefix}{entry_path.name}"
+                    if isinstance(error, FileNotFoundError):
+                        continue # Supprimé depuis la lecture du répertoire
+                    # Entrée illisible : conservée telle qu'à la synchronisation précédente
+                    self._record_scan_error(entry_path, error)
+                    with lock:
+                        unreadable.append(rel_path)
+                    rows.extend(row for row in previous_files.get(rel_dir, []) if row[0] == rel_path)
+                    if rel_path in previous_subdirs.get(rel_dir, []):
+                        children.append((entry_path, rel_path, None))
+                for name, kind, st in listing:
+                    entry_path = Path(directory) / name
+                    rel_path = f"{prefix}{name}"
+                    if kind == "file":
+                        if not self._is_excluded_file(entry_path):
+                            rows.append((rel_path, st.st_size, st.st_mtime_ns, st.st_mode, st.st_ino, st.st_dev,
+                                         st.st_uid, st.st_gid))
+                        else:
+                            self.logger.info(f"Fichier exclu : {entry_path}")
+                    elif kind == "dir":
+                        if self._is_excluded_dir(entry_path):
+                            self.logger.info(f"Répertoire exclu : {entry_path}")
+                            continue
+                        children.append((os.fspath(entry_path), rel_path, st))
+                    else:
+                        self.logger.warning(f"Entrée ignorée (ni fichier ni répertoire) : {entry_path}")
 
-            if entry.is_file():
-                if not self._is_excluded_file(src_path):
-                    self._copy_file_and_version(src_path, dest_path)
+            with lock:
+                # Une mtime trop récente n'est pas enregistrée : le répertoire sera relu la prochaine fois
+                if readable and scan_start_ns - mtime_ns > DIR_MTIME_RACE_WINDOW_NS:
+                    dir_mtimes[rel_dir] = mtime_ns
+                if reused:
+                    self.dirs_reused += 1
+                elif cached:
+                    self.dirs_from_scan_cache += 1
                 else:
-                    self.logger.info(f"Fichier exclu : {src_path}")
-            elif entry.is_dir():
-                self._sync_directory(src_path, dest_path) # Appel récursif
+                    self.dirs_scanned += 1
+                file_rows.extend(rows)
+                dir_paths.extend(child[1] for child in children)
+            if on_directory is not None:
+                on_directory(rel_dir, rows, [child[1] for child in children])
+            return children
+
+        parallel_walk((self.source, "", os.stat(self.source)), visit, self.scan_workers)
+        dir_paths.sort()
+        return Manifest.from_rows(file_rows), dir_paths, dir_mtimes, sorted(unreadable)
+
+    def _scan_stage(self, pipeline, scan_queue, previous_state, previous_files, deep_scan, result):
+        """
+        Étape de parcours : transmet chaque répertoire parcouru à l'étape de comparaison.
+        Le manifeste complet est déposé dans 'result' à la fin du parcours.
+        """
+        def on_directory(rel_dir, rows, child_dirs):
+            self._check_stop()
+            pipeline.put(scan_queue, (rel_dir, rows, child_dirs))
+
+        manifest, dir_paths, dir_mtimes, unreadable = self._scan_source(previous_state, deep_scan, previous_files,
+                                                                        on_directory)
+        result.update(manifest=manifest, dirs=dir_paths, dir_mtimes=dir_mtimes, unreadable=unreadable)
+        pipeline.put(scan_queue, END_OF_STREAM)
+
+    def _compare_stage(self, pipeline, scan_queue, copy_queue, commit_queue, engines):
+        """
+        Étape de comparaison : les lots (un répertoire chacun) sont regroupés jusqu'à NUMPY_MIN_ENTRIES
+        entrées (courantes et précédentes), ou pendant COMPARE_GROUP_SECONDS au plus, puis comparés ensemble
+        à l'état de chaque destination (_compare_batch) : le différentiel emprunte ainsi le chemin vectorisé
+        sans que les copies attendent un parcours lent. Un fichier à copier part une seule fois vers les
+        threads de copie, avec la liste des destinations qui en ont besoin ; le reste part vers la validation.
+
+        Args:
+            engines (list): Moteurs des destinations synchronisées (le premier conduit le pipeline).
+        """
+        pending_reads = [] # (chemin relatif, inode, destinations) en attente de tri (ordres "inode" et "physical")
+
+        def flush_pending_reads():
+            pending_reads.sort(key=lambda item: read_order_key(self.read_order, self.source / item[0], item[1]))
+            for rel_path, _, indices in pending_reads:
+                pipeline.put(copy_queue, (rel_path, indices))
+            pending_reads.clear()
+
+        finished = False
+        while not finished:
+            batches = [pipeline.get(scan_queue)]
+            entries = 0
+            group_deadline = time.monotonic() + COMPARE_GROUP_SECONDS
+            while True:
+                if batches[-1] is END_OF_STREAM:
+                    batches.pop()
+                    finished = True
+                    break
+                rel_dir, rows, _ = batches[-1]
+                entries += len(rows) + len(self.previous_files.get(rel_dir, []))
+                if entries >= NUMPY_MIN_ENTRIES:
+                    break
+                batch = pipeline.poll(scan_queue, group_deadline - time.monotonic())
+                if batch is None:
+                    break # Parcours lent : ne pas retarder davantage les copies
+                batches.append(batch)
+            if not batches:
+                continue
+            self._check_stop()
+            needed = {} # Chemin relatif -> indices des destinations où le copier
+            for index, engine in enumerate(engines):
+                if engine.failure is not None:
+                    continue
+                try:
+                    to_copy = engine._compare_batch(pipeline, commit_queue, index, batches)
+                except PipelineAborted:
+                    raise
+                except Exception as e:
+                    self._destination_failed(engines, index, e)
+                    continue
+                for rel_path in to_copy:
+                    needed.setdefault(rel_path, []).append(index)
+            if self.read_order in ("inode", "physical"):
+                inodes = {row[0]: row[4] for _, rows, _ in batches for row in rows}
+                pending_reads.extend((rel_path, inodes[rel_path], indices) for rel_path, indices in needed.items())
+                if len(pending_reads) >= READ_BATCH_SIZE:
+                    flush_pending_reads()
             else:
-                self.logger.warning(f"Entrée ignorée (ni fichier ni répertoire) : {src_path}")
+                for job in needed.items():
+                    pipeline.put(copy_queue, job)
+
+        flush_pending_reads()
+        for index, engine in enumerate(engines):
+            counts = engine.compare_result["counts"]
+            pipeline.put(commit_queue, ("total", index, counts["added"] + counts["changed"] + counts["metadata"]
+                                        + counts["unchanged"]))
+        for _ in range(self.copy_workers):
+            pipeline.put(copy_queue, END_OF_STREAM)
+
+    def _compare_batch(self, pipeline, commit_queue, index, batches):
+        """
+        Compare des lots (un répertoire chacun) à l'état de cette destination : crée les nouveaux
+        sous-répertoires et calcule en une fois le différentiel avec les entrées précédentes des mêmes
+        répertoires.
+
+        Args:
+            index (int): Indice de cette destination dans les messages de validation.
+            batches (list): Lots (répertoire relatif, lignes du manifeste courant, sous-répertoires relatifs),
+                            dans l'ordre du parcours.
+
+        Returns:
+            list: Fichiers relatifs ajoutés ou modifiés, à copier vers cette destination.
+        """
+        counts = self.compare_result["counts"]
+
+        # Les lots d'un répertoire arrivent avant ceux de ses sous-répertoires : les créer ici
+        # garantit que le répertoire parent existe avant toute copie de fichier qu'il contient.
+        # En mode instantanés, chaque répertoire est recréé dans le nouvel instantané.
+        for rel_subdir in (rel_subdir for _, _, child_dirs in batches for rel_subdir in child_dirs):
+            is_new = self.previous_dirs is None or rel_subdir not in self.previous_dirs
+            if not is_new and not self.snapshot_mode:
+                continue
+            dest_dir = self.target / rel_subdir
+            if not dest_dir.exists():
+                dest_dir.mkdir(parents=True, exist_ok=True)
+                if is_new:
+                    self.logger.info(f"Répertoire créé : {dest_dir}")
+                    pipeline.put(commit_queue, ("dir_added", index, rel_subdir))
+
+        rows = [row for _, batch_rows, _ in batches for row in batch_rows]
+        previous_rows = [row for rel_dir, _, _ in batches for row in self.previous_files.get(rel_dir, [])]
+        diff = diff_manifests(Manifest.from_rows(previous_rows), Manifest.from_rows(rows))
+        to_copy = diff.added + diff.changed
+        unchanged_count = len(diff.unchanged)
+        if self.snapshot_mode:
+            to_copy += diff.metadata # Un lien vers l'instantané précédent partagerait ses métadonnées
+        elif diff.metadata:
+            updated, missing = self._apply_metadata_changes(diff.metadata)
+            unchanged_count += len(diff.metadata) - updated - len(missing)
+            to_copy += missing
+            if updated:
+                pipeline.put(commit_queue, ("metadata", index, updated))
+        if self.previous_snapshot is not None:
+            unchanged_count, to_copy = self._link_from_previous_snapshot(diff.unchanged, to_copy, rows,
+                                                                         self.previous_dirs is None)
+        self._reserve_space(self.budget, to_copy, rows, previous_rows,
+                            self.previous_dirs is None and not self.snapshot_mode)
+        if unchanged_count:
+            pipeline.put(commit_queue, ("unchanged", index, unchanged_count))
+        self.compare_result["deleted_files"].extend(diff.deleted)
+        for name, paths in (("added", diff.added), ("changed", diff.changed), ("metadata", diff.metadata),
+                            ("unchanged", diff.unchanged), ("deleted", diff.deleted)):
+            counts[name] += len(paths)
+        return to_copy
+
+    def _apply_metadata_changes(self, rel_paths):
+        """
+        Mode miroir : reporte sur la destination les permissions et le propriétaire des fichiers dont
+        seules les métadonnées ont changé d'après le manifeste, sans lire ni écrire de données.
+
+        Args:
+            rel_paths (list): Fichiers relatifs de la catégorie "metadata" du différentiel.
+
+        Returns:
+            tuple: (nombre de fichiers mis à jour, fichiers absents de la destination à copier).
+        """
+        updated = 0
+        missing = []
+        for rel_path in rel_paths:
+            try:
+                if self._update_metadata(self.source / rel_path, self.target / rel_path):
+                    updated += 1
+            except FileNotFoundError:
+                missing.append(rel_path)
+        return updated, missing
 
-    def _cleanup_obsolete(self, dest_dir, source_files, source_dirs):
+    def _link_from_previous_snapshot(self, unchanged, to_copy, rows, compare_previous):
+        """
+        Mode instantanés : crée dans le nouvel instantané un lien physique vers l'instantané précédent
+        pour chaque fichier inchangé. Sans manifeste précédent, un fichier candidat à la copie est aussi
+        lié si l'instantané précédent en contient un de même taille et de même mtime.
+
+        Args:
+            unchanged (list): Fichiers relatifs inchangés d'après le manifeste.
+            to_copy (list): Fichiers relatifs ajoutés ou modifiés.
+            rows (list): Lignes du manifeste courant du lot.
+            compare_previous (bool): Pas de manifeste précédent : comparer à l'instantané précédent.
+
+        Returns:
+            tuple: (nombre de fichiers liés, fichiers restant à copier).
+        """
+        linked = 0
+        still_to_copy = []
+        candidates = [(rel_path, True) for rel_path in unchanged]
+        if compare_previous:
+            rows_by_path = {row[0]: row for row in rows}
+            for rel_path in to_copy:
+                try:
+                    st = os.stat(self.previous_snapshot / rel_path)
+                except FileNotFoundError:
+                    still_to_copy.append(rel_path)
+                    continue
+                row = rows_by_path[rel_path]
+                candidates.append((rel_path, st.st_size == row[1] and st.st_mtime_ns == row[2]))
+        else:
+            still_to_copy.extend(to_copy)
+        for rel_path, same in candidates:
+            if not same:
+                still_to_copy.append(rel_path)
+                continue
+            try:
+                os.link(self.previous_snapshot / rel_path, self.target / rel_path)
+                linked += 1
+            except OSError as e:
+                # Fichier absent de l'instantané précédent, nombre maximal de liens atteint... : copie
+                self.logger.info(f"Lien impossible ({e.strerror}), copie : {self.source / rel_path}")
+                still_to_copy.append(rel_path)
+        return linked, still_to_copy
+
+    def _reserve_space(self, budget, to_copy, rows, previous_rows, compare_destination):
+        """
+        Impute au plan d'espace les écritures d'un lot : la copie de chaque fichier et, pour un fichier
+        modifié, la version précédente sauvegardée dans le cache.
+
+        Args:
+            budget (SpaceBudget): Espace libre restant de la destination.
+            to_copy (list): Fichiers relatifs ajoutés ou modifiés du lot.
+            rows (list): Lignes du manifeste courant du lot.
+            previous_rows (list): Lignes du manifeste précédent du même répertoire.
+            compare_destination (bool): Pas de manifeste précédent : la taille de la version éventuelle
+                                        est lue sur la destination.
+
+        Raises:
+            InsufficientSpaceError: Si le plan dépasse l'espace libre de la destination.
+        """
+        sizes = {row[0]: row[1] for row in rows}
+        previous_sizes = {row[0]: row[1] for row in previous_rows}
+        for rel_path in to_copy:
+            size = sizes[rel_path]
+            # En mode instantanés, l'ancienne version reste dans l'instantané précédent : rien à sauvegarder
+            version_size = 0 if self.snapshot_mode else previous_sizes.get(rel_path, 0)
+            if compare_destination:
+                try:
+                    dest_size = os.stat(self.target / rel_path).st_size
+                except FileNotFoundError:
+                    dest_size = None
+                if dest_size == size:
+                    continue # Vraisemblablement identique (le contenu départage) : aucune écriture prévue
+                version_size = dest_size or 0
+            budget.reserve(size + version_size, self.source / rel_path)
+
+    def _prefetch_stage(self, pipeline, read_queue, copy_queue):
+        """
+        Étape de pré-lecture : demande au noyau de charger chaque fichier avant de le transmettre
+        aux threads de copie. La file de copie étant courte (PREFETCH_DEPTH), la pré-lecture garde
+        quelques fichiers d'avance sur la copie.
+        """
+        copiers_pending = self.copy_workers
+        while copiers_pending:
+            job = pipeline.get(read_queue)
+            if job is END_OF_STREAM:
+                copiers_pending -= 1
+            else:
+                self._check_stop()
+                prefetch(self.source / job[0])
+            pipeline.put(copy_queue, job)
+
+    def _copy_stage(self, pipeline, copy_queue, commit_queue, engines):
+        """
+        Étape de copie : copie (et versionne) les fichiers reçus vers leurs destinations, puis transmet
+        l'action de chaque destination à la validation.
+        """
+        while True:
+            job = pipeline.get(copy_queue)
+            if job is END_OF_STREAM:
+                break
+            self._check_stop()
+            rel_path, indices = job
+            indices = [index for index in indices if engines[index].failure is None]
+            for index, action in self._copy_to_destinations(engines, rel_path, indices):
+                pipeline.put(commit_queue, ("file", index, action))
+        pipeline.put(commit_queue, END_OF_STREAM)
+
+    def _copy_to_destinations(self, engines, rel_path, indices):
+        """
+        Copie un fichier vers une ou plusieurs destinations. Vers plusieurs destinations, chacune
+        versionne d'abord sa copie existante, puis la source est lue une seule fois et écrite vers
+        toutes celles qui en ont besoin (copy_file_to_many). Avec la déduplication, chaque destination
+        copie (ou relie) le fichier de son côté.
+
+        Args:
+            engines (list): Moteurs des destinations.
+            rel_path (str): Fichier relatif à copier.
+            indices (list): Indices des destinations (non écartées) qui en ont besoin.
+
+        Returns:
+            list: Couples (indice de la destination, action) des destinations traitées.
+        """
+        src_file_path = self.source / rel_path
+        results = []
+        if len(indices) == 1 or self.dedupe != "off":
+            for index in indices:
+                engine = engines[index]
+                try:
+                    results.append((index, engine._copy_file_and_version(src_file_path, engine.target / rel_path)))
+                except PipelineAborted:
+                    raise
+                except Exception as e:
+                    results.extend(self._file_error(engines, index, src_file_path, e))
+            return results
+
+        writes = [] # (indice, action) des destinations où écrire les données
+        for index in indices:
+            engine = engines[index]
+            try:
+                action = engine._retry_transient(engine._prepare_copy, src_file_path, engine.target / rel_path)
+            except PipelineAborted:
+                raise
+            except Exception as e:
+                results.extend(self._file_error(engines, index, src_file_path, e))
+                continue
+            if action in ("added", "modified"):
+                writes.append((index, action))
+            else:
+                results.append((index, action))
+        if not writes:
+            return results
+        dest_paths = [engines[index].target / rel_path for index, _ in writes]
+        errors = {}
+        for attempt in range(1, STABLE_COPY_ATTEMPTS + 1):
+            hasher = hashlib.sha256() if self.verify_copies != "off" else None
+            pending = [dest_file_path for dest_file_path in dest_paths if dest_file_path not in errors]
+            try:
+                before = os.stat(src_file_path)
+                size, attempt_errors = copy_file_to_many(src_file_path, pending, self.buffer_size, self.low_cache,
+                                                         fsync=self.durability.fsync_files, hasher=hasher)
+                stable = source_unchanged(before, os.stat(src_file_path))
+            except OSError as e:
+                size, attempt_errors, stable = 0, dict.fromkeys(pending, e), True # Source illisible
+            errors.update(attempt_errors)
+            if stable:
+                break
+            if attempt < STABLE_COPY_ATTEMPTS:
+                self.logger.info(f"Fichier source modifié pendant la copie (tentative {attempt}), nouvelle copie : "
+                                 f"{src_file_path}")
+                time.sleep(STABLE_COPY_BACKOFF * 2 ** (attempt - 1))
+        for (index, action), dest_file_path in zip(writes, dest_paths):
+            engine = engines[index]
+            error = errors.get(dest_file_path)
+            retry = error is not None and isinstance(error, OSError) and classify_error(error) == "transient"
+            if dest_file_path in errors and not retry:
+                engine.logger.error(f"Erreur lors de la copie du fichier : {error}")
+                results.extend(self._file_error(engines, index, src_file_path, error))
+                continue
+            if not retry:
+                engine.durability.file_committed(size)
+                if not stable:
+                    results.append((index, engine._defer_copy(src_file_path, dest_file_path, action)))
+                    continue
+            if retry or hasher is not None and not engine._copy_verified(dest_file_path, hasher.digest()):
+                try:
+                    # Nouvelle copie, seule : erreur transitoire (réessayée) ou copie différente à la relecture
+                    engine._retry_transient(engine._copy_to_destination, src_file_path, dest_file_path)
+                except SourceChangedError:
+                    results.append((index, engine._defer_copy(src_file_path, dest_file_path, action)))
+                    continue
+                except PipelineAborted:
+                    raise
+                except Exception as e:
+                    engine.logger.error(f"Erreur lors de la copie du fichier : {e}")
+                    results.extend(self._file_error(engines, index, src_file_path, e))
+                    continue
+            engine._log_copy(src_file_path, dest_file_path, action)
+            results.append((index, action))
+        return results
+
+    def _file_error(self, engines, index, src_file_path, error):
+        """
+        Traite l'échec de la copie d'un fichier vers une destination. Une erreur propre au fichier (droits,
+        fichier disparu, erreur transitoire persistante...) est enregistrée et la synchronisation continue ;
+        une erreur qui touche toute la destination (espace, système de fichiers en lecture seule...) ou
+        inattendue l'écarte (_destination_failed).
+
+        Returns:
+            list: [(indice, "failed")] si le fichier est ignoré, [] si la destination est écartée.
+        """
+        if not isinstance(error, OSError) or classify_error(error) == "destination":
+            self._destination_failed(engines, index, error)
+            return []
+        engines[index]._record_file_error(src_file_path, error)
+        return [(index, "failed")]
+
+    def _destination_failed(self, engines, index, error):
+        """
+        Écarte une destination en échec pour la suite de la synchronisation : les autres destinations
+        continuent. Quand toutes ont échoué, l'erreur interrompt la synchronisation.
+
+        Raises:
+            Exception: L'erreur reçue, si plus aucune destination n'est active.
+        """
+        engine = engines[index]
+        with self._failure_lock:
+            if engine.failure is None:
+                engine.failure = error
+                if len(engines) > 1:
+                    engine.logger.error(f"Destination écartée pour la suite de la synchronisation : "
+                                        f"{engine.destination} ({error})")
+            all_failed = all(other.failure is not None for other in engines)
+        if all_failed:
+            raise error
+
+    def _commit_stage(self, pipeline, commit_queue, engines):
+        """
+        Étape de validation, exécutée dans le thread principal : seule à modifier les compteurs
+        et à rapporter la progression. Se termine quand tous les threads de copie ont fini.
+        """
+        copiers_running = self.copy_workers
+        while copiers_running:
+            message = pipeline.get(commit_queue)
+            if message is END_OF_STREAM:
+                copiers_running -= 1
+                continue
+            kind, index, value = message
+            engines[index]._count(kind, value)
+            if self.total_files_to_process:
+                self._report_progress()
+
+    def _count(self, kind, value):
+        """
+        Met à jour les compteurs de cette destination d'après un message de validation.
+        """
+        if kind == "dir_added":
+            self.dirs_added += 1
+        elif kind == "total":
+            self.total_files_to_process = value
+            self.logger.info(f"Total des fichiers à traiter : {self.total_files_to_process}")
+        elif kind == "unchanged":
+            self.files_unchanged += value
+            self.processed_files_count += value
+        elif kind == "metadata":
+            self.files_metadata_updated += value
+            self.processed_files_count += value
+        elif kind == "file":
+            if value == "deferred":
+                return # Compté lors de la reprise des copies différées
+            if value == "failed":
+                pass # Erreur enregistrée par _record_file_error
+            elif value == "added":
+                self.files_added += 1
+            elif value == "modified":
+                self.files_modified += 1
+            elif value == "metadata":
+                self.files_metadata_updated += 1
+            self.processed_files_count += 1
+
+    def _run_pipeline(self, engines, deep_scan):
+        """
+        Enchaîne parcours, comparaison, copie et validation en étapes concurrentes. La source est
+        parcourue d'après l'état de ce moteur, puis comparée à l'état de chaque destination.
+
+        Args:
+            engines (list): Moteurs des destinations synchronisées (celui-ci en premier).
+            deep_scan (bool): Relire tous les répertoires de la source.
+
+        Returns:
+            dict: Résultat du parcours (manifeste, répertoires, mtimes des répertoires).
+        """
+        scan_result = {}
+
+        pipeline = Pipeline()
+        scan_queue = pipeline.queue(SCAN_QUEUE_SIZE)
+        commit_queue = pipeline.queue(COMMIT_QUEUE_SIZE)
+        if self.read_order in ("inode", "physical"):
+            read_queue = pipeline.queue(COPY_QUEUE_SIZE)
+            copy_queue = pipeline.queue(PREFETCH_DEPTH)
+            pipeline.spawn("prefetch", self._prefetch_stage, pipeline, read_queue, copy_queue)
+        else:
+            read_queue = copy_queue = pipeline.queue(COPY_QUEUE_SIZE)
+        pipeline.spawn("scan", self._scan_stage, pipeline, scan_queue, self.previous_state, self.previous_files,
+                       deep_scan, scan_result)
+        pipeline.spawn("compare", self._compare_stage, pipeline, scan_queue, read_queue, commit_queue, engines)
+        for i in range(self.copy_workers):
+            pipeline.spawn(f"copy-{i}", self._copy_stage, pipeline, copy_queue, commit_queue, engines)
+        try:
+            self._commit_stage(pipeline, commit_queue, engines)
+        except PipelineAborted:
+            pass # L'erreur d'origine est relancée par join()
+        except BaseException as e:
+            pipeline.fail(e)
+        pipeline.join()
+        self._copy_deferred(engines)
+        return scan_result
+
+    def _copy_deferred(self, engines):
+        """
+        Reprend, une fois le pipeline terminé, les copies différées parce que la source changeait
+        pendant leur copie : chaque fichier est recopié (mêmes tentatives espacées) et sa dernière
+        copie conservée s'il change encore.
+
+        Args:
+            engines (list): Moteurs des destinations synchronisées.
+        """
+        for index, engine in enumerate(engines):
+            if not engine.deferred or engine.failure is not None:
+                continue
+            engine.logger.info(f"Reprise de {len(engine.deferred)} copie(s) différée(s) (source modifiée pendant "
+                               f"la copie).")
+            engine.accept_unstable = True
+            try:
+                for src_file_path, dest_file_path, action in engine.deferred:
+                    self._check_stop()
+                    try:
+                        engine._retry_transient(engine._copy_to_destination, src_file_path, dest_file_path)
+                    except Exception as e:
+                        engine.logger.error(f"Erreur lors de la copie du fichier : {e}")
+                        for _, failed in self._file_error(engines, index, src_file_path, e):
+                            engine._count("file", failed)
+                        if engine.failure is not None:
+                            break
+                        continue
+                    engine._log_copy(src_file_path, dest_file_path, action)
+                    engine._count("file", action)
+            finally:
+                engine.accept_unstable = False
+
+    def _delete_obsolete(self, file_paths, dir_paths):
+        """
+        Supprime de la destination les fichiers et répertoires disparus de la source
+        d'après le différentiel de manifestes, sans parcourir la destination.
+
+        Args:
+            file_paths (list): Fichiers relatifs supprimés de la source.
+            dir_paths (list): Répertoires relatifs supprimés de la source.
+        """
+        self.logger.info(f"Démarrage de la phase de suppression des obsolètes pour '{self.config_name}'.")
+        for rel_path in file_paths:
+            self._wait_if_paused()
+            dest_path = self.destination / rel_path
+            if dest_path == self.cache_dir or self.cache_dir in dest_path.parents:
+                continue
+            try:
+                os.remove(dest_path)
+                self.logger.info(f"Fichier obsolète supprimé : {dest_path}")
+                self.files_deleted += 1
+            except FileNotFoundError:
+                pass # Déjà absent (répertoire parent supprimé, ou modifié hors synchronisation)
+            except Exception as e:
+                self.logger.error(f"Erreur lors de la suppression du fichier obsolète : {e}")
+        # Seuls les répertoires les plus hauts sont supprimés : rmtree emporte leurs sous-répertoires
+        deleted_dirs = set(dir_paths)
+        for rel_dir in sorted(dir_paths):
+            if rel_dir.rpartition("/")[0] in deleted_dirs:
+                continue
+            self._wait_if_paused()
+            dest_path = self.destination / rel_dir
+            if dest_path == self.cache_dir or not dest_path.is_dir():
+                continue
+            try:
+                shutil.rmtree(dest_path)
+                self.logger.info(f"Répertoire obsolète supprimé : {dest_path}")
+                self.dirs_deleted += 1
+            except Exception as e:
+                self.logger.error(f"Erreur lors de la suppression du répertoire obsolète : {e}")
+
+    def _cleanup_obsolete(self, dest_dir, source_files, source_dirs, kept=frozenset()):
         """
         Supprime les fichiers et répertoires obsolètes dans le répertoire de destination.
         Un fichier/répertoire est considéré comme obsolète s'il n'existe pas dans la source.
@@ -235,19 +1624,25 @@ class SyncEngine:
             dest_dir (Path): Chemin du répertoire de destination.
             source_files (set): Ensemble des chemins absolus des fichiers source dans la destination.
             source_dirs (set): Ensemble des chemins absolus des répertoires source dans la destination.
+            kept (set): Chemins absolus des fichiers et répertoires source illisibles : leur copie en
+                        destination est conservée.
         """
         self.logger.info(f"Démarrage de la phase de suppression des obsolètes pour '{self.config_name}'.")
         for entry in os.scandir(dest_dir):
+            self._wait_if_paused()
             dest_path = Path(entry.path)
             
-            # Ne pas supprimer le répertoire cache
-            if dest_path == self.cache_dir:
+            # Ne pas supprimer le répertoire cache, ni les instantanés d'un passage précédent en mode
+            # instantanés (historique conservé après le retour au mode miroir)
+            if dest_path in (self.cache_dir, self.snapshots_dir, self.destination / LATEST_LINK_NAME):
                 continue
 
             # Construire le chemin source correspondant pour la comparaison
             # Si dest_path est /dest/subdir/file.txt, source_path_expected est /source/subdir/file.txt
             relative_path_from_dest = dest_path.relative_to(self.destination)
             expected_source_path = self.source / relative_path_from_dest
+            if expected_source_path in kept:
+                continue # Illisible lors du parcours de la source : conservé
 
             # Vérifier si l'entrée de destination correspond à un fichier ou répertoire dans la source
             is_in_source_files = expected_source_path in source_files
@@ -272,23 +1667,9 @@ class SyncEngine:
                 else:
                     self.logger.warning(f"Entrée ignorée lors de la suppression (ni fichier ni répertoire): {dest_path}")
             elif entry.is_dir(): # Si c'est un répertoire et qu'il est dans la source, on le parcourt récursivement
-                self._cleanup_obsolete(dest_path, source_files, source_dirs)
+                self._cleanup_obsolete(dest_path, source_files, source_dirs, kept)
 
 
-    def _count_total_files(self, directory):
-        """
-        Compte le nombre total de fichiers à traiter dans le répertoire source,
-        en respectant la blacklist.
-        """
-        count = 0
-        for entry in os.scandir(directory):
-            entry_path = Path(entry.path)
-            if entry.is_file() and not self._is_excluded_file(entry_path):
-                count += 1
-            elif entry.is_dir() and not self._is_excluded_dir(entry_path):
-                count += self._count_total_files(entry_path)
-        return count
-
     def _report_progress(self):
         """
         Rapporte la progression de la synchronisation si un seuil est atteint.
@@ -307,17 +1688,206 @@ class SyncEngine:
 
     def run_sync(self):
         """
-        Effectue la synchronisation des fichiers et répertoires.
+        Effectue la synchronisation des fichiers et répertoires, vers la destination et vers les
+        éventuelles destinations supplémentaires (self.replicas) : la source est alors parcourue et
+        lue une seule fois, chaque destination gardant son état, ses statistiques et ses erreurs.
         """
         self.logger.info(f"Démarrage de la synchronisation pour la configuration : '{self.config_name}'")
         sync_start_time = time.time() # Pour calculer la durée totale
 
+        engines = []
+        for engine in [self] + self.replicas:
+            try:
+                engine._verify_paths()
+            except Exception as e:
+                engine.failure = e
+                engine.logger.error(f"Erreur de vérification des chemins : {e}")
+                engine.logger.info(f"Synchronisation terminée avec des erreurs.")
+                continue  # Arrêter la synchronisation de cette destination si les chemins sont invalides
+            engines.append(engine)
+        if not engines:
+            self._save_error_report([self] + self.replicas)
+            return
+
+        if self.hash_cache_entries > 0:
+            self.hash_cache = HashCache(self.hash_cache_file, self.hash_cache_entries)
+        active = []
+        for engine in engines:
+            engine.hash_cache = self.hash_cache # Empreintes indexées par inode : valables pour toutes
+            engine._configure_io()
+            engine._begin_run()
+            active.append(engine)
+        if not active:
+            if self.hash_cache is not None:
+                self.hash_cache.save()
+            self._save_error_report([self] + self.replicas)
+            return
+
+        # Parcours, comparaison avec le manifeste précédent de chaque destination et copie, en pipeline
+        leader = active[0]
+        deep_scan = any([engine._needs_deep_scan(engine.previous_state) for engine in active])
+        if self.scan_cache_seconds > 0:
+            leader.scan_cache = ScanCache(SCAN_CACHE_FILE, self.scan_cache_seconds)
         try:
-            self._verify_paths()
-        except Exception as e:
-            self.logger.error(f"Erreur de vérification des chemins : {e}")
-            self.logger.info(f"Synchronisation terminée avec des erreurs.")
-            return  # Arrêter la synchronisation si les chemins sont invalides
+            scan_result = leader._run_pipeline(active, deep_scan)
+        except InsufficientSpaceError as e:
+            if len(active) == 1:
+                leader.logger.error(str(e))
+            for engine in active:
+                engine.failure = engine.failure or e
+                engine._abandon_run() # Rien n'a été écrit au-delà de l'espace disponible
+            if self.hash_cache is not None:
+                self.hash_cache.save() # Les empreintes calculées restent valables
+            self._save_error_report([self] + self.replicas)
+            return  # L'état précédent de chaque destination est conservé
+        except SyncCancelled:
+            # Les copies en cours sont terminées (join) : elles sont rendues durables, l'état précédent
+            # de chaque destination est conservé et la copie reprendra à la prochaine synchronisation
+            for engine in active:
+                engine._abandon_run(sync_start_time)
+            if self.hash_cache is not None:
+                self.hash_cache.save()
+            self._save_error_report([self] + self.replicas)
+            return
+        finally:
+            if leader.scan_cache is not None:
+                leader.scan_cache.close()
+        scan_mode = "complet" if deep_scan else "incrémental"
+        leader.logger.info(f"Parcours {scan_mode} de la source : {leader.dirs_scanned} répertoire(s) relu(s), "
+                           f"{leader.dirs_reused} repris de l'état précédent, "
+                           f"{leader.dirs_from_scan_cache} du cache de parcours partagé.")
+        if self.hash_cache is not None:
+            self.hash_cache.save()
+            self.logger.info(f"Cache d'empreintes : {self.hash_cache.hits} réutilisée(s), {self.hash_cache.misses} "
+                             f"calculée(s) ({self.hash_cache.bytes_hashed // 1024} Kio lus), "
+                             f"{len(self.hash_cache)} entrée(s) conservée(s).")
+
+        for engine in active:
+            if engine.failure is not None:
+                engine._abandon_run()
+            else:
+                engine._finish_run(scan_result, deep_scan, sync_start_time)
+        self._save_error_report([self] + self.replicas)
+
+    def _save_error_report(self, engines):
+        """
+        Enregistre le rapport d'erreurs de la synchronisation (<config>.errors.json) : fichiers non
+        synchronisés de chaque destination, et destinations écartées.
+        """
+        report = {
+            "config": self.config_name,
+            "finished": time.time(),
+            "destinations": [{"destination": str(engine.destination),
+                              "failed": str(engine.failure) if engine.failure is not None else None,
+                              "files": engine.file_errors}
+                             for engine in engines],
+        }
+        report_file = STATE_DIR / f"{self.config_name}.errors.json"
+        report_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = report_file.with_name(report_file.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, report_file)
+        failed_files = sum(len(engine.file_errors) for engine in engines)
+        if failed_files:
+            self.logger.warning(f"Rapport d'erreurs : {failed_files} fichier(s) non synchronisé(s), détail dans "
+                                f"{report_file}")
+
+    def has_errors(self):
+        """
+        Indique si la dernière synchronisation s'est terminée avec des erreurs (fichiers non synchronisés
+        ou destination écartée), pour cette destination ou une destination supplémentaire.
+        """
+        return any(engine.failure is not None or engine.file_errors for engine in [self] + self.replicas)
+
+    def request_stop(self):
+        """
+        Demande l'arrêt de la synchronisation : les copies en cours se terminent, aucun nouveau fichier
+        n'est traité (SyncCancelled) et les copies déjà faites sont conservées.
+        """
+        for engine in [self] + self.replicas:
+            engine.stop_event.set()
+
+    def pause(self):
+        """
+        Met la synchronisation en pause : les étapes s'arrêtent au prochain fichier (copies en cours
+        terminées) et n'effectuent plus aucune lecture ni écriture. Le parcours, la comparaison et les
+        fichiers restant à copier sont conservés en mémoire : la reprise (resume) continue sans reparcourir.
+        """
+        for engine in [self] + self.replicas:
+            engine.resume_event.clear()
+        self.logger.info("Synchronisation en pause (lectures et écritures suspendues après les copies en cours).")
+
+    def resume(self):
+        """Reprend une synchronisation mise en pause (pause)."""
+        for engine in [self] + self.replicas:
+            engine.resume_event.set()
+        self.logger.info("Reprise de la synchronisation.")
+
+    def _wait_if_paused(self):
+        """
+        Point de pause : pendant une pause, attend la reprise (ou une demande d'arrêt) sans effectuer
+        aucune lecture ni écriture.
+        """
+        if not self.resume_event.is_set():
+            while not self.resume_event.wait(PAUSE_POLL_SECONDS) and not self.stop_event.is_set():
+                pass
+
+    def _check_stop(self):
+        """
+        Point d'arrêt entre deux fichiers : attend la reprise pendant une pause.
+
+        Raises:
+            SyncCancelled: Si un arrêt a été demandé (request_stop).
+        """
+        self._wait_if_paused()
+        if self.stop_event.is_set():
+            raise SyncCancelled()
+
+    def _control_loop(self, signals):
+        """
+        Thread de contrôle : reçoit les signaux de commande, bloqués dans les autres threads, et les
+        traite hors d'un gestionnaire de signal (journalisation possible). SIGTERM : arrêt coopératif,
+        forcé après STOP_GRACE_SECONDS ; SIGUSR1 : pause ; SIGUSR2 : reprise.
+
+        Args:
+            signals (set): Signaux reçus par ce thread.
+        """
+        while True:
+            signum = signal.sigwait(signals)
+            if signum == signal.SIGUSR1:
+                self.pause()
+            elif signum == signal.SIGUSR2:
+                self.resume()
+            elif not self.stop_event.is_set():
+                self.logger.warning("Arrêt demandé : fin des copies en cours.")
+                self.request_stop()
+                threading.Thread(target=self._force_stop, name="stop-watchdog", daemon=True).start()
+
+    def _force_stop(self):
+        """
+        Laisse STOP_GRACE_SECONDS secondes à la synchronisation pour s'arrêter d'elle-même après
+        request_stop, puis termine le processus.
+        """
+        time.sleep(STOP_GRACE_SECONDS)
+        self.logger.error(f"Arrêt forcé : la synchronisation ne s'est pas arrêtée dans les {STOP_GRACE_SECONDS} s.")
+        logging.shutdown()
+        os._exit(EXIT_STOPPED)
+
+    def _begin_run(self):
+        """
+        Prépare cette destination pour une synchronisation : fichiers temporaires d'une exécution
+        interrompue, dépôt de blocs, compteurs, état précédent, instantané et plan d'espace.
+        """
+        if self.running_marker.exists():
+            self._remove_stale_temporaries()
+        self.running_marker.parent.mkdir(parents=True, exist_ok=True)
+        self.running_marker.touch()
+
+        if self.version_store == "chunks":
+            self.chunk_store = ChunkStore(self.chunk_repository, fsync=self.durability.mode != "none")
+            self.chunk_store.register_root(self.cache_dir) # Recettes de cette destination (ramasse-miettes)
+            self.logger.info(f"Dépôt de blocs : {self.chunk_repository} ({len(self.chunk_store.index)} bloc(s) indexé(s)).")
 
         # Réinitialiser les compteurs pour cette exécution
         self.dirs_added = 0
@@ -328,39 +1898,210 @@ class SyncEngine:
         self.processed_files_count = 0
         self.last_progress_report = -1 # Réinitialiser le dernier rapport de progression
 
-        # Pré-calculer le nombre total de fichiers pour la progression
-        self.total_files_to_process = self._count_total_files(self.source)
-        self.logger.info(f"Total des fichiers à traiter : {self.total_files_to_process}")
+        self.files_unchanged = 0
+        self.files_metadata_updated = 0
+        self.new_versions = []
+        self.new_digests = {}
+        self.deferred = []
+        self.spot_checked = 0
+        self.spot_check_failures = []
+        self.file_errors = []
+        self.failure = None
+        if self.verify_copies == "reread":
+            self.verifier = CopyVerifier(self.buffer_size)
+        if self.dedupe != "off":
+            digest_function = self.hash_cache.digest if self.hash_cache is not None else file_digest
+            self.duplicates = DuplicateIndex(self.dedupe, digest_function, logger=self.logger)
+
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+        self.dirs_from_scan_cache = 0
+        self.total_files_to_process = 0
+        previous_state = self._load_state()
+        self.layout = "mirror"
+        if self.snapshot_mode:
+            self._prepare_snapshot()
+            self.layout = f"snapshot:{self.previous_snapshot.name if self.previous_snapshot else ''}"
+        if previous_state and previous_state.get("layout", "mirror") != self.layout:
+            self.logger.info("Disposition de la destination modifiée (mode ou instantané de référence) : "
+                             "état précédent ignoré.")
+            previous_state = {}
+        self.previous_state = previous_state
+        self.previous_manifest = Manifest.from_dict(previous_state["manifest"]) if "manifest" in previous_state else None
+        if self.previous_manifest is None:
+            # Premier passage (ou état invalide) : tout fichier est candidat, le contenu départage
+            self.logger.info("Aucun manifeste précédent : comparaison complète avec la destination.")
+            self.previous_files, self.previous_dirs = {}, None
+        else:
+            self.previous_files = self.previous_manifest.rows_by_directory()
+            self.previous_dirs = set(previous_state.get("dirs", []))
+        self.compare_result = {"counts": {"added": 0, "changed": 0, "metadata": 0, "unchanged": 0, "deleted": 0},
+                               "deleted_files": []}
+        self.budget = SpaceBudget(self.destination, self.space_margin)
+
+    def _abandon_run(self, sync_start_time=None):
+        """
+        Termine en erreur la synchronisation de cette destination : l'état précédent est conservé et
+        l'instantané en construction supprimé (les copies en cours ont nettoyé leurs fichiers temporaires).
+
+        Args:
+            sync_start_time (float): Début de la synchronisation, si elle est interrompue à la demande
+                                     (request_stop) : les fichiers déjà copiés sont rendus durables et la
+                                     synthèse est journalisée.
+        """
+        if self.chunk_store is not None:
+            self.chunk_store.close()
+        if sync_start_time is not None:
+            self.durability.flush()
+        if self.snapshot_mode and self.target != self.destination:
+            shutil.rmtree(self.target, ignore_errors=True) # Instantané incomplet
+        self.running_marker.unlink(missing_ok=True)
+        if sync_start_time is None:
+            self.logger.info(f"Synchronisation terminée avec des erreurs.")
+            return
+        self.logger.warning(f"Synchronisation pour '{self.config_name}' interrompue à la demande : les fichiers "
+                            f"copiés sont conservés, la copie reprendra à la prochaine synchronisation.")
+        self._log_summary(sync_start_time)
+
+    def _finish_run(self, scan_result, deep_scan, sync_start_time):
+        """
+        Termine la synchronisation de cette destination après la phase de copie : compression des
+        versions, suppression des obsolètes, rétention, durabilité, publication de l'instantané,
+        enregistrement de l'état et synthèse.
 
-        # Phase de copie/mise à jour
-        self._sync_directory(self.source, self.destination)
+        Args:
+            scan_result (dict): Résultat du parcours de la source.
+            deep_scan (bool): Le parcours a relu tous les répertoires.
+            sync_start_time (float): Début de la synchronisation (time.time()).
+        """
+        previous_state, previous_manifest, compare_result = self.previous_state, self.previous_manifest, self.compare_result
+        self.logger.info(f"Plan d'espace de la destination : {self.budget.summary()}.")
+        current_manifest, current_dirs, dir_mtimes = scan_result["manifest"], scan_result["dirs"], scan_result["dir_mtimes"]
+        counts = compare_result["counts"]
+        self.logger.info(f"Différentiel du manifeste : {counts['added']} ajouté(s), {counts['changed']} modifié(s), "
+                         f"{counts['metadata']} aux métadonnées seules modifiées, {counts['unchanged']} inchangé(s), "
+                         f"{counts['deleted']} supprimé(s).")
+        self._report_progress()
         self.logger.info(f"Phase de copie/mise à jour terminée pour '{self.config_name}'.")
+        if self.chunk_store is not None:
+            self.chunk_store.close()
+            store = self.chunk_store
+            self.logger.info(f"Dépôt de blocs : {store.new_chunks} bloc(s) ajouté(s) ({store.new_bytes // 1024} Kio, "
+                             f"{store.stored_bytes // 1024} Kio stockés), {store.reused_chunks} déjà présent(s) "
+                             f"({store.reused_bytes // 1024} Kio non réécrits).")
+
+        # Compression des nouvelles versions en arrière-plan, pendant la phase de suppression
+        compressor = None
+        if self.version_compression != "none" and self.new_versions:
+            compressor = VersionCompressor(self.version_compression, self.compression_level,
+                                           fsync=self.durability.mode != "none", logger=self.logger,
+                                           checkpoint=self._wait_if_paused)
+            for versioned_path in self.new_versions:
+                compressor.submit(versioned_path)
 
-        # Collecter tous les fichiers et répertoires de la source (pour la suppression des obsolètes)
-        source_files_abs = set()
-        source_dirs_abs = set()
+        # Phase de suppression des obsolètes (inutile en mode instantanés : le nouvel instantané ne
+        # contient que les fichiers présents dans la source)
+        if self.snapshot_mode:
+            if previous_manifest is not None:
+                # Absents du nouvel instantané, y compris le contenu des répertoires supprimés de la source
+                # (que le différentiel par répertoire ne voit pas)
+                self.files_deleted = len(set(previous_manifest.paths).difference(current_manifest.paths))
+                deleted_dirs = set(previous_state.get("dirs", [])).difference(current_dirs)
+                self.dirs_deleted = sum(1 for d in deleted_dirs if d.rpartition("/")[0] not in deleted_dirs)
+        elif previous_manifest is not None:
+            current_dir_set = set(current_dirs)
+            deleted_dirs = [d for d in previous_state.get("dirs", []) if d not in current_dir_set]
+            self._delete_obsolete(compare_result["deleted_files"], deleted_dirs)
+        else:
+            source_files_abs = {self.source / p for p in current_manifest.paths}
+            source_dirs_abs = {self.source / d for d in current_dirs}
+            self._cleanup_obsolete(self.destination, source_files_abs, source_dirs_abs,
+                                   {self.source / p for p in scan_result["unreadable"]})
 
-        def collect_source_paths(directory):
-            for entry in os.scandir(directory):
-                entry_path = Path(entry.path)
-                if entry.is_file() and not self._is_excluded_file(entry_path):
-                    source_files_abs.add(entry_path)
-                elif entry.is_dir() and not self._is_excluded_dir(entry_path):
-                    source_dirs_abs.add(entry_path)
-                    collect_source_paths(entry_path)
+        if compressor is not None:
+            compressor.wait()
+            self.logger.info(f"Versions compressées ({self.version_compression}) : {compressor.compressed} "
+                             f"sur {len(self.new_versions)}, {compressor.original_bytes // 1024} Kio -> "
+                             f"{compressor.stored_bytes // 1024} Kio.")
+        if not self.snapshot_mode:
+            removed = prune_versions(self.cache_dir, self.max_cached_versions, checkpoint=self._wait_if_paused)
+            if removed:
+                self.logger.info(f"Rétention : {removed} ancienne(s) version(s) supprimée(s) du cache "
+                                 f"({self.max_cached_versions} conservée(s) par fichier).")
+            if self.chunk_store is not None and (removed or self.chunk_store.gc_pending):
+                self._collect_chunks()
 
-        collect_source_paths(self.source)
+        # Le manifeste n'est enregistré qu'après une synchronisation complète et durable
+        self.durability.flush()
+        if self.durability.mode == "batch":
+            self.logger.info(f"Écritures rendues durables : {self.durability.syncs} synchronisation(s) groupée(s).")
+        if self.snapshot_mode:
+            publish_snapshot(self.target, self.snapshot_path, self.destination)
+            self.layout = f"snapshot:{self.snapshot_path.name}"
+            self.logger.info(f"Instantané publié : {self.snapshot_path}")
+        if self.verifier is not None:
+            self.logger.info(f"Vérification des copies : {self.verifier.summary()}.")
+        if self.file_errors:
+            # Fichiers non synchronisés : absents du manifeste, et leurs répertoires relus au prochain
+            # parcours, pour que leur copie soit reprise
+            failed = {error["path"] for error in self.file_errors}
+            failed_dirs = {rel_path.rpartition("/")[0] for rel_path in failed}
+            current_manifest = current_manifest.without(failed)
+            dir_mtimes = {rel_dir: mtime for rel_dir, mtime in dir_mtimes.items() if rel_dir not in failed_dirs}
+        manifest_data = current_manifest.to_dict() # Manifeste partagé par les destinations : non modifié
+        manifest_data["digests"] = self._recorded_digests(previous_manifest, current_manifest)
+        spot_check = None
+        if self.spot_check_days > 0 and not self.stop_event.is_set():
+            spot_check = self._spot_check(current_manifest, manifest_data["digests"],
+                                          previous_state.get("spot_check", {}))
+        self._save_state({
+            "layout": self.layout,
+            "manifest": manifest_data,
+            "dirs": current_dirs,
+            "dir_mtimes": dir_mtimes,
+            "blacklist": [sorted(self.blacklist_files), sorted(self.blacklist_dirs)],
+            "last_deep_scan": time.time() if deep_scan else previous_state.get("last_deep_scan", 0),
+            **({"spot_check": spot_check} if spot_check is not None else {}),
+        })
+        if self.snapshot_mode:
+            # L'instantané courant plus max_cached_versions instantanés précédents
+            pruned = prune_snapshots(self.snapshots_dir, self.max_cached_versions + 1,
+                                     checkpoint=self._wait_if_paused)
+            if pruned:
+                self.logger.info(f"Rétention : instantané(s) supprimé(s) : {', '.join(pruned)}")
+        self.running_marker.unlink(missing_ok=True)
 
-        # Phase de suppression des obsolètes
-        self._cleanup_obsolete(self.destination, source_files_abs, source_dirs_abs)
-        
+        if self.file_errors:
+            self.logger.warning(f"Synchronisation pour '{self.config_name}' terminée avec des erreurs : "
+                                f"{len(self.file_errors)} fichier(s) non synchronisé(s).")
+        else:
+            self.logger.info(f"Synchronisation pour '{self.config_name}' terminée avec succès.")
+        self._log_summary(sync_start_time)
+
+    def _collect_chunks(self):
+        """
+        Libère les blocs du dépôt qui ne sont plus cités par aucune recette (après la rétention des versions).
+        Un échec n'interrompt pas la synchronisation : les blocs seront libérés par une exécution suivante.
+        """
+        try:
+            stats = self.chunk_store.collect_garbage(checkpoint=self._wait_if_paused)
+        except (CollectionSkipped, OSError) as e:
+            self.logger.warning(f"Ramasse-miettes du dépôt de blocs non exécuté : {e}")
+            return
+        self.logger.info(f"Ramasse-miettes du dépôt de blocs : {stats['chunks_removed']} bloc(s) libéré(s) "
+                         f"({stats['bytes_freed'] // 1024} Kio), {stats['packs_removed']} pack(s) supprimé(s), "
+                         f"{stats['packs_rewritten']} réécrit(s).")
+
+    def _log_summary(self, sync_start_time):
+        """Journalise la synthèse de la synchronisation de cette destination (lue par le backend)."""
         sync_end_time = time.time()
         duration_sec = int(sync_end_time - sync_start_time)
 
-        self.logger.info(f"Synchronisation pour '{self.config_name}' terminée avec succès.")
-        
         # --- SYNTHÈSE FINALE POUR LE BACKEND ---
-        self.logger.info("\nSynthèse de l'opération :")
+        if self.state_name == self.config_name:
+            self.logger.info("\nSynthèse de l'opération :")
+        else: # Destination supplémentaire
+            self.logger.info(f"\nSynthèse de l'opération pour la destination {self.destination} :")
         self.logger.info(f"  Durée totale: {duration_sec} secondes")
         self.logger.info(f"  Répertoires ajoutés: {self.dirs_added}")
         self.logger.info(f"  Fichiers ajoutés: {self.files_added}")
@@ -368,9 +2109,179 @@ class SyncEngine:
         self.logger.info(f"  Fichiers modifiés: {self.files_modified}")
         self.logger.info(f"  Répertoires supprimés: {self.dirs_deleted}")
         self.logger.info(f"  Fichiers supprimés: {self.files_deleted}")
+        self.logger.info(f"  Fichiers inchangés: {self.files_unchanged}")
+        self.logger.info(f"  Métadonnées mises à jour: {self.files_metadata_updated}")
+        self.logger.info(f"  Copies différées (source modifiée): {len(self.deferred)}")
+        self.logger.info(f"  Fichiers en erreur (non synchronisés): {len(self.file_errors)}")
         self.logger.info(f"  Total des fichiers traités: {self.processed_files_count}") # Inclut copiés, modifiés, identiques
+        if self.duplicates is not None:
+            self.logger.info(f"  Doublons reliés: {self.duplicates.files_linked}")
+            self.logger.info(f"  Octets économisés (doublons): {self.duplicates.bytes_saved}")
+        if self.hash_cache is not None:
+            self.logger.info(f"  Empreintes réutilisées (cache): {self.hash_cache.hits}")
+            self.logger.info(f"  Empreintes calculées: {self.hash_cache.misses}")
+        if self.verifier is not None:
+            self.logger.info(f"  Fichiers vérifiés: {self.verifier.files}")
+            self.logger.info(f"  Écarts de vérification corrigés: {self.verifier.mismatches}")
+        if self.spot_check_days > 0:
+            self.logger.info(f"  Fichiers contrôlés (échantillon): {self.spot_checked}")
+            self.logger.info(f"  Anomalies détectées (échantillon): {len(self.spot_check_failures)}")
         # ------------------------------------
 
+    def _recorded_digests(self, previous_manifest, current_manifest):
+        """
+        Empreintes à enregistrer dans le manifeste : celles des fichiers copiés pendant cette
+        synchronisation, et celles du manifeste précédent pour les fichiers dont le contenu n'a pas
+        changé depuis (même taille, même mtime).
+
+        Returns:
+            dict: Empreintes hexadécimales par chemin relatif.
+        """
+        digests = {}
+        if previous_manifest is not None and previous_manifest.digests:
+            diff = diff_manifests(previous_manifest, current_manifest)
+            for rel_path in diff.unchanged + diff.metadata:
+                digest = previous_manifest.digests.get(rel_path)
+                if digest is not None:
+                    digests[rel_path] = digest
+        digests.update(self.new_digests)
+        return digests
+
+    def _spot_check(self, current_manifest, digests, previous_record):
+        """
+        Contrôle par échantillonnage : relit un échantillon de fichiers de la destination et le compare
+        aux empreintes du manifeste, en tenant à jour la date de dernière vérification de chaque fichier.
+
+        Args:
+            current_manifest (Manifest): Manifeste de cette synchronisation.
+            digests (dict): Empreintes enregistrées avec ce manifeste.
+            previous_record (dict): Enregistrement "spot_check" de l'état précédent.
+
+        Returns:
+            dict: Enregistrement "spot_check" à conserver dans l'état (couverture et anomalies).
+        """
+        now = int(time.time())
+        previous_coverage = previous_record.get("coverage", {})
+        coverage = {}
+        for rel_path in digests:
+            if rel_path in self.new_digests:
+                if self.verifier is not None:
+                    coverage[rel_path] = now # Relu et vérifié lors de la copie
+            elif rel_path in previous_coverage:
+                coverage[rel_path] = previous_coverage[rel_path]
+        if not digests:
+            self.logger.warning("Contrôle par échantillonnage impossible : aucune empreinte enregistrée "
+                                "(activer --verify-copies).")
+            return {"coverage": coverage, "failures": []}
+
+        sizes = {rel_path: size for rel_path, size in zip(current_manifest.paths, current_manifest.columns["size"])
+                 if rel_path in digests}
+        period = self.spot_check_days * 24 * 3600
+        runs_per_period = self.spot_check_days * 24 / max(self.frequency_hours, 1)
+        sample, overdue_skipped = spot_check_sample(sizes, coverage, now, period, runs_per_period,
+                                                    self.spot_check_mb * 1024 * 1024, self.spot_check_sampling)
+        root = self.snapshot_path if self.snapshot_mode else self.destination
+        manifest = Manifest(current_manifest.paths, current_manifest.columns, digests)
+        report = DestinationAudit(root, manifest, None, None, self.copy_workers, self.buffer_size,
+                                  logger=self.logger, paths=sample, checkpoint=self._wait_if_paused).run()
+        failed = ({entry["path"] for entry in report["corrupt"]} | set(report["missing"])
+                  | {entry["path"] for entry in report["errors"]})
+        for rel_path in sample:
+            if rel_path not in failed:
+                coverage[rel_path] = now
+        self.spot_checked = len(sample)
+        self.spot_check_failures = sorted(failed)
+
+        covered = sum(1 for verified_at in coverage.values() if now - verified_at < period)
+        self.logger.info(f"Contrôle par échantillonnage ({self.spot_check_sampling}) : {len(sample)} fichier(s) relu(s) "
+                         f"({report['bytes'] // (1024 * 1024)} Mio à {report['throughput_mib_s']} Mio/s), "
+                         f"{len(failed)} anomalie(s) ; {covered}/{len(sizes)} fichier(s) vérifié(s) depuis moins de "
+                         f"{self.spot_check_days} jour(s).")
+        if overdue_skipped:
+            self.logger.warning(f"{overdue_skipped} fichier(s) non vérifié(s) depuis plus de {self.spot_check_days} "
+                                f"jour(s) : volume de lecture par exécution (--spot-check-mb) insuffisant.")
+        return {"coverage": coverage, "failures": self.spot_check_failures}
+
+    def run_audit(self, rate_mb=0):
+        """
+        Vérifie les fichiers de la destination (et des destinations supplémentaires) d'après les
+        empreintes de leur manifeste, sans accéder à la source, et enregistre le rapport JSON
+        (STATE_DIR/<config>.audit.json).
+
+        Args:
+            rate_mb (int): Débit de lecture maximal en Mio/s, toutes destinations confondues (0 : illimité).
+
+        Returns:
+            dict: Le rapport de l'audit, ou None s'il a été interrompu (request_stop ; pause respectée
+                  entre deux fichiers).
+        """
+        self.logger.info(f"Démarrage de l'audit des destinations pour la configuration : '{self.config_name}'")
+        limiter = RateLimiter(rate_mb * 1024 * 1024)
+        report = {"config": self.config_name, "started": datetime.now().isoformat(timespec="seconds"),
+                  "destinations": []}
+        try:
+            for engine in [self] + self.replicas:
+                report["destinations"].append(engine._audit_destination(limiter))
+        except SyncCancelled:
+            self.logger.warning("Audit interrompu à la demande : il reprendra après le dernier lot vérifié.")
+            return None
+        report["finished"] = datetime.now().isoformat(timespec="seconds")
+        report_file = STATE_DIR / f"{self.config_name}.audit.json"
+        report_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = report_file.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        os.replace(tmp_path, report_file)
+
+        self.logger.info(f"Audit terminé, rapport : {report_file}")
+        self.logger.info("\nSynthèse de l'audit :")
+        for destination in report["destinations"]:
+            if destination["status"] != "audited":
+                self.logger.info(f"  {destination['destination']}: non audité ({destination['status']})")
+                continue
+            self.logger.info(f"  {destination['destination']}: {destination['verified']} fichier(s) intègre(s), "
+                             f"{len(destination['corrupt'])} corrompu(s), {len(destination['missing'])} manquant(s), "
+                             f"{len(destination['errors'])} illisible(s), {destination['unverifiable']} sans empreinte "
+                             f"({destination['bytes'] // (1024 * 1024)} Mio à {destination['throughput_mib_s']} Mio/s)")
+        return report
+
+    def _audit_destination(self, limiter):
+        """
+        Vérifie les fichiers de cette destination d'après les empreintes de son manifeste.
+
+        Args:
+            limiter (RateLimiter): Limitation du débit de lecture, partagée entre destinations.
+
+        Returns:
+            dict: Rapport de cette destination ; "status" vaut "audited", ou "no_state" si aucune
+                  synchronisation réussie n'a enregistré de manifeste.
+        """
+        state = self._load_state()
+        if "manifest" not in state:
+            self.logger.warning(f"Aucun manifeste enregistré pour {self.destination} : audit impossible.")
+            return {"destination": str(self.destination), "status": "no_state"}
+        manifest = Manifest.from_dict(state["manifest"])
+        layout = state.get("layout", "mirror")
+        root = self.snapshots_dir / layout.split(":", 1)[1] if layout.startswith("snapshot:") else self.destination
+        if not manifest.digests:
+            self.logger.warning(f"Aucune empreinte enregistrée pour {self.destination} (--verify-copies) : "
+                                f"seule la présence des fichiers est vérifiée.")
+
+        try:
+            device = identify_device(self.destination) # La source n'est pas consultée
+        except OSError:
+            device = DeviceInfo(None, None, "unknown")
+        settings = choose_io_settings(device, device)
+        workers = self.copy_workers if self.copy_workers > 0 else settings["copy_workers"]
+        buffer_size = self.buffer_size if self.buffer_size > 0 else settings["buffer_size"]
+        self.logger.info(f"Audit de {root} : {len(manifest)} fichier(s), {len(manifest.digests)} empreinte(s), "
+                         f"{workers} thread(s).")
+
+        audit = DestinationAudit(root, manifest, STATE_DIR / f"{self.state_name}.audit-progress.json",
+                                 self.state_file.stat().st_mtime_ns, workers, buffer_size, limiter, self.logger,
+                                 checkpoint=self._check_stop)
+        return dict(audit.run(), destination=str(self.destination), status="audited")
+
     def get_sync_stats(self):
         """
         Retourne les statistiques de la dernière synchronisation.
@@ -385,11 +2296,36 @@ class SyncEngine:
             "files_modified": self.files_modified,
             "files_deleted": self.files_deleted,
             "dirs_deleted": self.dirs_deleted,
-            "total_processed_files": self.processed_files_count
+            "files_unchanged": self.files_unchanged,
+            "files_metadata_updated": self.files_metadata_updated,
+            "files_deferred": len(self.deferred),
+            "files_failed": len(self.file_errors),
+            "file_errors": self.file_errors,
+            "total_processed_files": self.processed_files_count,
+            "duplicates_linked": self.duplicates.files_linked if self.duplicates is not None else 0,
+            "dedupe_bytes_saved": self.duplicates.bytes_saved if self.duplicates is not None else 0,
+            "hash_cache_hits": self.hash_cache.hits if self.hash_cache is not None else 0,
+            "hash_cache_misses": self.hash_cache.misses if self.hash_cache is not None else 0,
+            "files_verified": self.verifier.files if self.verifier is not None else 0,
+            "verify_mismatches": self.verifier.mismatches if self.verifier is not None else 0,
+            "verify_bytes": self.verifier.bytes if self.verifier is not None else 0,
+            "verify_seconds": round(self.verifier.seconds, 3) if self.verifier is not None else 0,
+            "spot_checked": self.spot_checked,
+            "spot_check_failures": self.spot_check_failures,
+            "destination": str(self.destination),
+            "failed": self.failure is not None,
+            "extra_destinations": [replica.get_sync_stats() for replica in self.replicas]
         }
 
 
-def main(source, destination, frequency_hours, blacklist_files, blacklist_dirs, config_name, log_file):
+def main(source, destination, frequency_hours, blacklist_files, blacklist_dirs, config_name, log_file,
+         trust_dir_mtime=False, deep_scan_days=7, scan_workers=0, copy_workers=0, buffer_size=0, read_order="auto",
+         low_cache=False, segment_workers=0, segment_threshold_mb=1024, durability="batch", sync_batch_mb=256,
+         sync_batch_seconds=DEFAULT_BATCH_SECONDS, version_compression="none", compression_level=-1,
+         version_store="copy", chunk_repository=None, max_cached_versions=2, snapshot_mode=False, dedupe="off",
+         hash_cache_entries=DEFAULT_MAX_ENTRIES, extra_destinations=None, scan_cache_seconds=0,
+         verify_copies="off", verify_only=False, verify_rate_mb=0, spot_check_days=0, spot_check_mb=1024,
+         spot_check_sampling="stratified", space_margin_mb=DEFAULT_SPACE_MARGIN // (1024 * 1024)):
     """
     Fonction principale pour lancer la synchronisation.
 
@@ -401,21 +2337,88 @@ def main(source, destination, frequency_hours, blacklist_files, blacklist_dirs,
         blacklist_dirs (str): Chaîne des répertoires exclus, séparés par ';'.
         config_name (str): Le nom de la configuration.
         log_file (str): Le chemin du fichier de log.
+        trust_dir_mtime (bool): Parcours incrémental fondé sur les mtimes des répertoires.
+        deep_scan_days (int): Intervalle (jours) entre deux parcours complets forcés.
+        scan_workers (int): Nombre de threads de parcours de la source (0 : selon le périphérique).
+        copy_workers (int): Nombre de threads de copie (0 : selon les périphériques).
+        buffer_size (int): Taille des tampons de lecture en octets (0 : selon les périphériques).
+        read_order (str): "path", "inode", "physical" ou "auto".
+        low_cache (bool): Copier sans remplir le cache de pages.
+        segment_workers (int): Threads de copie d'un même gros fichier (0 : selon les périphériques).
+        segment_threshold_mb (int): Taille (Mio) à partir de laquelle un fichier est copié par tranches.
+        durability (str): Politique de durabilité : "none", "fsync" ou "batch".
+        sync_batch_mb (int): Politique "batch" : Mio écrits entre deux synchronisations.
+        sync_batch_seconds (int): Politique "batch" : secondes maximales entre deux synchronisations.
+        version_compression (str): Compression des versions du cache : "none", "gzip", "lzma" ou "zlib".
+        compression_level (int): Niveau de compression (-1 : défaut de l'algorithme).
+        version_store (str): Format des versions : "copy" ou "chunks".
+        chunk_repository (str): Répertoire du dépôt de blocs (par défaut : .cache/chunks).
+        max_cached_versions (int): Versions conservées par fichier (ou instantanés précédents conservés).
+        snapshot_mode (bool): Produire un instantané daté par synchronisation.
+        dedupe (str): Fichiers identiques de la source : "off", "hardlink" ou "reflink".
+        hash_cache_entries (int): Empreintes conservées dans le cache persistant (0 : pas de cache).
+        extra_destinations (list): Destinations supplémentaires, synchronisées depuis la même lecture de la source.
+        scan_cache_seconds (int): Âge maximal des répertoires repris du cache de parcours partagé (0 : pas de cache).
+        verify_copies (str): Vérification des copies : "off", "hash" ou "reread".
+        verify_only (bool): Auditer les destinations d'après leurs empreintes au lieu de synchroniser.
+        verify_rate_mb (int): Audit : débit de lecture maximal en Mio/s (0 : illimité).
+        spot_check_days (int): Contrôle par échantillonnage : délai (jours) de vérification de chaque fichier (0 : non).
+        spot_check_mb (int): Volume maximal (Mio) relu par le contrôle à chaque exécution (0 : illimité).
+        spot_check_sampling (str): "random" ou "stratified".
+        space_margin_mb (int): Espace (Mio) laissé libre sur chaque destination par les écritures planifiées.
+
+    Returns:
+        int: Code de sortie : EXIT_SUCCESS, EXIT_COMPLETED_WITH_ERRORS (fichiers ou destinations non
+             synchronisés), EXIT_STOPPED (arrêt demandé par SIGTERM) ou EXIT_FAILURE (erreur fatale).
     """
+    if CONTROL_SIGNALS: # POSIX
+        # Signaux de commande bloqués avant toute autre chose (un signal reçu plus tôt terminerait le
+        # processus), et avant le démarrage des autres threads, qui héritent du masque. L'API lance le
+        # script avec ces signaux déjà bloqués (masque hérité) : aucun signal n'est perdu au démarrage.
+        signal.pthread_sigmask(signal.SIG_BLOCK, CONTROL_SIGNALS)
+
     # Convertir les chaînes blacklist en listes
     blacklist_files_list = blacklist_files.split(';') if blacklist_files else []
     blacklist_dirs_list = blacklist_dirs.split(';') if blacklist_dirs else []
     log_file_path = Path(log_file)
 
-    engine = SyncEngine(source, destination, frequency_hours, blacklist_files_list, blacklist_dirs_list, config_name, log_file_path)
+    options = dict(trust_dir_mtime=trust_dir_mtime, deep_scan_days=deep_scan_days, scan_workers=scan_workers,
+                   copy_workers=copy_workers, buffer_size=buffer_size, read_order=read_order,
+                   low_cache=low_cache, segment_workers=segment_workers,
+                   segment_threshold_mb=segment_threshold_mb, durability=durability,
+                   sync_batch_mb=sync_batch_mb, sync_batch_seconds=sync_batch_seconds,
+                   version_compression=version_compression, compression_level=compression_level,
+                   version_store=version_store, chunk_repository=chunk_repository,
+                   max_cached_versions=max_cached_versions, snapshot_mode=snapshot_mode, dedupe=dedupe,
+                   hash_cache_entries=hash_cache_entries, scan_cache_seconds=scan_cache_seconds,
+                   verify_copies=verify_copies, spot_check_days=spot_check_days, spot_check_mb=spot_check_mb,
+                   spot_check_sampling=spot_check_sampling, space_margin_mb=space_margin_mb)
+    engine = SyncEngine(source, destination, frequency_hours, blacklist_files_list, blacklist_dirs_list, config_name, log_file_path,
+                        **options)
+    for number, extra_destination in enumerate(extra_destinations or [], start=2):
+        # Chaque destination supplémentaire a son propre état et écrit dans le même journal (logger enfant)
+        engine.replicas.append(SyncEngine(source, extra_destination, frequency_hours, blacklist_files_list,
+                                          blacklist_dirs_list, config_name, log_file_path,
+                                          state_name=replica_state_name(config_name, extra_destination),
+                                          logger=engine.logger.getChild(f"dest{number}"), **options))
+    if CONTROL_SIGNALS:
+        # Les signaux reçus depuis le blocage sont restés en attente et sont traités ici
+        threading.Thread(target=engine._control_loop, args=(CONTROL_SIGNALS,), name="control", daemon=True).start()
     try:
-        engine.run_sync()
+        if verify_only:
+            engine.run_audit(verify_rate_mb) # Arrêté : l'audit reprend après le dernier lot vérifié
+        else:
+            engine.run_sync()
+        if engine.stop_event.is_set():
+            return EXIT_STOPPED
+        return EXIT_COMPLETED_WITH_ERRORS if engine.has_errors() else EXIT_SUCCESS
     except Exception as e:
         engine.logger.critical(f"Erreur fatale lors de la synchronisation pour '{config_name}': {e}")
         engine.logger.exception(e) # Ceci ajoute le traceback complet au log
         # IMPORTANT: Ne pas print de message non formaté ici qui pourrait casser le parsing du backend.
         # Le backend lit le log du script, pas sa sortie standard directe pour les erreurs.
         # Le `logger.exception(e)` est suffisant.
+        return EXIT_FAILURE
     finally:
         logging.shutdown() #important
 
@@ -430,8 +2433,79 @@ if __name__ == "__main__":
     parser.add_argument("--blacklist-dirs", default="", help="Répertoires à exclure (séparés par ';').")
     parser.add_argument("--log-file", required=True, help="Chemin du fichier de log.")
     parser.add_argument("--config-name", required=True, help="Nom de la configuration.")
+    parser.add_argument("--trust-dir-mtime", action="store_true",
+                        help="Ne pas relire les répertoires dont la mtime est inchangée depuis la dernière synchronisation.")
+    parser.add_argument("--deep-scan-days", type=int, default=7,
+                        help="Nombre de jours entre deux parcours complets forcés (avec --trust-dir-mtime).")
+    parser.add_argument("--scan-workers", type=int, default=0,
+                        help="Nombre de threads de parcours de la source (0 : selon le périphérique).")
+    parser.add_argument("--copy-workers", type=int, default=0,
+                        help="Nombre de threads de copie (0 : selon les périphériques).")
+    parser.add_argument("--buffer-size", type=int, default=0,
+                        help="Taille des tampons de lecture en octets (0 : selon les périphériques).")
+    parser.add_argument("--read-order", choices=["auto", "path", "inode", "physical"], default="auto",
+                        help="Ordre de lecture des fichiers à copier.")
+    parser.add_argument("--low-cache", action="store_true",
+                        help="Copier sans remplir le cache de pages (posix_fadvise).")
+    parser.add_argument("--segment-workers", type=int, default=0,
+                        help="Threads de copie d'un même gros fichier (0 : selon les périphériques, 1 : désactivé).")
+    parser.add_argument("--segment-threshold-mb", type=int, default=1024,
+                        help="Taille (Mio) à partir de laquelle un fichier est copié par tranches en parallèle.")
+    parser.add_argument("--durability", choices=DURABILITY_MODES, default="batch",
+                        help="Politique de durabilité des écritures (aucune, fsync par fichier, ou groupée).")
+    parser.add_argument("--sync-batch-mb", type=int, default=256,
+                        help="Politique groupée : Mio écrits entre deux synchronisations du système de fichiers.")
+    parser.add_argument("--sync-batch-seconds", type=int, default=DEFAULT_BATCH_SECONDS,
+                        help="Politique groupée : secondes maximales entre deux synchronisations.")
+    parser.add_argument("--version-compression", choices=COMPRESSION_ALGORITHMS, default="none",
+                        help="Compression des anciennes versions conservées dans .cache.")
+    parser.add_argument("--compression-level", type=int, default=-1,
+                        help="Niveau de compression des versions (-1 : défaut de l'algorithme).")
+    parser.add_argument("--version-store", choices=["copy", "chunks"], default="copy",
+                        help="Format des versions : copie complète, ou dépôt de blocs dédupliqués.")
+    parser.add_argument("--chunk-repository", default=None,
+                        help="Répertoire du dépôt de blocs, partageable entre configurations (défaut : .cache/chunks).")
+    parser.add_argument("--max-cached-versions", type=int, default=2,
+                        help="Versions conservées par fichier dans .cache (ou instantanés précédents conservés).")
+    parser.add_argument("--snapshot-mode", action="store_true",
+                        help="Produire un instantané daté par synchronisation (fichiers inchangés liés physiquement).")
+    parser.add_argument("--dedupe", choices=DEDUPE_MODES, default="off",
+                        help="Copier une seule fois les fichiers identiques de la source, puis les relier.")
+    parser.add_argument("--hash-cache-entries", type=int, default=DEFAULT_MAX_ENTRIES,
+                        help="Empreintes de contenu conservées entre deux synchronisations (0 : pas de cache).")
+    parser.add_argument("--extra-destination", action="append", default=[], dest="extra_destinations",
+                        help="Destination supplémentaire (répétable) : la source n'est lue qu'une fois pour toutes.")
+    parser.add_argument("--scan-cache-seconds", type=int, default=0,
+                        help="Réutiliser pendant cette durée les répertoires lus par une autre configuration (0 : non).")
+    parser.add_argument("--verify-copies", choices=VERIFY_MODES, default="off",
+                        help="Empreinte des copies calculée pendant la copie (hash), et copie relue puis comparée (reread).")
+    parser.add_argument("--verify-only", action="store_true",
+                        help="Auditer les destinations d'après les empreintes enregistrées, sans synchroniser.")
+    parser.add_argument("--verify-rate-mb", type=int, default=0,
+                        help="Audit : débit de lecture maximal en Mio/s (0 : illimité).")
+    parser.add_argument("--spot-check-days", type=int, default=0,
+                        help="Contrôle par échantillonnage : chaque fichier est relu et vérifié dans ce délai (0 : non).")
+    parser.add_argument("--spot-check-mb", type=int, default=1024,
+                        help="Volume maximal (Mio) relu par le contrôle par échantillonnage à chaque exécution (0 : illimité).")
+    parser.add_argument("--spot-check-sampling", choices=SAMPLING_MODES, default="stratified",
+                        help="Échantillon tiré au hasard, ou réparti entre les répertoires de premier niveau.")
+    parser.add_argument("--space-margin-mb", type=int, default=DEFAULT_SPACE_MARGIN // (1024 * 1024),
+                        help="Espace (Mio) laissé libre sur chaque destination par les écritures planifiées.")
 
     args = parser.parse_args()
 
-    main(args.source, args.destination, args.frequency, args.blacklist_files, args.blacklist_dirs, args.config_name, args.log_file)
+    sys.exit(main(args.source, args.destination, args.frequency, args.blacklist_files, args.blacklist_dirs, args.config_name, args.log_file,
+                  trust_dir_mtime=args.trust_dir_mtime, deep_scan_days=args.deep_scan_days, scan_workers=args.scan_workers,
+                  copy_workers=args.copy_workers, buffer_size=args.buffer_size, read_order=args.read_order,
+                  low_cache=args.low_cache, segment_workers=args.segment_workers,
+                  segment_threshold_mb=args.segment_threshold_mb, durability=args.durability,
+                  sync_batch_mb=args.sync_batch_mb, sync_batch_seconds=args.sync_batch_seconds,
+                  version_compression=args.version_compression, compression_level=args.compression_level,
+                  version_store=args.version_store, chunk_repository=args.chunk_repository,
+                  max_cached_versions=args.max_cached_versions, snapshot_mode=args.snapshot_mode, dedupe=args.dedupe,
+                  hash_cache_entries=args.hash_cache_entries, extra_destinations=args.extra_destinations,
+                  scan_cache_seconds=args.scan_cache_seconds, verify_copies=args.verify_copies,
+                  verify_only=args.verify_only, verify_rate_mb=args.verify_rate_mb,
+                  spot_check_days=args.spot_check_days, spot_check_mb=args.spot_check_mb,
+                  spot_check_sampling=args.spot_check_sampling, space_margin_mb=args.space_margin_mb))
 
@@ -0,0 +1,54 @@
+# Outils communs aux tests : chemin d'import des modules du backend, synchronisations dans un répertoire
+# temporaire.
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import sync_engine  # noqa: E402
+
+
+def age(path, seconds=60):
+    """Recule la mtime d'un fichier ou répertoire (une mtime récente n'est ni enregistrée ni mise en cache)."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class EngineTestCase(unittest.TestCase):
+    """Source, destination et répertoire d'état temporaires."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.source = self.root / "source"
+        self.destination = self.root / "destination"
+        self.source.mkdir()
+        self.destination.mkdir()
+        state_patch = mock.patch.object(sync_engine, "STATE_DIR", self.root / "state")
+        state_patch.start()
+        self.addCleanup(state_patch.stop)
+
+    def write(self, rel_path, content):
+        path = self.source / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+        return path
+
+    def engine(self, **options):
+        return sync_engine.SyncEngine(self.source, self.destination, 1, [], [], "test", self.root / "sync.log",
+                                      **options)
+
+    def sync(self, **options):
+        engine = self.engine(**options)
+        engine.run_sync()
+        return engine
@@ -0,0 +1,103 @@
+# Tests de l'audit des destinations d'après les empreintes du manifeste (module audit, --verify-only).
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import audit
+import sync_engine
+from audit import DestinationAudit, RateLimiter
+from manifest_diff import Manifest
+from support import EngineTestCase
+
+
+class _Interrupted(Exception):
+    pass
+
+
+class RateLimiterTest(unittest.TestCase):
+
+    def test_unlimited(self):
+        with mock.patch("audit.time.sleep") as sleep:
+            RateLimiter(0).consume(10 ** 9)
+        sleep.assert_not_called()
+
+    def test_waits_beyond_rate(self):
+        limiter = RateLimiter(1000)
+        with mock.patch("audit.time.sleep") as sleep:
+            limiter.consume(1000) # Réserve initiale d'une seconde
+            sleep.assert_not_called()
+            limiter.consume(500)
+        self.assertAlmostEqual(sleep.call_args.args[0], 0.5, delta=0.05)
+
+
+class AuditSyncTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for name in ("a.txt", "b.txt", "c.txt", "d/e.txt"):
+            self.write(name, f"contenu de {name}")
+        self.sync(verify_copies="hash")
+
+    def test_report(self):
+        (self.destination / "a.txt").write_text("contenu altéré")
+        (self.destination / "d" / "e.txt").unlink()
+        report = self.engine().run_audit()
+        destination = report["destinations"][0]
+        self.assertEqual(destination["status"], "audited")
+        self.assertEqual(destination["verified"], 2)
+        self.assertEqual([entry["path"] for entry in destination["corrupt"]], ["a.txt"])
+        self.assertEqual(destination["missing"], ["d/e.txt"])
+        with open(self.root / "state" / "test.audit.json", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["destinations"][0]["missing"], ["d/e.txt"])
+
+    def test_without_digests(self):
+        self.sync() # Les empreintes des fichiers inchangés sont conservées
+        self.write("f.txt", "nouveau")
+        self.sync()
+        destination = self.engine().run_audit()["destinations"][0]
+        self.assertEqual((destination["verified"], destination["unverifiable"]), (4, 1))
+
+    def test_no_state(self):
+        engine = self.engine()
+        engine.state_file.unlink()
+        self.assertEqual(engine.run_audit()["destinations"][0]["status"], "no_state")
+
+    def test_interrupted_audit_resumes(self):
+        state = json.loads(self.engine().state_file.read_text(encoding="utf-8"))
+        manifest = Manifest.from_dict(state["manifest"])
+        progress_file = self.root / "progress.json"
+        checked = []
+
+        def interrupt_third_file():
+            if len(checked) == 2:
+                raise _Interrupted()
+            checked.append(None)
+
+        with mock.patch.object(audit, "AUDIT_BATCH_SIZE", 1):
+            first = DestinationAudit(self.destination, manifest, progress_file, 1, workers=1,
+                                     logger=mock.Mock(), checkpoint=interrupt_third_file)
+            with self.assertRaises(_Interrupted):
+                first.run()
+            self.assertEqual(json.loads(progress_file.read_text())["cursor"], "b.txt")
+            report = DestinationAudit(self.destination, manifest, progress_file, 1, workers=2,
+                                      logger=mock.Mock()).run()
+        self.assertTrue(report["resumed"])
+        self.assertEqual((report["checked"], report["verified"]), (4, 4))
+        self.assertFalse(progress_file.exists())
+
+    def test_progress_of_another_state_is_ignored(self):
+        state = json.loads(self.engine().state_file.read_text(encoding="utf-8"))
+        progress_file = self.root / "progress.json"
+        progress_file.write_text(json.dumps({"state_stamp": 1, "cursor": "c.txt"}))
+        report = DestinationAudit(self.destination, Manifest.from_dict(state["manifest"]), progress_file, 2,
+                                  workers=1, logger=mock.Mock()).run()
+        self.assertEqual((report["resumed"], report["checked"]), (False, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
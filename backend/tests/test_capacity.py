@@ -0,0 +1,76 @@
+# Tests du plan d'espace de la destination (module capacity).
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from capacity import InsufficientSpaceError, SpaceBudget
+from support import EngineTestCase
+
+BLOCK = 4096
+
+
+def _statvfs(free_blocks, total_blocks=1_000_000):
+    return os.statvfs_result((BLOCK, BLOCK, total_blocks, free_blocks, free_blocks, 0, 0, 0, 0, 255))
+
+
+class SpaceBudgetTest(unittest.TestCase):
+
+    def budget(self, free_blocks, margin):
+        with mock.patch("capacity.os.statvfs", return_value=_statvfs(free_blocks)):
+            return SpaceBudget("/dst", margin)
+
+    def test_reserve_rounds_to_blocks(self):
+        budget = self.budget(100, margin=0)
+        budget.reserve(1, "a")
+        budget.reserve(BLOCK + 1, "b")
+        self.assertEqual(budget.planned, 3 * BLOCK)
+
+    def test_plan_beyond_free_space_minus_margin(self):
+        budget = self.budget(10, margin=2 * BLOCK)
+        budget.reserve(8 * BLOCK, "a")
+        with self.assertRaises(InsufficientSpaceError):
+            budget.reserve(1, "b")
+        self.assertEqual(budget.planned, 8 * BLOCK)
+
+    def test_full_destination_accepts_empty_plan(self):
+        budget = self.budget(0, margin=16 * 1024 * 1024)
+        budget.reserve(0, "vide")
+        self.assertEqual(budget.planned, 0)
+
+
+class CapacitySyncTest(EngineTestCase):
+
+    def sync_with_free_blocks(self, free_blocks, **options):
+        with mock.patch("capacity.os.statvfs", return_value=_statvfs(free_blocks)):
+            return self.sync(**options)
+
+    def test_unchanged_run_on_full_destination(self):
+        self.write("a.txt", "a")
+        self.sync()
+        engine = self.sync_with_free_blocks(0)
+        self.assertIsNone(engine.failure)
+        self.assertFalse(engine.has_errors())
+
+    def test_plan_exceeding_free_space_writes_nothing(self):
+        self.write("big.bin", b"x" * (4 * BLOCK))
+        engine = self.sync_with_free_blocks(3, space_margin_mb=0)
+        self.assertIsInstance(engine.failure, InsufficientSpaceError)
+        self.assertFalse((self.destination / "big.bin").exists())
+
+    def test_configurable_margin(self):
+        self.write("big.bin", b"x" * (4 * BLOCK))
+        engine = self.sync_with_free_blocks(5, space_margin_mb=0)
+        self.assertIsNone(engine.failure)
+        self.assertEqual((self.destination / "big.bin").stat().st_size, 4 * BLOCK)
+        self.write("big.bin", b"y" * (4 * BLOCK))
+        engine = self.sync_with_free_blocks(20, space_margin_mb=1)
+        self.assertIsInstance(engine.failure, InsufficientSpaceError)
+
+
+if __name__ == "__main__":
+    unittest.main()
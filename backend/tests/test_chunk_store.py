@@ -0,0 +1,112 @@
+# Tests du ramasse-miettes du dépôt de blocs (module chunk_store).
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import chunk_store
+from chunk_store import RECIPE_SUFFIX, ChunkStore, CollectionSkipped, load_recipe
+
+
+class ChunkGarbageCollectionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.repository = self.root / "repository"
+
+    def save_versions(self, recipes_dir, contents):
+        """Conserve une version par contenu dans une session du dépôt ; retourne les recettes."""
+        recipes_dir.mkdir(parents=True, exist_ok=True)
+        store = ChunkStore(self.repository)
+        store.register_root(recipes_dir)
+        recipes = []
+        for number, content in enumerate(contents):
+            source = self.root / "file"
+            source.write_bytes(content)
+            recipe = recipes_dir / f"file.{number}{RECIPE_SUFFIX}"
+            store.save_version(source, recipe)
+            recipes.append(recipe)
+        store.close()
+        return recipes
+
+    def pack_bytes(self):
+        packs_dir = self.repository / "packs"
+        return sum(path.stat().st_size for path in packs_dir.iterdir() if path.suffix == ".pack")
+
+    def test_unreferenced_chunks_are_freed(self):
+        kept, pruned = self.save_versions(self.root / "a", [os.urandom(50_000), os.urandom(50_000)])
+        pruned.unlink()
+        size_before = self.pack_bytes()
+
+        store = ChunkStore(self.repository)
+        store.close()
+        stats = store.collect_garbage()
+
+        self.assertEqual(stats["chunks_removed"], 1)
+        self.assertEqual(stats["packs_rewritten"], 1)
+        self.assertLess(self.pack_bytes(), size_before)
+        restored = self.root / "restored"
+        store.restore(load_recipe(kept), restored)
+        self.assertEqual(len(restored.read_bytes()), 50_000)
+
+    def test_chunks_of_other_configurations_are_kept(self):
+        shared = os.urandom(50_000)
+        own, = self.save_versions(self.root / "a", [shared])
+        other, = self.save_versions(self.root / "b", [shared])
+        own.unlink()
+
+        store = ChunkStore(self.repository)
+        store.close()
+        stats = store.collect_garbage()
+
+        self.assertEqual(stats["chunks_removed"], 0)
+        store.restore(load_recipe(other), self.root / "restored")
+        self.assertEqual((self.root / "restored").read_bytes(), shared)
+
+    def test_all_packs_removed_when_no_recipe_remains(self):
+        for recipe in self.save_versions(self.root / "a", [os.urandom(10_000)]):
+            recipe.unlink()
+
+        store = ChunkStore(self.repository)
+        store.close()
+        stats = store.collect_garbage()
+
+        self.assertEqual(stats["packs_removed"], 1)
+        self.assertEqual(self.pack_bytes(), 0)
+        self.assertEqual(store.index, {})
+
+    def test_skipped_when_a_recipes_directory_is_missing(self):
+        self.save_versions(self.root / "a", [os.urandom(10_000)])
+        shutil.rmtree(self.root / "a")
+
+        store = ChunkStore(self.repository)
+        store.close()
+        with self.assertRaises(CollectionSkipped):
+            store.collect_garbage()
+        self.assertGreater(self.pack_bytes(), 0)
+
+    @unittest.skipIf(chunk_store.fcntl is None, "verrou du dépôt indisponible")
+    def test_postponed_while_repository_is_in_use(self):
+        for recipe in self.save_versions(self.root / "a", [os.urandom(10_000)]):
+            recipe.unlink()
+        in_use = ChunkStore(self.repository)
+        self.addCleanup(in_use.close)
+
+        store = ChunkStore(self.repository)
+        store.close()
+        with self.assertRaises(CollectionSkipped):
+            store.collect_garbage()
+        self.assertTrue(store.gc_pending)
+        in_use.close()
+        self.assertEqual(store.collect_garbage()["packs_removed"], 1)
+        self.assertFalse(store.gc_pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+# Tests de la copie de fichiers (module copy_backend) : noms temporaires, copie vers plusieurs destinations,
+# mode faible empreinte sur le cache, copie segmentée.
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import copy_backend
+from copy_backend import TEMP_SUFFIX, copy_file, copy_file_to_many, temporary_path
+from support import EngineTestCase
+
+# 80 caractères de 3 octets : 244 octets, sous la limite de 255 octets d'un nom de fichier
+LONG_NAME = "文" * 80 + ".txt"
+
+
+class TemporaryPathTest(unittest.TestCase):
+
+    def test_long_multibyte_name_fits(self):
+        tmp_name = os.path.basename(temporary_path(os.path.join("/dst", LONG_NAME)))
+        self.assertLessEqual(len(os.fsencode(tmp_name)), 255)
+        self.assertTrue(tmp_name.endswith(TEMP_SUFFIX))
+
+    def test_long_names_stay_distinct(self):
+        first = temporary_path(os.path.join("/dst", LONG_NAME), "tag")
+        second = temporary_path(os.path.join("/dst", "文" * 80 + ".dat"), "tag")
+        self.assertNotEqual(first, second)
+
+    def test_short_name_is_kept(self):
+        self.assertEqual(temporary_path("/dst/a.txt", "tag"), f"/dst/.a.txt.tag{TEMP_SUFFIX}")
+
+
+class LongNameCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.src = self.root / LONG_NAME
+        self.src.write_bytes(b"contenu")
+
+    def test_copy_file(self):
+        (self.root / "dst").mkdir()
+        copy_file(self.src, self.root / "dst" / LONG_NAME, fsync=True)
+        self.assertEqual((self.root / "dst" / LONG_NAME).read_bytes(), b"contenu")
+        self.assertEqual(os.listdir(self.root / "dst"), [LONG_NAME])
+
+    def test_copy_file_to_many(self):
+        targets = []
+        for name in ("a", "b"):
+            (self.root / name).mkdir()
+            targets.append(self.root / name / LONG_NAME)
+        size, failures = copy_file_to_many(self.src, targets)
+        self.assertEqual((size, failures), (7, {}))
+        for target in targets:
+            self.assertEqual(target.read_bytes(), b"contenu")
+
+
+class LongNameSyncTest(EngineTestCase):
+
+    def test_sync_copies_long_multibyte_name(self):
+        self.write(LONG_NAME, "contenu")
+        self.write("b/" + LONG_NAME, "contenu")
+        self.sync(dedupe="hardlink")
+        self.assertEqual((self.destination / LONG_NAME).read_text(), "contenu")
+        self.assertEqual((self.destination / "b" / LONG_NAME).read_text(), "contenu")
+
+
+class CopyTestCase(unittest.TestCase):
+    """Fichier source aléatoire dans un répertoire temporaire."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.data = os.urandom(300 * 1024 + 17)
+        self.src = self.root / "source.bin"
+        self.src.write_bytes(self.data)
+        os.chmod(self.src, 0o640)
+        os.utime(self.src, ns=(1_600_000_000_000_000_000, 1_600_000_000_123_456_789))
+        self.dst = self.root / "copie.bin"
+
+    def assert_copied(self):
+        self.assertEqual(self.dst.read_bytes(), self.data)
+        src_st, dst_st = os.stat(self.src), os.stat(self.dst)
+        self.assertEqual((dst_st.st_mode, dst_st.st_mtime_ns), (src_st.st_mode, src_st.st_mtime_ns))
+        self.assertEqual(sorted(os.listdir(self.root)), ["copie.bin", "source.bin"])
+
+
+@unittest.skipUnless(hasattr(os, "posix_fadvise"), "posix_fadvise indisponible")
+class LowCacheCopyTest(CopyTestCase):
+
+    def copy(self, **options):
+        with mock.patch.object(copy_backend, "DONTNEED_INTERVAL", 64 * 1024), \
+                mock.patch("os.posix_fadvise", wraps=os.posix_fadvise) as fadvise, \
+                mock.patch("os.fdatasync", wraps=os.fdatasync) as fdatasync:
+            size = copy_file(self.src, self.dst, buffer_size=16 * 1024, low_cache=True, **options)
+        self.assertEqual(size, len(self.data))
+        return fadvise, fdatasync
+
+    def test_pages_released_by_slices(self):
+        fadvise, fdatasync = self.copy()
+        self.assert_copied()
+        dontneed = [call for call in fadvise.call_args_list if call.args[3] == os.POSIX_FADV_DONTNEED]
+        self.assertEqual(len(dontneed), 2 * 5) # 4 tranches de 64 Kio et la fin, sur la source et la copie
+        self.assertEqual(fdatasync.call_count, 5)
+
+    def test_hashed_copy(self):
+        hasher = hashlib.sha256()
+        self.copy(hasher=hasher)
+        self.assert_copied()
+        self.assertEqual(hasher.digest(), hashlib.sha256(self.data).digest())
+
+    def test_drop_from_cache(self):
+        with mock.patch("os.posix_fadvise") as fadvise:
+            copy_backend.drop_from_cache(self.src)
+            copy_backend.drop_from_cache(self.root / "absent")
+        self.assertEqual(fadvise.call_count, 1)
+        self.assertEqual(fadvise.call_args.args[1:], (0, 0, os.POSIX_FADV_DONTNEED))
+
+
+class LowCacheSyncTest(EngineTestCase):
+
+    def test_sync_low_cache(self):
+        self.write("a/b.bin", os.urandom(100_000))
+        self.sync(low_cache=True)
+        self.write("a/b.bin", b"nouvelle version")
+        self.sync(low_cache=True)
+        self.assertEqual((self.destination / "a" / "b.bin").read_bytes(), b"nouvelle version")
+
+
+class SegmentedCopyTest(CopyTestCase):
+
+    def setUp(self):
+        super().setUp()
+        segment_patch = mock.patch.object(copy_backend, "SEGMENT_SIZE", 32 * 1024)
+        segment_patch.start()
+        self.addCleanup(segment_patch.stop)
+
+    def test_segments_copied_by_several_threads(self):
+        threads = set()
+        copy_range = copy_backend._copy_range
+
+        def recording_copy_range(*args):
+            threads.add(threading.current_thread().name)
+            return copy_range(*args)
+
+        with mock.patch.object(copy_backend, "_copy_range", side_effect=recording_copy_range) as ranges:
+            copy_file(self.src, self.dst, segment_workers=4, segment_threshold=64 * 1024)
+        self.assert_copied()
+        self.assertEqual(ranges.call_count, 10) # 300 Kio + 17 octets en tranches de 32 Kio
+        self.assertTrue(threads and all(name.startswith("segment-") for name in threads))
+
+    def test_below_threshold_is_not_segmented(self):
+        with mock.patch.object(copy_backend, "_copy_segmented") as segmented:
+            copy_file(self.src, self.dst, segment_workers=4, segment_threshold=len(self.data) + 1)
+        segmented.assert_not_called()
+        self.assert_copied()
+
+    def test_fallback_without_copy_file_range(self):
+        with mock.patch("os.copy_file_range", side_effect=OSError(95, "non pris en charge"), create=True):
+            copy_file(self.src, self.dst, segment_workers=3, segment_threshold=0)
+        self.assert_copied()
+
+    def test_segment_error_removes_temporary(self):
+        with mock.patch.object(copy_backend, "_copy_range", side_effect=OSError(5, "erreur d'E/S")):
+            with self.assertRaises(OSError):
+                copy_file(self.src, self.dst, segment_workers=4, segment_threshold=0)
+        self.assertEqual(os.listdir(self.root), ["source.bin"])
+
+    def test_preallocated_copy(self):
+        with mock.patch.object(copy_backend, "_preallocate", wraps=copy_backend._preallocate) as preallocate:
+            copy_file(self.src, self.dst, preallocate_threshold=1024)
+        preallocate.assert_called_once()
+        self.assertEqual(preallocate.call_args.args[1], len(self.data))
+        self.assert_copied()
+
+
+class SegmentedSyncTest(EngineTestCase):
+
+    def test_sync_segmented(self):
+        data = os.urandom(200_000)
+        self.write("gros.bin", data)
+        with mock.patch.object(copy_backend, "SEGMENT_SIZE", 16 * 1024):
+            self.sync(segment_workers=4, segment_threshold_mb=0)
+        self.assertEqual((self.destination / "gros.bin").read_bytes(), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+# Tests de la déduplication pendant la copie (module dedupe).
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import dedupe
+from dedupe import DuplicateIndex
+from support import EngineTestCase
+
+
+class _SlowOriginal(dedupe._Original):
+    """Élargit l'intervalle entre la lecture du groupe et l'inscription de l'original."""
+    def __init__(self, *args):
+        time.sleep(0.02)
+        super().__init__(*args)
+
+
+class DuplicateIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        (self.root / "src").mkdir()
+        (self.root / "dst").mkdir()
+
+    def make_sources(self, contents):
+        paths = []
+        for number, content in enumerate(contents):
+            path = self.root / "src" / f"f{number}"
+            path.write_bytes(content)
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+            paths.append(path)
+        return paths
+
+    def slow_copy(self, src, dst):
+        time.sleep(0.05) # Laisse les autres threads arriver pendant la copie
+        shutil.copy2(src, dst)
+
+    def run_workers(self, index, sources, workers):
+        barrier = threading.Barrier(workers)
+
+        def copy(src):
+            if len(sources) <= workers:
+                barrier.wait() # Arrivées simultanées
+            return index.copy_or_link(src, self.root / "dst" / src.name, self.slow_copy)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(copy, sources))
+
+    def test_simultaneous_duplicates_are_linked(self):
+        content = os.urandom(4096)
+        sources = self.make_sources([content] * 4)
+        index = DuplicateIndex("hardlink")
+
+        linked = self.run_workers(index, sources, workers=4)
+
+        self.assertEqual(linked.count(False), 1)
+        self.assertEqual(index.files_linked, 3)
+        self.assertEqual(len({(self.root / "dst" / src.name).stat().st_ino for src in sources}), 1)
+        for src in sources:
+            self.assertEqual((self.root / "dst" / src.name).read_bytes(), content)
+
+    def test_original_is_registered_before_other_workers_look(self):
+        content = os.urandom(4096)
+        sources = self.make_sources([content] * 4)
+        index = DuplicateIndex("hardlink")
+
+        with mock.patch.object(dedupe, "_Original", _SlowOriginal):
+            self.run_workers(index, sources, workers=4)
+
+        self.assertEqual(index.files_linked, 3)
+
+    def test_different_contents_of_same_size_are_copied(self):
+        sources = self.make_sources([os.urandom(4096) for _ in range(4)])
+        index = DuplicateIndex("hardlink")
+
+        linked = self.run_workers(index, sources, workers=4)
+
+        self.assertEqual(linked, [False] * 4)
+        for src in sources:
+            self.assertEqual((self.root / "dst" / src.name).read_bytes(), src.read_bytes())
+
+    def test_failed_original_copy_is_not_linked(self):
+        content = os.urandom(4096)
+        first, second = self.make_sources([content] * 2)
+        index = DuplicateIndex("hardlink")
+
+        def failing_copy(src, dst):
+            raise OSError("échec simulé")
+
+        with self.assertRaises(OSError):
+            index.copy_or_link(first, self.root / "dst" / "f0", failing_copy)
+        self.assertFalse(index.copy_or_link(second, self.root / "dst" / "f1", shutil.copy2))
+        self.assertEqual(index.files_linked, 0)
+
+    def test_hardlink_requires_identical_metadata(self):
+        content = os.urandom(4096)
+        first, second = self.make_sources([content] * 2)
+        os.chmod(second, 0o600)
+        index = DuplicateIndex("hardlink")
+
+        self.run_workers(index, [first, second], workers=2)
+
+        self.assertEqual(index.files_linked, 0)
+
+    def test_small_files_are_always_copied(self):
+        sources = self.make_sources([b"x" * 10] * 2)
+        index = DuplicateIndex("hardlink")
+
+        self.run_workers(index, sources, workers=2)
+
+        self.assertEqual(index.files_linked, 0)
+
+
+class DedupeSyncTest(EngineTestCase):
+
+    def test_copies_of_a_file_are_linked_with_several_copy_workers(self):
+        content = os.urandom(200_000)
+        first = self.write("a.bin", content)
+        for name in ("b.bin", "dir/c.bin", "dir/d.bin"):
+            copy = self.write(name, content)
+            shutil.copystat(first, copy)
+
+        engine = self.sync(dedupe="hardlink", copy_workers=4)
+
+        self.assertEqual(engine.duplicates.files_linked, 3)
+        inodes = {(self.destination / name).stat().st_ino for name in ("a.bin", "b.bin", "dir/c.bin", "dir/d.bin")}
+        self.assertEqual(len(inodes), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# Tests de l'identification des périphériques et du choix des paramètres d'E/S (module device_profile).
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import device_profile
+from device_profile import DEVICE_PROFILES, DeviceInfo, choose_io_settings, identify_device
+from support import EngineTestCase
+
+
+def _device(kind):
+    return DeviceInfo(None, None, kind)
+
+
+class IdentifyDeviceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.dev = os.stat(self.root).st_dev
+        self.number = f"{os.major(self.dev)}:{os.minor(self.dev)}"
+        for name, value in (("MOUNTINFO_PATH", self.root / "mountinfo"), ("SYS_DEV_BLOCK", self.root / "dev-block"),
+                            ("SYS_CLASS_BLOCK", self.root / "class-block")):
+            patch = mock.patch.object(device_profile, name, value)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def mount(self, fstype, source):
+        (self.root / "mountinfo").write_text(f"36 25 {self.number} / /mnt rw,relatime shared:1 - {fstype} {source} rw\n")
+
+    def block_device(self, name, rotational, partition=None):
+        disk = self.root / "devices" / name
+        (disk / "queue").mkdir(parents=True)
+        (disk / "queue" / "rotational").write_text(f"{rotational}\n")
+        target = disk
+        if partition:
+            target = disk / partition
+            target.mkdir()
+        (self.root / "dev-block").mkdir(exist_ok=True)
+        os.symlink(target, self.root / "dev-block" / self.number)
+
+    def test_network_filesystem(self):
+        self.mount("nfs4", "server:/export")
+        self.assertEqual(identify_device(self.root).kind, "network")
+
+    def test_smb_share_source(self):
+        self.mount("fuse.custom", "//server/share")
+        self.assertEqual(identify_device(self.root).kind, "network")
+
+    def test_rotational_partition(self):
+        self.mount("ext4", "/dev/sda1")
+        self.block_device("sda", 1, partition="sda1")
+        self.assertEqual(identify_device(self.root).kind, "rotational")
+
+    def test_nvme_and_ssd(self):
+        self.mount("ext4", "/dev/nvme0n1p2")
+        self.block_device("nvme0n1", 0, partition="nvme0n1p2")
+        self.assertEqual(identify_device(self.root).kind, "nvme")
+        shutil.rmtree(self.root / "dev-block")
+        self.block_device("sdb", 0)
+        self.assertEqual(identify_device(self.root).kind, "ssd")
+
+    def test_unknown_without_sysfs(self):
+        self.mount("overlay", "overlay")
+        self.assertEqual(identify_device(self.root).kind, "unknown")
+
+    def test_missing_path_uses_existing_ancestor(self):
+        self.mount("nfs", "server:/export")
+        info = identify_device(self.root / "pas" / "encore" / "créé")
+        self.assertEqual((info.path, info.kind), (self.root, "network"))
+
+
+class ChooseIoSettingsTest(unittest.TestCase):
+
+    def test_slowest_side_limits_copy_concurrency(self):
+        settings = choose_io_settings(_device("nvme"), _device("rotational"))
+        self.assertEqual(settings["copy_workers"], 1)
+        self.assertEqual(settings["segment_workers"], 1)
+        self.assertEqual(settings["buffer_size"], DEVICE_PROFILES["rotational"]["buffer_size"])
+
+    def test_scan_and_read_order_follow_source(self):
+        settings = choose_io_settings(_device("rotational"), _device("nvme"))
+        self.assertEqual(settings["scan_workers"], DEVICE_PROFILES["rotational"]["scan_workers"])
+        self.assertEqual(settings["read_order"], "physical")
+        settings = choose_io_settings(_device("network"), _device("ssd"))
+        self.assertEqual((settings["scan_workers"], settings["read_order"]), (16, "path"))
+
+
+class ConfigureIoTest(EngineTestCase):
+
+    def test_explicit_values_are_kept(self):
+        engine = self.engine(copy_workers=3, read_order="inode")
+        with mock.patch("sync_engine.identify_device", return_value=_device("rotational")):
+            engine._configure_io()
+        self.assertEqual((engine.copy_workers, engine.read_order), (3, "inode"))
+        self.assertEqual(engine.scan_workers, DEVICE_PROFILES["rotational"]["scan_workers"])
+        self.assertEqual(engine.buffer_size, DEVICE_PROFILES["rotational"]["buffer_size"])
+
+    def test_identification_failure_uses_default_profile(self):
+        engine = self.engine()
+        with mock.patch("sync_engine.identify_device", side_effect=PermissionError("refusé")):
+            engine._configure_io()
+        self.assertEqual(engine.copy_workers, DEVICE_PROFILES["unknown"]["copy_workers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
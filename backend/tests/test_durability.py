@@ -0,0 +1,132 @@
+# Tests de la validation atomique des copies et de la politique de durabilité (module durability).
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import durability
+from copy_backend import TEMP_SUFFIX, copy_file
+from durability import DurabilityPolicy
+from support import EngineTestCase
+
+
+class DurabilityPolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        sync_patch = mock.patch.object(durability, "sync_filesystem")
+        self.sync_filesystem = sync_patch.start()
+        self.addCleanup(sync_patch.stop)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            DurabilityPolicy("toujours", "/dst")
+
+    def test_none_and_fsync_never_sync_filesystem(self):
+        for mode, fsync_files in (("none", False), ("fsync", True)):
+            policy = DurabilityPolicy(mode, "/dst", batch_bytes=1)
+            policy.file_committed(10)
+            policy.flush()
+            self.assertEqual(policy.fsync_files, fsync_files)
+        self.sync_filesystem.assert_not_called()
+
+    def test_batch_by_volume(self):
+        policy = DurabilityPolicy("batch", "/dst", batch_bytes=100, batch_seconds=3600)
+        policy.file_committed(60)
+        self.assertEqual(policy.syncs, 0)
+        policy.file_committed(60)
+        self.assertEqual(policy.syncs, 1)
+        policy.file_committed(60)
+        self.assertEqual(policy.syncs, 1) # Compteur remis à zéro par la synchronisation
+        policy.flush()
+        self.assertEqual(policy.syncs, 2)
+        self.sync_filesystem.assert_called_with("/dst")
+
+    def test_batch_by_delay(self):
+        policy = DurabilityPolicy("batch", "/dst", batch_bytes=10 ** 9, batch_seconds=30)
+        policy.file_committed(1)
+        with mock.patch("durability.time.monotonic", return_value=time.monotonic() + 31):
+            policy.file_committed(1)
+        self.assertEqual(policy.syncs, 1)
+
+
+class SyncFilesystemTest(unittest.TestCase):
+
+    def test_falls_back_to_os_sync(self):
+        with mock.patch.object(durability, "_syncfs_function", return_value=None), \
+                mock.patch("durability.os.sync") as os_sync:
+            durability.sync_filesystem(tempfile.gettempdir())
+        os_sync.assert_called_once()
+
+    def test_syncfs(self):
+        syncfs = mock.Mock(return_value=0)
+        with mock.patch.object(durability, "_syncfs_function", return_value=syncfs), \
+                mock.patch("durability.os.sync") as os_sync:
+            durability.sync_filesystem(tempfile.gettempdir())
+        syncfs.assert_called_once()
+        os_sync.assert_not_called()
+
+
+class AtomicCopyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.src = self.root / "source.txt"
+        self.src.write_text("nouvelle version")
+        self.dst = self.root / "destination.txt"
+        self.dst.write_text("ancienne version")
+
+    def test_interrupted_copy_keeps_previous_version(self):
+        def partial_copy(src, dst):
+            with open(dst, "w") as f:
+                f.write("nouv")
+            raise OSError(28, "plus de place")
+
+        with mock.patch("copy_backend.shutil.copyfile", side_effect=partial_copy):
+            with self.assertRaises(OSError):
+                copy_file(self.src, self.dst)
+        self.assertEqual(self.dst.read_text(), "ancienne version")
+        self.assertEqual(sorted(os.listdir(self.root)), ["destination.txt", "source.txt"])
+
+    def test_fsync_copy_syncs_file_and_directory(self):
+        with mock.patch("copy_backend.fsync_directory") as fsync_directory, \
+                mock.patch("os.fsync", wraps=os.fsync) as fsync:
+            copy_file(self.src, self.dst, fsync=True)
+        self.assertEqual(self.dst.read_text(), "nouvelle version")
+        self.assertTrue(fsync.called)
+        fsync_directory.assert_called_once_with(str(self.root))
+
+
+class DurabilitySyncTest(EngineTestCase):
+
+    def test_stale_temporaries_removed_after_interruption(self):
+        self.write("a.txt", "a")
+        self.sync()
+        stale = self.destination / f".a.txt.1.2{TEMP_SUFFIX}"
+        stale.write_text("reste d'une copie interrompue")
+        engine = self.engine()
+        engine.running_marker.touch() # Synchronisation précédente interrompue
+        engine.run_sync()
+        self.assertFalse(stale.exists())
+        self.assertFalse(engine.running_marker.exists())
+
+    def test_modes(self):
+        self.write("a.txt", "a")
+        for mode in ("none", "fsync", "batch"):
+            with mock.patch.object(durability, "sync_filesystem") as sync_filesystem:
+                self.write("a.txt", mode)
+                engine = self.sync(durability=mode)
+            self.assertEqual((self.destination / "a.txt").read_text(), mode)
+            self.assertEqual(sync_filesystem.called, mode == "batch")
+            self.assertEqual(engine.durability.syncs >= 1, mode == "batch")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# Tests du classement des erreurs de copie (module file_errors) et de leur isolation par fichier.
+
+import errno
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import file_errors
+import sync_engine
+from file_errors import RETRY_ATTEMPTS, classify_error, retry_delays
+from support import EngineTestCase
+
+
+class ClassifyErrorTest(unittest.TestCase):
+
+    def test_classes(self):
+        for code, expected in ((errno.EIO, "transient"), (errno.EAGAIN, "transient"), (errno.ENOSPC, "destination"),
+                               (errno.EROFS, "destination"), (errno.EACCES, "permanent"),
+                               (errno.ENOENT, "permanent"), (errno.ENAMETOOLONG, "permanent")):
+            self.assertEqual(classify_error(OSError(code, "erreur")), expected)
+        self.assertEqual(classify_error(TimeoutError("délai dépassé")), "transient")
+
+    def test_retry_delays(self):
+        self.assertEqual(retry_delays(), [0.5, 1.0, 2.0])
+        self.assertEqual(len(retry_delays()), RETRY_ATTEMPTS - 1)
+
+
+class FileErrorSyncTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        backoff_patch = mock.patch.object(file_errors, "RETRY_BACKOFF", 0)
+        backoff_patch.start()
+        self.addCleanup(backoff_patch.stop)
+        for name in ("a.txt", "b.txt", "c.txt"):
+            self.write(name, name)
+
+    def sync_failing(self, failures, **options):
+        """Synchronise ; la copie de b.txt lève successivement les erreurs de 'failures'."""
+        failures = list(failures)
+        copy_file = sync_engine.copy_file
+
+        def failing_copy(src, dst, *args, **kwargs):
+            if Path(src).name == "b.txt" and failures:
+                raise failures.pop(0)
+            return copy_file(src, dst, *args, **kwargs)
+
+        with mock.patch.object(sync_engine, "copy_file", side_effect=failing_copy):
+            return self.sync(**options)
+
+    def test_transient_error_retried(self):
+        engine = self.sync_failing([OSError(errno.EIO, "erreur d'E/S")] * (RETRY_ATTEMPTS - 1))
+        self.assertFalse(engine.has_errors())
+        self.assertEqual((self.destination / "b.txt").read_text(), "b.txt")
+
+    def test_permanent_error_skips_the_file(self):
+        engine = self.sync_failing([PermissionError(errno.EACCES, "accès refusé")])
+        self.assertTrue(engine.has_errors())
+        self.assertIsNone(engine.failure)
+        self.assertEqual([(error["path"], error["class"]) for error in engine.file_errors], [("b.txt", "permanent")])
+        self.assertEqual(engine.files_added, 2)
+        self.assertFalse((self.destination / "b.txt").exists())
+        with open(self.root / "state" / "test.errors.json", encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["destinations"][0]["files"][0]["path"], "b.txt")
+        engine = self.sync() # Retiré du manifeste : repris à la synchronisation suivante
+        self.assertEqual(engine.files_added, 1)
+        self.assertFalse(engine.has_errors())
+        self.assertEqual((self.destination / "b.txt").read_text(), "b.txt")
+
+    def test_persistent_transient_error(self):
+        engine = self.sync_failing([OSError(errno.EIO, "erreur d'E/S")] * RETRY_ATTEMPTS)
+        self.assertEqual([error["class"] for error in engine.file_errors], ["transient"])
+        self.assertTrue((self.destination / "c.txt").exists())
+
+    def test_destination_error_stops_the_destination(self):
+        engine = self.engine(copy_workers=1)
+        copy_file = sync_engine.copy_file
+
+        def failing_copy(src, dst, *args, **kwargs):
+            if Path(src).name == "b.txt":
+                raise OSError(errno.ENOSPC, "plus de place")
+            return copy_file(src, dst, *args, **kwargs)
+
+        with mock.patch.object(sync_engine, "copy_file", side_effect=failing_copy):
+            with self.assertRaises(OSError) as raised: # Seule destination : la synchronisation s'interrompt
+                engine.run_sync()
+        self.assertEqual(raised.exception.errno, errno.ENOSPC)
+        self.assertIs(engine.failure, raised.exception)
+        self.assertEqual(engine.file_errors, [])
+        self.assertFalse(engine.state_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Tests du cache persistant des empreintes de contenu (module hash_cache).
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hash_cache import CACHE_MAGIC, HashCache
+from support import EngineTestCase
+
+
+class HashCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.cache_file = self.root / "state" / "test.hashes"
+
+    def file(self, name, data):
+        path = self.root / name
+        path.write_bytes(data)
+        return path
+
+    def test_hit_until_file_changes(self):
+        path = self.file("a", b"contenu")
+        cache = HashCache(self.cache_file)
+        self.assertEqual(cache.digest(path), hashlib.sha256(b"contenu").digest())
+        cache.digest(path)
+        self.assertEqual((cache.hits, cache.misses, cache.bytes_hashed), (1, 1, 7))
+        path.write_bytes(b"autre contenu")
+        self.assertEqual(cache.digest(path), hashlib.sha256(b"autre contenu").digest())
+        self.assertEqual(cache.misses, 2)
+
+    def test_saved_and_reloaded(self):
+        path = self.file("a", b"contenu")
+        cache = HashCache(self.cache_file)
+        cache.digest(path)
+        cache.save()
+        reloaded = HashCache(self.cache_file)
+        self.assertEqual(len(reloaded), 1)
+        self.assertEqual(reloaded.lookup(os.stat(path)), hashlib.sha256(b"contenu").digest())
+
+    def test_least_recently_used_evicted(self):
+        paths = [self.file(name, name.encode()) for name in "abc"]
+        cache = HashCache(self.cache_file, max_entries=2)
+        cache.digest(paths[0])
+        cache.digest(paths[1])
+        cache.digest(paths[0]) # "a" redevient le plus récent
+        cache.digest(paths[2])
+        self.assertIsNotNone(cache.lookup(os.stat(paths[0])))
+        self.assertIsNone(cache.lookup(os.stat(paths[1])))
+        cache.save()
+        self.assertEqual(len(HashCache(self.cache_file, max_entries=1)), 1)
+
+    def test_invalid_or_truncated_file(self):
+        self.cache_file.parent.mkdir()
+        self.cache_file.write_bytes(b"pas un cache")
+        self.assertEqual(len(HashCache(self.cache_file)), 0)
+        path = self.file("a", b"contenu")
+        cache = HashCache(self.cache_file)
+        cache.digest(path)
+        cache.save()
+        data = self.cache_file.read_bytes()
+        self.cache_file.write_bytes(data + b"\0" * 10) # Enregistrement incomplet ignoré
+        self.assertEqual(len(HashCache(self.cache_file)), 1)
+        self.assertTrue(data.startswith(CACHE_MAGIC))
+
+    def test_store(self):
+        path = self.file("a", b"contenu")
+        cache = HashCache(self.cache_file)
+        cache.store(os.stat(path), b"x" * 32)
+        self.assertEqual(cache.digest(path), b"x" * 32)
+
+
+class HashCacheSyncTest(EngineTestCase):
+
+    def test_content_comparison_reuses_digests(self):
+        for name in ("a.bin", "b.bin"):
+            self.write(name, os.urandom(10_000))
+            shutil.copy2(self.source / name, self.destination / name)
+        engine = self.sync() # Pas d'état précédent : comparaison des contenus par empreintes
+        self.assertEqual((engine.hash_cache.misses, engine.files_added), (4, 0))
+        engine.state_file.unlink()
+        engine = self.sync()
+        self.assertEqual((engine.hash_cache.hits, engine.hash_cache.misses), (4, 0))
+
+    def test_disabled(self):
+        self.write("a.bin", b"a")
+        engine = self.sync(hash_cache_entries=0)
+        self.assertIsNone(engine.hash_cache)
+        self.assertFalse(engine.hash_cache_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
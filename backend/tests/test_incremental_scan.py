@@ -0,0 +1,60 @@
+# Tests du parcours incrémental (--trust-dir-mtime) : répertoires de mtime inchangée repris de l'état.
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from support import EngineTestCase, age
+
+
+class IncrementalScanTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for rel_path in ("a/1.txt", "b/2.txt", "b/c/3.txt"):
+            self.write(rel_path, rel_path)
+        self.age_source()
+
+    def age_source(self):
+        for path in [self.source] + [path for path in self.source.rglob("*") if path.is_dir()]:
+            age(path)
+
+    def test_unchanged_directories_are_reused(self):
+        self.sync(trust_dir_mtime=True)
+        engine = self.sync(trust_dir_mtime=True)
+        self.assertEqual((engine.dirs_scanned, engine.dirs_reused), (0, 4))
+        self.assertEqual(engine.compare_result["counts"]["unchanged"], 3)
+
+    def test_changed_directory_is_read_again(self):
+        self.sync(trust_dir_mtime=True)
+        self.write("b/new.txt", "new")
+        age(self.source / "b", seconds=30)
+        engine = self.sync(trust_dir_mtime=True)
+        self.assertEqual((engine.dirs_scanned, engine.dirs_reused), (1, 3))
+        self.assertEqual((self.destination / "b" / "new.txt").read_text(), "new")
+
+    def test_recent_directory_mtime_is_not_trusted(self):
+        self.sync(trust_dir_mtime=True)
+        self.write("a/new.txt", "new") # mtime dans la fenêtre de course : non enregistrée
+        self.sync(trust_dir_mtime=True)
+        engine = self.sync(trust_dir_mtime=True)
+        self.assertEqual(engine.dirs_scanned, 1)
+
+    def test_deep_scan_interval(self):
+        self.sync(trust_dir_mtime=True)
+        engine = self.sync(trust_dir_mtime=True, deep_scan_days=0)
+        self.assertEqual((engine.dirs_scanned, engine.dirs_reused), (4, 0))
+
+    def test_blacklist_change_forces_deep_scan(self):
+        self.sync(trust_dir_mtime=True)
+        engine = self.engine(trust_dir_mtime=True)
+        engine.blacklist_files = ["2.txt"]
+        engine.run_sync()
+        self.assertEqual(engine.dirs_reused, 0)
+        self.assertFalse((self.destination / "b" / "2.txt").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Tests du différentiel de manifestes (module manifest_diff) : chemins vectorisé et Python pur.
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import manifest_diff
+import sync_engine
+from manifest_diff import Manifest, diff_manifests
+from support import EngineTestCase
+
+# (chemin, size, mtime_ns, mode, ino, dev, uid, gid)
+PREVIOUS = [
+    ("a.txt", 10, 1000, 0o100644, 1, 1, 1000, 1000),
+    ("b/changed-size.txt", 10, 1000, 0o100644, 2, 1, 1000, 1000),
+    ("b/changed-mtime.txt", 10, 1000, 0o100644, 3, 1, 1000, 1000),
+    ("b/chmod.txt", 10, 1000, 0o100644, 4, 1, 1000, 1000),
+    ("b/chown.txt", 10, 1000, 0o100644, 5, 1, 1000, 1000),
+    ("c/deleted.txt", 10, 1000, 0o100644, 6, 1, 1000, 1000),
+    ("z.txt", 10, 1000, 0o100644, 7, 1, 1000, 1000),
+]
+CURRENT = [
+    ("a.txt", 10, 1000, 0o100644, 1, 1, 1000, 1000),
+    ("b/changed-size.txt", 11, 1000, 0o100644, 2, 1, 1000, 1000),
+    ("b/changed-mtime.txt", 10, 2000, 0o100600, 3, 1, 1000, 1000),
+    ("b/chmod.txt", 10, 1000, 0o100600, 4, 1, 1000, 1000),
+    ("b/chown.txt", 10, 1000, 0o100644, 5, 1, 0, 1000),
+    ("b/added.txt", 10, 1000, 0o100644, 8, 1, 1000, 1000),
+    ("zz-added.txt", 10, 1000, 0o100644, 9, 1, 1000, 1000),
+    ("z.txt", 10, 1000, 0o100644, 7, 1, 1000, 1000),
+]
+
+
+def _lists(diff):
+    return {name: getattr(diff, name) for name in ("added", "changed", "metadata", "unchanged", "deleted")}
+
+
+class DiffPythonTest(unittest.TestCase):
+
+    def test_categories(self):
+        diff = diff_manifests(Manifest.from_rows(PREVIOUS), Manifest.from_rows(CURRENT), use_numpy=False)
+        self.assertEqual(_lists(diff), {
+            "added": ["b/added.txt", "zz-added.txt"],
+            "changed": ["b/changed-mtime.txt", "b/changed-size.txt"],
+            "metadata": ["b/chmod.txt", "b/chown.txt"],
+            "unchanged": ["a.txt", "z.txt"],
+            "deleted": ["c/deleted.txt"],
+        })
+
+    def test_fallback_without_numpy(self):
+        previous, current = Manifest.from_rows(PREVIOUS), Manifest.from_rows(CURRENT)
+        expected = _lists(diff_manifests(previous, current, use_numpy=False))
+        with mock.patch.object(manifest_diff, "np", None), \
+                mock.patch.object(manifest_diff, "NUMPY_MIN_ENTRIES", 0):
+            self.assertEqual(_lists(diff_manifests(previous, current)), expected)
+            with self.assertRaises(RuntimeError):
+                diff_manifests(previous, current, use_numpy=True)
+
+
+@unittest.skipIf(manifest_diff.np is None, "numpy n'est pas installé")
+class DiffEquivalenceTest(unittest.TestCase):
+    """Les deux chemins du différentiel donnent les mêmes listes."""
+
+    def assert_same(self, previous_rows, current_rows):
+        previous, current = Manifest.from_rows(previous_rows), Manifest.from_rows(current_rows)
+        python = _lists(diff_manifests(previous, current, use_numpy=False))
+        vectorized = _lists(diff_manifests(previous, current, use_numpy=True))
+        self.assertEqual(vectorized, python)
+        return python
+
+    def test_all_categories(self):
+        self.assert_same(PREVIOUS, CURRENT)
+
+    def test_empty_previous(self):
+        self.assertEqual(self.assert_same([], CURRENT)["added"], sorted(row[0] for row in CURRENT))
+
+    def test_empty_current(self):
+        self.assertEqual(self.assert_same(PREVIOUS, [])["deleted"], sorted(row[0] for row in PREVIOUS))
+
+    def test_both_empty(self):
+        self.assert_same([], [])
+
+    def test_synthetic_manifests(self):
+        previous, current = manifest_diff._synthetic_manifests(5000, change_ratio=0.05)
+        python = _lists(manifest_diff._diff_python(previous, current))
+        self.assertEqual(_lists(manifest_diff._diff_numpy(previous, current)), python)
+
+    def test_threshold_selects_numpy(self):
+        previous, current = Manifest.from_rows(PREVIOUS), Manifest.from_rows(CURRENT)
+        with mock.patch.object(manifest_diff, "NUMPY_MIN_ENTRIES", 0), \
+                mock.patch.object(manifest_diff, "_diff_numpy", wraps=manifest_diff._diff_numpy) as vectorized:
+            diff_manifests(previous, current)
+        vectorized.assert_called_once()
+
+
+
+@unittest.skipIf(manifest_diff.np is None, "numpy n'est pas installé")
+class CompareStageTest(EngineTestCase):
+
+    def test_grouped_directories_reach_numpy(self):
+        for directory in range(4):
+            for number in range(5):
+                self.write(f"d{directory}/f{number}.txt", f"{directory}-{number}")
+        self.sync()
+        self.write("d1/f0.txt", "modifié")
+        (self.source / "d2" / "f0.txt").unlink()
+        with mock.patch.object(sync_engine, "NUMPY_MIN_ENTRIES", 10), \
+                mock.patch.object(manifest_diff, "NUMPY_MIN_ENTRIES", 10), \
+                mock.patch.object(manifest_diff, "_diff_numpy", wraps=manifest_diff._diff_numpy) as vectorized:
+            engine = self.sync()
+        self.assertTrue(vectorized.called)
+        counts = engine.compare_result["counts"]
+        self.assertEqual((counts["changed"], counts["deleted"], counts["unchanged"]), (1, 1, 18))
+        self.assertEqual((self.destination / "d1" / "f0.txt").read_text(), "modifié")
+        self.assertFalse((self.destination / "d2" / "f0.txt").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
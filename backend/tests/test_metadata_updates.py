@@ -0,0 +1,77 @@
+# Tests du report des seules métadonnées (permissions, propriétaire) sans recopie des données.
+
+import os
+import stat
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import sync_engine
+from copy_backend import apply_metadata, metadata_differs
+from support import EngineTestCase
+
+
+class MetadataFunctionsTest(EngineTestCase):
+
+    def test_metadata_differs_and_apply(self):
+        src = self.write("a.txt", "a")
+        dst = self.destination / "a.txt"
+        dst.write_text("a")
+        os.chmod(src, 0o600)
+        os.utime(src, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+        self.assertTrue(metadata_differs(os.stat(src), os.stat(dst)))
+        apply_metadata(os.stat(src), dst)
+        self.assertFalse(metadata_differs(os.stat(src), os.stat(dst)))
+        self.assertEqual(stat.S_IMODE(os.stat(dst).st_mode), 0o600)
+
+
+class MetadataSyncTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.src = self.write("d/a.txt", "contenu")
+        self.sync()
+        self.dst = self.destination / "d" / "a.txt"
+
+    def test_chmod_without_copy(self):
+        inode = os.stat(self.dst).st_ino
+        os.chmod(self.src, 0o600)
+        with mock.patch.object(sync_engine, "copy_file", wraps=sync_engine.copy_file) as copy:
+            engine = self.sync()
+        copy.assert_not_called()
+        self.assertEqual(engine.files_metadata_updated, 1)
+        self.assertEqual(engine.files_modified, 0)
+        self.assertEqual(os.stat(self.dst).st_ino, inode)
+        self.assertEqual(stat.S_IMODE(os.stat(self.dst).st_mode), 0o600)
+        self.assertEqual(self.sync().files_metadata_updated, 0)
+
+    def test_missing_destination_is_copied(self):
+        os.chmod(self.src, 0o600)
+        self.dst.unlink()
+        engine = self.sync()
+        self.assertEqual(self.dst.read_text(), "contenu")
+        self.assertEqual(stat.S_IMODE(os.stat(self.dst).st_mode), 0o600)
+        self.assertEqual(engine.files_metadata_updated, 0)
+
+    def test_hardlinked_destination_is_copied(self):
+        other = self.destination / "lien.txt"
+        os.link(self.dst, other)
+        os.chmod(self.src, 0o600)
+        self.sync()
+        self.assertEqual(stat.S_IMODE(os.stat(self.dst).st_mode), 0o600)
+        self.assertNotEqual(stat.S_IMODE(os.stat(other).st_mode), 0o600) # L'autre chemin n'est pas modifié
+        self.assertNotEqual(os.stat(self.dst).st_ino, os.stat(other).st_ino)
+
+    def test_content_change_is_copied(self):
+        os.chmod(self.src, 0o600)
+        self.write("d/a.txt", "nouveau contenu")
+        engine = self.sync()
+        self.assertEqual((engine.files_modified, engine.files_metadata_updated), (1, 0))
+        self.assertEqual(self.dst.read_text(), "nouveau contenu")
+
+
+if __name__ == "__main__":
+    unittest.main()
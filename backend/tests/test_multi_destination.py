@@ -0,0 +1,85 @@
+# Tests de la synchronisation de plusieurs destinations depuis une seule lecture de la source.
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import capacity
+import sync_engine
+from capacity import InsufficientSpaceError
+from support import EngineTestCase
+
+
+class MultiDestinationTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.second = self.root / "destination2"
+        self.second.mkdir()
+
+    def engine_with_replica(self, **options):
+        engine = self.engine(**options)
+        engine.replicas.append(sync_engine.SyncEngine(
+            self.source, self.second, 1, [], [], "test", self.root / "sync.log",
+            state_name=sync_engine.replica_state_name("test", self.second),
+            logger=engine.logger.getChild("dest2"), **options))
+        return engine
+
+    def sync_both(self, **options):
+        engine = self.engine_with_replica(**options)
+        engine.run_sync()
+        return engine
+
+    def test_source_read_once_for_both(self):
+        self.write("a/b.txt", "b")
+        self.write("c.txt", "c")
+        with mock.patch.object(sync_engine, "copy_file_to_many", wraps=sync_engine.copy_file_to_many) as copy:
+            engine = self.sync_both()
+        self.assertEqual(copy.call_count, 2)
+        self.assertTrue(all(len(call.args[1]) == 2 for call in copy.call_args_list))
+        for destination in (self.destination, self.second):
+            self.assertEqual((destination / "a" / "b.txt").read_text(), "b")
+            self.assertEqual((destination / "c.txt").read_text(), "c")
+        self.assertEqual((engine.files_added, engine.replicas[0].files_added), (2, 2))
+        self.assertNotEqual(engine.state_file, engine.replicas[0].state_file)
+        self.assertTrue(engine.replicas[0].state_file.exists())
+
+    def test_each_destination_has_its_own_state(self):
+        self.write("a.txt", "a")
+        self.sync_both()
+        self.write("a.txt", "modifié")
+        self.write("b.txt", "b")
+        self.sync() # Première destination seule : la seconde est en retard
+        engine = self.sync_both()
+        replica = engine.replicas[0]
+        self.assertEqual((engine.files_added, engine.files_modified, engine.files_unchanged), (0, 0, 2))
+        self.assertEqual((replica.files_added, replica.files_modified, replica.files_unchanged), (1, 1, 0))
+        self.assertEqual((self.second / "a.txt").read_text(), "modifié")
+        self.assertEqual((self.second / "b.txt").read_text(), "b")
+
+    def test_full_destination_does_not_stop_the_other(self):
+        self.write("a.txt", "a" * 100_000)
+        statvfs = os.statvfs
+
+        def fake_statvfs(path):
+            result = statvfs(path)
+            if Path(path) == self.second:
+                return os.statvfs_result(result[:3] + (0, 0) + result[5:])
+            return result
+
+        with mock.patch.object(capacity.os, "statvfs", side_effect=fake_statvfs):
+            engine = self.sync_both()
+        self.assertIsNone(engine.failure)
+        self.assertIsInstance(engine.replicas[0].failure, InsufficientSpaceError)
+        self.assertTrue(engine.has_errors())
+        self.assertTrue((self.destination / "a.txt").exists())
+        self.assertFalse((self.second / "a.txt").exists())
+        self.assertFalse(engine.replicas[0].state_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Tests du parcours parallèle d'une arborescence (module parallel_walker).
+
+import os
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from parallel_walker import parallel_walk
+from support import EngineTestCase
+
+# Arbre synthétique : chaque nœud a 3 enfants jusqu'à la profondeur 4 (1 + 3 + 9 + 27 + 81 nœuds)
+DEPTH = 4
+NODES = sum(3 ** level for level in range(DEPTH + 1))
+
+
+def _children(node):
+    return [] if len(node) == DEPTH else [node + (index,) for index in range(3)]
+
+
+class ParallelWalkTest(unittest.TestCase):
+
+    def walk(self, workers):
+        visited = []
+        lock = threading.Lock()
+
+        def visit(node):
+            with lock:
+                visited.append(node)
+            return _children(node)
+
+        parallel_walk((), visit, workers)
+        return visited
+
+    def test_sequential_depth_first(self):
+        visited = self.walk(1)
+        self.assertEqual(len(visited), NODES)
+        self.assertEqual(visited[:3], [(), (0,), (0, 0)])
+        self.assertEqual(visited, sorted(visited))
+
+    def test_parallel_visits_every_node_once(self):
+        for workers in (2, 8):
+            visited = self.walk(workers)
+            self.assertEqual(len(visited), NODES)
+            self.assertEqual(len(set(visited)), NODES)
+
+    def test_uses_several_threads(self):
+        threads = set()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def visit(node):
+            threads.add(threading.current_thread().name)
+            if len(node) == 1 and node[0] < 2:
+                barrier.wait() # Les deux premiers enfants sont traités en même temps
+            return _children(node)
+
+        parallel_walk((), visit, 4)
+        self.assertGreaterEqual(len(threads), 2)
+
+    def test_error_is_raised_in_caller(self):
+        def visit(node):
+            if node == (1, 2):
+                raise PermissionError("refusé")
+            return _children(node)
+
+        for workers in (1, 4):
+            with self.assertRaises(PermissionError):
+                parallel_walk((), visit, workers)
+
+
+class ParallelScanTest(EngineTestCase):
+
+    def test_sync_with_scan_workers(self):
+        expected = set()
+        for directory in range(6):
+            for number in range(4):
+                rel_path = f"d{directory}/s{number % 2}/f{number}.txt"
+                self.write(rel_path, rel_path)
+                expected.add(rel_path)
+        engine = self.sync(scan_workers=4)
+        copied = {os.path.relpath(path, self.destination) for path in self.destination.rglob("*.txt")
+                  if ".cache" not in path.parts}
+        self.assertEqual(copied, expected)
+        self.assertEqual(engine.dirs_scanned, 1 + 6 + 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Tests de la pause et de la reprise d'une synchronisation (pause, resume) : aucune copie pendant la
+# pause, reprise sans reparcourir la source, arrêt possible pendant la pause.
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import sync_engine
+from support import EngineTestCase
+
+NAMES = [f"f{number}.txt" for number in range(6)]
+
+
+class PauseTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        poll_patch = mock.patch.object(sync_engine, "PAUSE_POLL_SECONDS", 0.01)
+        poll_patch.start()
+        self.addCleanup(poll_patch.stop)
+        for name in NAMES:
+            self.write(name, name)
+
+    def start(self, engine):
+        thread = threading.Thread(target=engine.run_sync)
+        thread.start()
+        self.addCleanup(thread.join, 10)
+        return thread
+
+    def copied_names(self):
+        return sorted(path.name for path in self.destination.iterdir() if path.name in NAMES)
+
+    def test_wait_if_paused(self):
+        engine = self.engine()
+        engine._wait_if_paused() # Pas de pause : retour immédiat
+        engine.pause()
+        threading.Timer(0.1, engine.resume).start()
+        started = time.monotonic()
+        engine._wait_if_paused()
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+        engine.pause()
+        threading.Timer(0.1, engine.request_stop).start()
+        engine._wait_if_paused() # Un arrêt demandé met fin à l'attente
+        self.assertTrue(engine.stop_event.is_set())
+
+    def test_paused_before_run(self):
+        engine = self.engine()
+        engine.pause()
+        thread = self.start(engine)
+        time.sleep(0.3)
+        self.assertTrue(thread.is_alive())
+        self.assertEqual(self.copied_names(), [])
+        engine.resume()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.copied_names(), NAMES)
+        self.assertEqual(engine.files_added, len(NAMES))
+
+    def test_pause_between_files(self):
+        engine = self.engine(copy_workers=1)
+        copy_file = sync_engine.copy_file
+        copied = []
+        paused_at = []
+
+        def pausing_copy(*args, **kwargs):
+            result = copy_file(*args, **kwargs)
+            copied.append(args[0])
+            if len(copied) == 2:
+                engine.pause()
+            return result
+
+        def resume():
+            paused_at.append(len(copied))
+            engine.resume()
+
+        with mock.patch.object(sync_engine, "copy_file", side_effect=pausing_copy), \
+                mock.patch.object(engine, "_scan_source", wraps=engine._scan_source) as scan:
+            thread = self.start(engine)
+            time.sleep(0.3)
+            resume()
+            thread.join(10)
+        self.assertEqual(paused_at, [2]) # Copie en cours terminée, aucune autre commencée
+        self.assertEqual(self.copied_names(), NAMES)
+        self.assertEqual(scan.call_count, 1) # La reprise continue sans reparcourir la source
+        self.assertFalse(engine.has_errors())
+
+    def test_stop_while_paused(self):
+        engine = self.engine()
+        engine.pause()
+        thread = self.start(engine)
+        time.sleep(0.1)
+        engine.request_stop()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.copied_names(), [])
+        self.assertFalse(engine.state_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
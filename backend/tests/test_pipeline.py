@@ -0,0 +1,104 @@
+# Tests des étapes enchaînées (module pipeline) et du pipeline parcours → comparaison → copie → validation.
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pipeline import END_OF_STREAM, Pipeline, PipelineAborted
+from support import EngineTestCase
+
+
+class PipelineTest(unittest.TestCase):
+
+    def test_stages_pass_items_in_order(self):
+        pipeline = Pipeline()
+        first, second = pipeline.queue(2), pipeline.queue(2)
+        received = []
+
+        def produce():
+            for number in range(20):
+                pipeline.put(first, number)
+            pipeline.put(first, END_OF_STREAM)
+
+        def double():
+            while (item := pipeline.get(first)) is not END_OF_STREAM:
+                pipeline.put(second, item * 2)
+            pipeline.put(second, END_OF_STREAM)
+
+        def collect():
+            while (item := pipeline.get(second)) is not END_OF_STREAM:
+                received.append(item)
+
+        for name, target in (("produce", produce), ("double", double), ("collect", collect)):
+            pipeline.spawn(name, target)
+        pipeline.join()
+        self.assertEqual(received, [number * 2 for number in range(20)])
+
+    def test_full_queue_blocks_producer(self):
+        pipeline = Pipeline()
+        work_queue = pipeline.queue(1)
+        pipeline.put(work_queue, 1)
+        blocked = pipeline.spawn("producer", pipeline.put, work_queue, 2)
+        blocked.join(0.3)
+        self.assertTrue(blocked.is_alive())
+        self.assertEqual(pipeline.get(work_queue), 1)
+        blocked.join(2)
+        self.assertFalse(blocked.is_alive())
+        self.assertEqual(pipeline.get(work_queue), 2)
+
+    def test_error_aborts_other_stages(self):
+        pipeline = Pipeline()
+        work_queue = pipeline.queue(1)
+        waiting = threading.Event()
+
+        def consumer():
+            waiting.set()
+            pipeline.get(work_queue) # Jamais alimentée : interrompue par l'erreur de l'autre étape
+
+        def failing():
+            waiting.wait(2)
+            raise ValueError("étape en échec")
+
+        consumer_thread = pipeline.spawn("consumer", consumer)
+        pipeline.spawn("failing", failing)
+        with self.assertRaises(ValueError):
+            pipeline.join()
+        self.assertFalse(consumer_thread.is_alive())
+
+    def test_poll(self):
+        pipeline = Pipeline()
+        work_queue = pipeline.queue(2)
+        start = time.monotonic()
+        self.assertIsNone(pipeline.poll(work_queue, 0.2))
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+        threading.Timer(0.05, work_queue.put, args=("lot",)).start()
+        self.assertEqual(pipeline.poll(work_queue, 2), "lot")
+        pipeline.fail(RuntimeError("interrompu"))
+        with self.assertRaises(PipelineAborted):
+            pipeline.poll(work_queue, 2)
+
+
+class PipelinedSyncTest(EngineTestCase):
+
+    def test_add_modify_delete(self):
+        for directory in range(5):
+            for number in range(5):
+                self.write(f"d{directory}/f{number}.txt", "v1")
+        self.sync(copy_workers=3)
+        self.write("d0/f0.txt", "version 2")
+        self.write("d5/new.txt", "new")
+        (self.source / "d1" / "f1.txt").unlink()
+        engine = self.sync(copy_workers=3)
+        self.assertEqual((engine.files_added, engine.files_modified, engine.files_deleted), (1, 1, 1))
+        self.assertEqual(engine.files_unchanged, 23)
+        self.assertEqual((self.destination / "d0" / "f0.txt").read_text(), "version 2")
+        self.assertEqual((self.destination / "d5" / "new.txt").read_text(), "new")
+        self.assertFalse((self.destination / "d1" / "f1.txt").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
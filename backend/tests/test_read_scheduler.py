@@ -0,0 +1,76 @@
+# Tests de l'ordonnancement des lectures (module read_scheduler) : ordre physique ou par inode, pré-lecture.
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import read_scheduler
+from read_scheduler import physical_offset, prefetch, read_order_key
+from support import EngineTestCase
+
+
+class ReadOrderKeyTest(unittest.TestCase):
+
+    def test_physical_then_inode_fallback(self):
+        offsets = {"a": 4096, "b": None, "c": 0}
+        with mock.patch.object(read_scheduler, "physical_offset", side_effect=offsets.get):
+            keys = {name: read_order_key("physical", name, inode) for name, inode in (("a", 1), ("b", 2), ("c", 3))}
+        self.assertEqual(sorted(keys, key=keys.get), ["c", "a", "b"])
+
+    def test_inode_order_does_not_map_files(self):
+        with mock.patch.object(read_scheduler, "physical_offset") as mapped:
+            self.assertEqual(read_order_key("inode", "a", 42), (1, 42))
+        mapped.assert_not_called()
+
+
+class PhysicalOffsetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def test_missing_and_empty_files(self):
+        self.assertIsNone(physical_offset(self.root / "absent"))
+        (self.root / "vide").write_bytes(b"")
+        self.assertIsNone(physical_offset(self.root / "vide"))
+
+    def test_offset_is_an_integer_or_unsupported(self):
+        path = self.root / "data"
+        with open(path, "wb") as f:
+            f.write(os.urandom(64 * 1024))
+            f.flush()
+            os.fsync(f.fileno())
+        offset = physical_offset(path) # None sur les systèmes de fichiers sans FIEMAP (tmpfs, overlay...)
+        self.assertTrue(offset is None or (isinstance(offset, int) and offset >= 0))
+
+    def test_prefetch_ignores_errors(self):
+        prefetch(self.root / "absent")
+        (self.root / "a").write_bytes(b"a")
+        prefetch(self.root / "a")
+
+
+class ReadOrderSyncTest(EngineTestCase):
+
+    def test_physical_order(self):
+        names = [f"f{number}.txt" for number in range(6)]
+        for name in names:
+            self.write(name, name)
+        offsets = {os.fspath(self.source / name): (len(names) - position) * 4096
+                   for position, name in enumerate(names)} # Ordre physique inverse des noms
+        prefetched = []
+        with mock.patch.object(read_scheduler, "physical_offset", side_effect=lambda path: offsets[os.fspath(path)]), \
+                mock.patch("sync_engine.prefetch", side_effect=lambda path: prefetched.append(path.name)):
+            self.sync(read_order="physical", copy_workers=1)
+        self.assertEqual(prefetched, list(reversed(names)))
+        for name in names:
+            self.assertEqual((self.destination / name).read_text(), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
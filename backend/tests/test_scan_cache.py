@@ -0,0 +1,116 @@
+# Tests du cache de parcours partagé (module scan_cache).
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import sync_engine
+from scan_cache import ScanCache, list_directory
+from support import EngineTestCase, age
+
+
+class ScanCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.directory = self.root / "dir"
+        self.directory.mkdir()
+        (self.directory / "a.txt").write_text("a")
+        age(self.directory)
+
+    def cache(self, max_age=600):
+        cache = ScanCache(self.root / "cache.db", max_age)
+        self.addCleanup(cache.close)
+        return cache
+
+    def reopen(self, cache):
+        """Ferme le cache (écriture des entrées en attente) et le rouvre."""
+        cache.close()
+        return self.cache()
+
+    def test_hit_after_store(self):
+        cache = self.cache()
+        dir_stat = os.stat(self.directory)
+        listing = list_directory(self.directory)
+        cache.store(self.directory, dir_stat, listing)
+        cache = self.reopen(cache)
+        self.assertEqual(cache.lookup(self.directory, dir_stat), listing)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_changed_directory_misses(self):
+        cache = self.cache()
+        cache.store(self.directory, os.stat(self.directory), list_directory(self.directory))
+        cache = self.reopen(cache)
+        (self.directory / "b.txt").write_text("b")
+        self.assertIsNone(cache.lookup(self.directory, os.stat(self.directory)))
+
+    def test_recent_directory_not_stored(self):
+        cache = self.cache()
+        os.utime(self.directory)
+        dir_stat = os.stat(self.directory)
+        cache.store(self.directory, dir_stat, list_directory(self.directory))
+        cache = self.reopen(cache)
+        self.assertIsNone(cache.lookup(self.directory, dir_stat))
+
+    def test_undecodable_name(self):
+        cache = self.cache()
+        directory = os.path.join(os.fsencode(self.root), b"caf\xe9dir")
+        os.mkdir(directory)
+        with open(os.path.join(directory, b"\xe9t\xe9.txt"), "wb") as f:
+            f.write(b"x")
+        directory = os.fsdecode(directory)
+        age(directory)
+        dir_stat = os.stat(directory)
+        listing = list_directory(directory)
+        cache.store(directory, dir_stat, listing)
+        cache = self.reopen(cache)
+        self.assertEqual(cache.lookup(directory, dir_stat), listing)
+
+    def test_unencodable_path_is_a_miss(self):
+        cache = self.cache()
+        dir_stat = os.stat(self.directory)
+        with mock.patch("scan_cache.os.fsencode", side_effect=UnicodeEncodeError("utf-8", "", 0, 1, "test")):
+            cache.store(self.directory, dir_stat, list_directory(self.directory))
+            self.assertIsNone(cache.lookup(self.directory, dir_stat))
+        self.assertEqual(cache.misses, 1)
+
+
+class ScanCacheSyncTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache_patch = mock.patch.object(sync_engine, "SCAN_CACHE_FILE", self.root / "scan_cache.db")
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+    def test_second_sync_reuses_listing(self):
+        self.write("sub/a.txt", "a")
+        age(self.source / "sub")
+        age(self.source)
+        self.sync(scan_cache_seconds=600)
+        engine = self.sync(scan_cache_seconds=600)
+        self.assertEqual(engine.dirs_from_scan_cache, 2)
+
+    def test_non_utf8_directory(self):
+        directory = os.path.join(os.fsencode(self.source), b"caf\xe9dir")
+        os.mkdir(directory)
+        with open(os.path.join(directory, b"a.txt"), "wb") as f:
+            f.write(b"a")
+        age(directory)
+        age(self.source)
+        for _ in range(2):
+            self.sync(scan_cache_seconds=600)
+            copied = os.path.join(os.fsencode(self.destination), b"caf\xe9dir", b"a.txt")
+            with open(copied, "rb") as f:
+                self.assertEqual(f.read(), b"a")
+
+
+if __name__ == "__main__":
+    unittest.main()
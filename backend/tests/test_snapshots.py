@@ -0,0 +1,76 @@
+# Tests du mode instantanés et de la rétention des versions (module snapshots, SyncEngine).
+
+import shutil
+import unittest
+
+from support import EngineTestCase
+from snapshots import LATEST_LINK_NAME, SNAPSHOTS_DIR_NAME, VERSIONS_DIR_NAME, list_snapshots, prune_versions
+
+
+class SnapshotModeSwitchTest(EngineTestCase):
+
+    def test_switch_to_mirror_keeps_snapshots(self):
+        self.write("a.txt", "a")
+        self.write("dir/b.txt", "b")
+        self.sync(snapshot_mode=True)
+        snapshots = list_snapshots(self.destination / SNAPSHOTS_DIR_NAME)
+        self.assertEqual(len(snapshots), 1)
+
+        self.sync()
+
+        self.assertEqual(list_snapshots(self.destination / SNAPSHOTS_DIR_NAME), snapshots)
+        self.assertTrue((self.destination / LATEST_LINK_NAME).is_symlink())
+        self.assertEqual((snapshots[0] / "dir" / "b.txt").read_text(), "b")
+        self.assertEqual((self.destination / "a.txt").read_text(), "a")
+        self.assertEqual((self.destination / "dir" / "b.txt").read_text(), "b")
+
+
+class SnapshotDeletionCountTest(EngineTestCase):
+
+    def test_files_of_deleted_directories_are_counted(self):
+        self.write("keep.txt", "k")
+        self.write("gone.txt", "g")
+        self.write("old/one.txt", "1")
+        self.write("old/sub/two.txt", "2")
+        self.sync(snapshot_mode=True)
+        (self.source / "gone.txt").unlink()
+        shutil.rmtree(self.source / "old")
+
+        engine = self.sync(snapshot_mode=True)
+
+        self.assertEqual(engine.files_deleted, 3)
+        self.assertEqual(engine.dirs_deleted, 1)
+
+
+class VersionRetentionTest(EngineTestCase):
+
+    def test_versions_are_kept_per_relative_path(self):
+        self.write("a/same.txt", "a1")
+        self.write("b/same.txt", "b1")
+        self.sync()
+        self.write("a/same.txt", "a2")
+        self.write("b/same.txt", "b2")
+        self.sync(max_cached_versions=1)
+
+        versions = self.destination / ".cache" / VERSIONS_DIR_NAME
+        self.assertEqual([p.read_text() for p in (versions / "a").glob("same.txt.*")], ["a1"])
+        self.assertEqual([p.read_text() for p in (versions / "b").glob("same.txt.*")], ["b1"])
+
+    def test_prune_keeps_newest_versions_of_each_file(self):
+        cache_dir = self.destination / ".cache"
+        for rel_dir in ("a", "b"):
+            (cache_dir / VERSIONS_DIR_NAME / rel_dir).mkdir(parents=True)
+            for timestamp in (100, 200, 300):
+                (cache_dir / VERSIONS_DIR_NAME / rel_dir / f"same.txt.{timestamp}").write_text(rel_dir)
+        (cache_dir / "same.txt.50").write_text("ancienne disposition")
+
+        self.assertEqual(prune_versions(cache_dir, 2), 2)
+
+        for rel_dir in ("a", "b"):
+            self.assertEqual(sorted(p.name for p in (cache_dir / VERSIONS_DIR_NAME / rel_dir).iterdir()),
+                             ["same.txt.200", "same.txt.300"])
+        self.assertTrue((cache_dir / "same.txt.50").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
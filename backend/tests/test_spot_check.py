@@ -0,0 +1,88 @@
+# Tests du contrôle par échantillonnage des destinations (audit.spot_check_sample, --spot-check-days).
+
+import json
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from audit import spot_check_sample
+from support import EngineTestCase
+
+DAY = 24 * 3600
+NOW = 100 * DAY
+
+
+class SpotCheckSampleTest(unittest.TestCase):
+
+    def sample(self, sizes, coverage, runs_per_period=4, budget_bytes=0, sampling="random"):
+        return spot_check_sample(sizes, coverage, NOW, DAY, runs_per_period, budget_bytes, sampling,
+                                 random.Random(1))
+
+    def test_never_verified_first_then_oldest(self):
+        sizes = dict.fromkeys(["a", "b", "c", "d"], 1)
+        coverage = {"a": NOW - 100, "b": NOW - 300, "c": NOW - 200}
+        self.assertEqual(self.sample(sizes, coverage, runs_per_period=2), (["d", "b"], 0))
+
+    def test_quota_per_run(self):
+        sizes = {f"f{number}": 1 for number in range(10)}
+        selected, _ = self.sample(sizes, {}, runs_per_period=4)
+        self.assertEqual(len(selected), 3) # ceil(10 / 4)
+
+    def test_overdue_files_exceed_quota(self):
+        sizes = {f"f{number}": 1 for number in range(10)}
+        coverage = {f"f{number}": NOW - 2 * DAY for number in range(6)}
+        coverage.update({f"f{number}": NOW - 10 for number in range(6, 10)})
+        selected, _ = self.sample(sizes, coverage, runs_per_period=10)
+        self.assertEqual(sorted(selected), [f"f{number}" for number in range(6)])
+
+    def test_budget(self):
+        sizes = {"gros": 100, "petit1": 10, "petit2": 10}
+        coverage = dict.fromkeys(sizes, NOW - 2 * DAY)
+        selected, overdue_skipped = self.sample(sizes, coverage, runs_per_period=1, budget_bytes=50)
+        self.assertEqual((sorted(selected), overdue_skipped), (["petit1", "petit2"], 1))
+
+    def test_stratified_alternates_top_level_directories(self):
+        sizes = {f"a/{number}": 1 for number in range(10)}
+        sizes.update({f"b/{number}": 1 for number in range(2)})
+        selected, _ = self.sample(sizes, {}, runs_per_period=3, sampling="stratified")
+        self.assertEqual(sorted(rel_path.split("/")[0] for rel_path in selected), ["a", "a", "b", "b"])
+
+
+class SpotCheckSyncTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.names = [f"d{number}/f.txt" for number in range(4)]
+        for name in self.names:
+            self.write(name, name)
+
+    def coverage(self, engine):
+        with open(engine.state_file, encoding="utf-8") as f:
+            return json.load(f)["spot_check"]["coverage"]
+
+    def test_rotation_covers_all_files(self):
+        checked = set()
+        for _ in range(4):
+            engine = self.sync(verify_copies="hash", spot_check_days=1, spot_check_mb=0) # 24 exécutions par jour
+            self.assertEqual(engine.spot_checked, 1)
+            checked |= set(self.coverage(engine))
+        self.assertEqual(checked, set(self.names))
+
+    def test_corruption_detected(self):
+        self.sync(verify_copies="hash")
+        for name in self.names:
+            (self.destination / name).write_text("altéré")
+        engine = self.sync(verify_copies="hash", spot_check_days=1)
+        self.assertEqual(len(engine.spot_check_failures), 1)
+        self.assertEqual(self.coverage(engine), {})
+
+    def test_reread_copies_count_as_verified(self):
+        engine = self.sync(verify_copies="reread", spot_check_days=1)
+        self.assertEqual(set(self.coverage(engine)), set(self.names))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# Tests des copies de fichiers modifiés pendant leur copie (nouvelle tentative, copie différée).
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import sync_engine
+from copy_backend import source_unchanged
+from support import EngineTestCase
+
+
+class SourceUnchangedTest(EngineTestCase):
+
+    def test_size_and_mtime(self):
+        path = self.write("a.txt", "a")
+        before = os.stat(path)
+        self.assertTrue(source_unchanged(before, os.stat(path)))
+        os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns + 1))
+        self.assertFalse(source_unchanged(before, os.stat(path)))
+
+
+class StableCopySyncTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.src = self.write("journal.log", "ligne 0\n")
+        backoff_patch = mock.patch.object(sync_engine, "STABLE_COPY_BACKOFF", 0)
+        backoff_patch.start()
+        self.addCleanup(backoff_patch.stop)
+
+    def sync_while_writing(self, changing_copies):
+        """Synchronise en ajoutant une ligne à la source pendant chacune des 'changing_copies' premières copies."""
+        calls = []
+        copy_file = sync_engine.copy_file
+
+        def copy_and_append(src, dst, *args, **kwargs):
+            size = copy_file(src, dst, *args, **kwargs)
+            if Path(src) == self.src and len(calls) < changing_copies:
+                with open(src, "a") as f:
+                    f.write(f"ligne {len(calls) + 1}\n")
+            calls.append(dst)
+            return size
+
+        with mock.patch.object(sync_engine, "copy_file", side_effect=copy_and_append):
+            engine = self.sync()
+        return engine, len(calls)
+
+    def test_copy_retried_until_stable(self):
+        engine, copies = self.sync_while_writing(changing_copies=1)
+        self.assertEqual(copies, 2)
+        self.assertEqual(engine.deferred, [])
+        self.assertEqual((self.destination / "journal.log").read_text(), self.src.read_text())
+        self.assertFalse(engine.has_errors())
+
+    def test_still_changing_file_is_deferred(self):
+        attempts = sync_engine.STABLE_COPY_ATTEMPTS
+        engine, copies = self.sync_while_writing(changing_copies=attempts + 1)
+        self.assertEqual(len(engine.deferred), 1)
+        self.assertEqual(copies, attempts + 2) # Reprise : stable à la deuxième tentative
+        self.assertEqual((self.destination / "journal.log").read_text(), self.src.read_text())
+        self.assertEqual(engine.files_added, 1)
+        self.assertFalse(engine.has_errors())
+
+    def test_last_copy_kept_when_never_stable(self):
+        attempts = sync_engine.STABLE_COPY_ATTEMPTS
+        engine, copies = self.sync_while_writing(changing_copies=2 * attempts)
+        self.assertEqual(copies, 2 * attempts)
+        self.assertTrue((self.destination / "journal.log").exists())
+        self.assertEqual(engine.files_added, 1)
+        self.assertFalse(engine.has_errors())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Tests de l'arrêt coopératif d'une synchronisation (request_stop) : copies faites conservées, état
+# précédent gardé, reprise à la synchronisation suivante.
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import sync_engine
+from support import EngineTestCase
+from sync_engine import SyncCancelled
+
+NAMES = [f"f{number}.txt" for number in range(6)]
+
+
+class StopTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for name in NAMES:
+            self.write(name, name)
+
+    def sync_stopped(self, after=2):
+        """Synchronise en demandant l'arrêt après 'after' copies."""
+        engine = self.engine(copy_workers=1)
+        copy_file = sync_engine.copy_file
+        copied = []
+
+        def stopping_copy(*args, **kwargs):
+            result = copy_file(*args, **kwargs)
+            if Path(args[0]).parent == self.source: # Pas les sauvegardes d'anciennes versions
+                copied.append(args[0])
+            if len(copied) == after:
+                engine.request_stop()
+            return result
+
+        with mock.patch.object(sync_engine, "copy_file", side_effect=stopping_copy):
+            engine.run_sync()
+        return engine, copied
+
+    def copied_names(self):
+        return sorted(path.name for path in self.destination.iterdir() if path.name in NAMES)
+
+    def test_stop_keeps_copies_and_previous_state(self):
+        engine, copied = self.sync_stopped()
+        self.assertTrue(engine.stop_event.is_set())
+        self.assertLess(len(copied), len(NAMES))
+        self.assertEqual(self.copied_names(), sorted(Path(path).name for path in copied))
+        self.assertFalse(engine.state_file.exists()) # Aucun état précédent : aucun n'est écrit
+        self.assertFalse(engine.running_marker.exists())
+        self.assertFalse(engine.has_errors())
+        engine = self.sync() # Reprise : seuls les fichiers restants sont copiés
+        self.assertEqual(engine.files_added, len(NAMES) - len(copied))
+        self.assertEqual(self.copied_names(), NAMES)
+
+    def test_stop_keeps_previous_manifest(self):
+        self.sync()
+        state = json.loads(self.engine().state_file.read_text(encoding="utf-8"))
+        for name in NAMES:
+            self.write(name, name + " modifié")
+        _, copied = self.sync_stopped()
+        self.assertEqual(json.loads(self.engine().state_file.read_text(encoding="utf-8")), state)
+        engine = self.sync()
+        self.assertEqual(engine.files_modified, len(NAMES) - len(copied)) # Les copies faites sont identiques
+        for name in NAMES:
+            self.assertEqual((self.destination / name).read_text(), name + " modifié")
+
+    def test_stop_requested_before_run(self):
+        engine = self.engine()
+        engine.request_stop()
+        engine.run_sync()
+        self.assertEqual(self.copied_names(), [])
+        self.assertFalse(engine.state_file.exists())
+
+    def test_check_stop(self):
+        engine = self.engine()
+        engine._check_stop()
+        engine.request_stop()
+        with self.assertRaises(SyncCancelled):
+            engine._check_stop()
+
+    def test_stop_with_replica(self):
+        second = self.root / "destination2"
+        second.mkdir()
+        engine = self.engine()
+        engine.replicas.append(sync_engine.SyncEngine(
+            self.source, second, 1, [], [], "test", self.root / "sync.log",
+            state_name=sync_engine.replica_state_name("test", second), logger=engine.logger.getChild("dest2")))
+        engine.request_stop()
+        engine.run_sync()
+        self.assertTrue(engine.replicas[0].stop_event.is_set())
+        self.assertFalse((second / NAMES[0]).exists())
+        self.assertFalse(engine.replicas[0].state_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Tests de la vérification des copies (module verification) : empreinte pendant la copie et relecture.
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import verification
+from support import EngineTestCase
+from verification import VERIFY_RETRIES, CopyVerifier, VerificationError, read_digest
+
+DATA = os.urandom(300_000)
+
+
+class ReadDigestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.path = self.root / "copie.bin"
+        self.path.write_bytes(DATA)
+
+    def test_digest_and_throttle(self):
+        blocks = []
+        self.assertEqual(read_digest(self.path, 64 * 1024, throttle=blocks.append), hashlib.sha256(DATA).digest())
+        self.assertEqual(sum(blocks), len(DATA))
+
+    def test_without_direct_io(self):
+        with mock.patch.object(verification, "_read_direct", return_value=None):
+            self.assertEqual(read_digest(self.path), hashlib.sha256(DATA).digest())
+
+    def test_verifier(self):
+        verifier = CopyVerifier(64 * 1024)
+        self.assertTrue(verifier.verify(self.path, hashlib.sha256(DATA).digest()))
+        self.assertFalse(verifier.verify(self.path, b"\0" * 32))
+        self.assertEqual((verifier.files, verifier.bytes, verifier.mismatches), (2, 2 * len(DATA), 1))
+
+
+class VerifiedSyncTest(EngineTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.write("a.bin", DATA)
+
+    def manifest_digests(self, engine):
+        with open(engine.state_file, encoding="utf-8") as f:
+            return json.load(f)["manifest"]["digests"]
+
+    def test_hash_mode_records_digests(self):
+        with mock.patch.object(verification, "read_digest") as reread:
+            engine = self.sync(verify_copies="hash")
+        reread.assert_not_called()
+        self.assertEqual(self.manifest_digests(engine), {"a.bin": hashlib.sha256(DATA).hexdigest()})
+
+    def test_off_mode_records_no_digest(self):
+        self.assertEqual(self.manifest_digests(self.sync()), {})
+
+    def test_reread_mismatch_is_copied_again(self):
+        real_read_digest = verification.read_digest
+        results = iter([b"\0" * 32])
+        with mock.patch.object(verification, "read_digest",
+                               side_effect=lambda *args: next(results, None) or real_read_digest(*args)):
+            engine = self.sync(verify_copies="reread")
+        self.assertEqual((engine.verifier.files, engine.verifier.mismatches), (2, 1))
+        self.assertFalse(engine.has_errors())
+        self.assertEqual((self.destination / "a.bin").read_bytes(), DATA)
+        self.assertEqual(self.manifest_digests(engine), {"a.bin": hashlib.sha256(DATA).hexdigest()})
+
+    def test_persistent_mismatch_is_a_file_error(self):
+        with mock.patch.object(verification, "read_digest", return_value=b"\0" * 32):
+            engine = self.sync(verify_copies="reread")
+        self.assertEqual(engine.verifier.mismatches, VERIFY_RETRIES + 1)
+        self.assertTrue(engine.has_errors())
+        self.assertEqual([(error["path"], error["errno"]) for error in engine.file_errors],
+                         [("a.bin", VerificationError("a.bin", 1).errno)])
+        self.assertNotIn("a.bin", self.manifest_digests(engine))
+
+
+if __name__ == "__main__":
+    unittest.main()
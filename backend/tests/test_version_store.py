@@ -0,0 +1,82 @@
+# Tests de la compression des versions conservées dans .cache (module version_store).
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from support import EngineTestCase
+from version_store import (COMPRESSION_SUFFIXES, VersionCompressor, algorithm_of, compress_version, open_version,
+                           restore_version)
+
+TEXT = b"ligne de texte compressible\n" * 2000
+
+
+class CompressVersionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def version(self, name, data):
+        path = self.root / name
+        path.write_bytes(data)
+        os.utime(path, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+        return path
+
+    def test_round_trip(self):
+        for algorithm, suffix in COMPRESSION_SUFFIXES.items():
+            path = self.version(f"v-{algorithm}", TEXT)
+            original_size, stored_size = compress_version(path, algorithm)
+            compressed = Path(f"{path}{suffix}")
+            self.assertFalse(path.exists())
+            self.assertEqual((original_size, stored_size), (len(TEXT), compressed.stat().st_size))
+            self.assertLess(stored_size, len(TEXT) // 10)
+            self.assertEqual(algorithm_of(compressed), algorithm)
+            self.assertEqual(compressed.stat().st_mtime_ns, 1_600_000_000_000_000_000)
+            with open_version(compressed) as f:
+                self.assertEqual(f.read(), TEXT)
+            restore_version(compressed, self.root / f"restauré-{algorithm}")
+            self.assertEqual((self.root / f"restauré-{algorithm}").read_bytes(), TEXT)
+
+    def test_incompressible_version_kept_raw(self):
+        data = os.urandom(64 * 1024)
+        path = self.version("aléatoire", data)
+        self.assertEqual(compress_version(path, "zlib"), (len(data), len(data)))
+        self.assertEqual(path.read_bytes(), data)
+        self.assertEqual(os.listdir(self.root), ["aléatoire"])
+        with open_version(path) as f:
+            self.assertEqual(f.read(), data)
+
+    def test_compressor_counts(self):
+        paths = [self.version(f"v{number}", TEXT) for number in range(4)]
+        paths.append(self.version("aléatoire", os.urandom(4096)))
+        paths.append(self.root / "absent")
+        compressor = VersionCompressor("gzip", workers=2)
+        for path in paths:
+            compressor.submit(path)
+        compressor.wait()
+        self.assertEqual(compressor.compressed, 4)
+        self.assertEqual(compressor.original_bytes, 4 * len(TEXT) + 4096)
+
+
+class CompressionSyncTest(EngineTestCase):
+
+    def test_previous_version_compressed(self):
+        self.write("doc.txt", TEXT)
+        self.sync(version_compression="lzma")
+        self.write("doc.txt", b"nouvelle version")
+        self.sync(version_compression="lzma")
+        versions = list((self.destination / ".cache").rglob("*.xz"))
+        self.assertEqual(len(versions), 1)
+        with open_version(versions[0]) as f:
+            self.assertEqual(f.read(), TEXT)
+        self.assertEqual((self.destination / "doc.txt").read_bytes(), b"nouvelle version")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# Fichier : verification.py
+# Description : Vérification de l'intégrité des copies : relecture d'un fichier de la destination
+#               sans passer par le cache de pages et comparaison avec l'empreinte calculée pendant
+#               la copie.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - read_digest : empreinte SHA-256 d'un fichier relu avec O_DIRECT (tampon aligné sur la page),
+#      ou, si le système de fichiers le refuse, après synchronisation et libération de ses pages du
+#      cache (posix_fadvise DONTNEED) : les données relues viennent du support, pas de la mémoire.
+#    - CopyVerifier : vérification des copies (partagé par les threads de copie) et statistiques de
+#      débit propres à la relecture.
+#    - VerificationError : copie toujours différente de la source après les nouvelles tentatives.
+#
+# Version 1.1 (2026-10-19)
+#    - Paramètre 'throttle' de read_digest : fonction appelée avec la taille de chaque bloc lu
+#      (limitation du débit de l'audit des destinations).
+#
+############################################################################################################
+
+import errno
+import hashlib
+import mmap
+import os
+import threading
+import time
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# Modes de vérification des copies : aucune, empreinte calculée pendant la copie, copie relue et comparée
+VERIFY_MODES = ("off", "hash", "reread")
+
+# Nombre de nouvelles copies tentées après une vérification en échec
+VERIFY_RETRIES = 2
+
+
+class VerificationError(OSError):
+    """La copie d'un fichier diffère toujours de la source après les nouvelles tentatives."""
+    def __init__(self, path, attempts):
+        super().__init__(errno.EIO, f"Copie corrompue après {attempts} tentative(s)", str(path))
+
+
+def _read_direct(path, buffer_size, throttle):
+    """
+    Empreinte d'un fichier lu avec O_DIRECT.
+
+    Returns:
+        bytes: L'empreinte, ou None si O_DIRECT n'est pas pris en charge pour ce fichier.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return None  # tmpfs, certains systèmes FUSE...
+        raise
+    # Tampon anonyme mmap : aligné sur la page, comme l'exige O_DIRECT
+    size = max(mmap.PAGESIZE, buffer_size - buffer_size % mmap.PAGESIZE)
+    buffer = mmap.mmap(-1, size)
+    digest = hashlib.sha256()
+    try:
+        while True:
+            read = os.readv(fd, [buffer])
+            if throttle is not None:
+                throttle(read)
+            digest.update(memoryview(buffer)[:read])
+            if read < size:  # Fin de fichier (la position n'est plus alignée ensuite)
+                return digest.digest()
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            return None
+        raise
+    finally:
+        buffer.close()
+        os.close(fd)
+
+
+def _read_uncached(path, buffer_size, throttle):
+    """Empreinte d'un fichier relu après que ses pages ont été écrites puis libérées du cache."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        fd = f.fileno()
+        if hasattr(os, "posix_fadvise"):
+            os.fsync(fd)  # Les pages sales ne peuvent pas être libérées
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        while True:
+            block = f.read(buffer_size)
+            if not block:
+                break
+            if throttle is not None:
+                throttle(len(block))
+            digest.update(block)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    return digest.digest()
+
+
+def read_digest(path, buffer_size=DEFAULT_BUFFER_SIZE, throttle=None):
+    """
+    Empreinte SHA-256 d'un fichier relu depuis le support (O_DIRECT, sinon cache libéré au préalable).
+
+    Args:
+        path (str | Path): Fichier à relire.
+        buffer_size (int): Taille des lectures.
+        throttle (callable): Appelée avec la taille de chaque bloc lu (peut attendre pour limiter le débit).
+
+    Returns:
+        bytes: Empreinte de 32 octets.
+    """
+    if hasattr(os, "O_DIRECT"):
+        digest = _read_direct(path, buffer_size, throttle)
+        if digest is not None:
+            return digest
+    return _read_uncached(path, buffer_size, throttle)
+
+
+class CopyVerifier:
+    """
+    Relit les copies et les compare à l'empreinte calculée pendant la copie.
+    """
+    def __init__(self, buffer_size=DEFAULT_BUFFER_SIZE):
+        """
+        Args:
+            buffer_size (int): Taille des lectures de vérification.
+        """
+        self.buffer_size = buffer_size
+        self.files = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.mismatches = 0
+        self._lock = threading.Lock()
+
+    def verify(self, path, expected_digest):
+        """
+        Relit un fichier copié et le compare à l'empreinte attendue.
+
+        Args:
+            path (Path): Fichier de la destination.
+            expected_digest (bytes): Empreinte des données écrites.
+
+        Returns:
+            bool: True si le contenu relu correspond.
+        """
+        start = time.perf_counter()
+        actual_digest = read_digest(path, self.buffer_size)
+        elapsed = time.perf_counter() - start
+        size = os.stat(path).st_size
+        with self._lock:
+            self.files += 1
+            self.bytes += size
+            self.seconds += elapsed
+            if actual_digest != expected_digest:
+                self.mismatches += 1
+        return actual_digest == expected_digest
+
+    def summary(self):
+        """Résumé lisible du volume et du débit de relecture."""
+        throughput = self.bytes / self.seconds / (1024 * 1024) if self.seconds else 0.0
+        return (f"{self.files} fichier(s), {self.bytes // (1024 * 1024)} Mio relus en {self.seconds:.1f} s "
+                f"({throughput:.1f} Mio/s), {self.mismatches} écart(s) détecté(s)")
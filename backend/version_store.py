@@ -0,0 +1,286 @@
+# Fichier : version_store.py
+# Description : Compression des versions précédentes conservées dans le répertoire .cache de la
+#               destination, et lecture/restauration transparente de ces versions.
+#
+# Historique des versions :
+#
+# Version 1.0 (2026-10-19)
+#    - Version initiale du module.
+#    - compress_version : compression d'une version (gzip, lzma ou zlib de la bibliothèque standard),
+#      écrite dans un fichier temporaire puis renommée ; la version brute est conservée si le gain
+#      est négligeable (données déjà compressées).
+#    - VersionCompressor : groupe de threads de compression alimenté après la phase de copie
+#      (zlib et lzma libèrent le GIL pendant la compression).
+#    - open_version / restore_version : lecture d'une version compressée ou non, selon son suffixe.
+#    - Restauration en ligne de commande : python version_store.py <version> <fichier restauré>
+#
+# Version 1.1 (2026-10-19)
+#    - Versions stockées dans un dépôt de blocs (module chunk_store, recette <version>.chunks) :
+#      lecture et restauration transparentes, bloc par bloc.
+#
+# Version 1.2 (2026-10-19)
+#    - VersionCompressor : paramètre 'checkpoint', appelé avant chaque compression (pause de la
+#      synchronisation).
+#
+############################################################################################################
+
+import io
+import gzip
+import lzma
+import os
+import shutil
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from chunk_store import RECIPE_SUFFIX, ChunkStore, load_recipe
+
+CHUNK_SIZE = 1024 * 1024
+
+# Algorithme -> suffixe ajouté au nom de la version compressée
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "lzma": ".xz", "zlib": ".zz"}
+COMPRESSION_ALGORITHMS = ("none",) + tuple(COMPRESSION_SUFFIXES)
+
+# Niveau utilisé quand la configuration n'en fixe pas (-1)
+DEFAULT_LEVELS = {"gzip": 6, "lzma": 6, "zlib": 6}
+
+# La version compressée n'est conservée que si elle est plus petite que cette fraction de l'original
+MIN_COMPRESSION_RATIO = 0.95
+
+
+class _ZlibWriter(io.RawIOBase):
+    """Fichier binaire en écriture compressant au format zlib (sans équivalent dans la bibliothèque)."""
+    def __init__(self, raw, level):
+        self._raw = raw
+        self._compressor = zlib.compressobj(level)
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._raw.write(self._compressor.compress(data))
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._raw.write(self._compressor.flush())
+            self._raw.close()
+        super().close()
+
+
+class _ZlibReader(io.RawIOBase):
+    """Fichier binaire en lecture décompressant un flux zlib."""
+    def __init__(self, raw):
+        self._raw = raw
+        self._decompressor = zlib.decompressobj()
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        while not self._buffer and not self._decompressor.eof:
+            data = self._raw.read(CHUNK_SIZE)
+            self._buffer = self._decompressor.decompress(data) if data else self._decompressor.flush()
+            if not data:
+                break
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._raw.close()
+        super().close()
+
+
+class _RecipeReader(io.RawIOBase):
+    """Fichier binaire en lecture reconstituant une version à partir de sa recette, bloc par bloc."""
+    def __init__(self, recipe):
+        self._store = ChunkStore(recipe["repository"])
+        self._digests = iter(recipe["chunks"])
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        while not self._buffer:
+            digest = next(self._digests, None)
+            if digest is None:
+                return 0
+            self._buffer = self._store.read_chunk(bytes.fromhex(digest))
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _open_compressed(path, mode, algorithm, level=None):
+    """Ouvre un fichier compressé ('rb' ou 'wb') avec l'algorithme donné."""
+    if algorithm == "gzip":
+        return gzip.open(path, mode, compresslevel=level) if mode == "wb" else gzip.open(path, mode)
+    if algorithm == "lzma":
+        return lzma.open(path, mode, preset=level) if mode == "wb" else lzma.open(path, mode)
+    if mode == "wb":
+        return _ZlibWriter(open(path, 'wb'), level)
+    return io.BufferedReader(_ZlibReader(open(path, 'rb')), CHUNK_SIZE)
+
+
+def algorithm_of(path):
+    """Retourne l'algorithme de compression d'une version d'après son suffixe, ou "none"."""
+    name = os.fspath(path)
+    for algorithm, suffix in COMPRESSION_SUFFIXES.items():
+        if name.endswith(suffix):
+            return algorithm
+    return "none"
+
+
+def open_version(path):
+    """
+    Ouvre une version en lecture, en la décompressant au besoin.
+
+    Args:
+        path (str | Path): Version du répertoire .cache (compressée ou non).
+
+    Returns:
+        Fichier binaire lisible donnant le contenu d'origine.
+    """
+    if os.fspath(path).endswith(RECIPE_SUFFIX):
+        return io.BufferedReader(_RecipeReader(load_recipe(path)), CHUNK_SIZE)
+    algorithm = algorithm_of(path)
+    if algorithm == "none":
+        return open(path, 'rb')
+    return _open_compressed(path, 'rb', algorithm)
+
+
+def restore_version(version_path, target_path):
+    """
+    Restaure une version (compressée ou non) vers un fichier, via un fichier temporaire renommé.
+
+    Args:
+        version_path (str | Path): Version du répertoire .cache.
+        target_path (str | Path): Fichier à créer ou remplacer.
+    """
+    if os.fspath(version_path).endswith(RECIPE_SUFFIX):
+        recipe = load_recipe(version_path)
+        ChunkStore(recipe["repository"]).restore(recipe, target_path)
+        return
+    tmp_path = f"{os.fspath(target_path)}.restore-tmp"
+    try:
+        with open_version(version_path) as src, open(tmp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        shutil.copystat(version_path, tmp_path)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def compress_version(path, algorithm, level=-1, fsync=False):
+    """
+    Compresse une version et remplace le fichier brut par le fichier compressé.
+
+    Args:
+        path (str | Path): Version brute du répertoire .cache.
+        algorithm (str): "gzip", "lzma" ou "zlib".
+        level (int): Niveau de compression (-1 : niveau par défaut de l'algorithme).
+        fsync (bool): Synchroniser la version compressée avant de supprimer la version brute.
+
+    Returns:
+        tuple: (taille d'origine, taille conservée) en octets.
+    """
+    path = os.fspath(path)
+    level = DEFAULT_LEVELS[algorithm] if level < 0 else level
+    compressed_path = path + COMPRESSION_SUFFIXES[algorithm]
+    tmp_path = compressed_path + ".tmp"
+    original_size = os.stat(path).st_size
+    try:
+        with open(path, 'rb') as src, _open_compressed(tmp_path, 'wb', algorithm, level) as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+        compressed_size = os.stat(tmp_path).st_size
+        if compressed_size >= original_size * MIN_COMPRESSION_RATIO:
+            os.remove(tmp_path)
+            return original_size, original_size
+        shutil.copystat(path, tmp_path)
+        if fsync:
+            fd = os.open(tmp_path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        os.replace(tmp_path, compressed_path)
+        os.remove(path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return original_size, compressed_size
+
+
+class VersionCompressor:
+    """
+    Compresse des versions en arrière-plan dans un groupe de threads.
+    """
+    def __init__(self, algorithm, level=-1, workers=0, fsync=False, logger=None, checkpoint=None):
+        """
+        Args:
+            algorithm (str): "gzip", "lzma" ou "zlib".
+            level (int): Niveau de compression (-1 : défaut de l'algorithme).
+            workers (int): Nombre de threads (0 : nombre de processeurs).
+            fsync (bool): Synchroniser chaque version compressée avant de supprimer l'originale.
+            logger (logging.Logger): Journal des erreurs de compression.
+            checkpoint (callable): Appelé avant chaque compression (attend pendant une pause).
+        """
+        self.algorithm = algorithm
+        self.level = level
+        self.fsync = fsync
+        self.logger = logger
+        self.checkpoint = checkpoint
+        self.compressed = 0
+        self.original_bytes = 0
+        self.stored_bytes = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                            thread_name_prefix="compress")
+        self._futures = []
+
+    def submit(self, path):
+        """Planifie la compression d'une version."""
+        self._futures.append(self._executor.submit(self._compress, path))
+
+    def _compress(self, path):
+        if self.checkpoint is not None:
+            self.checkpoint()
+        try:
+            original_size, stored_size = compress_version(path, self.algorithm, self.level, self.fsync)
+        except OSError as e:
+            if self.logger is not None:
+                self.logger.warning(f"Compression de la version impossible, conservée brute : {path} ({e})")
+            return
+        with self._lock:
+            self.original_bytes += original_size
+            self.stored_bytes += stored_size
+            if stored_size < original_size:
+                self.compressed += 1
+
+    def wait(self):
+        """Attend la fin de toutes les compressions planifiées."""
+        self._executor.shutdown(wait=True)
+        for future in self._futures:
+            future.result()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Restaure une version du répertoire .cache.")
+    parser.add_argument("version", help="Version à restaurer (compressée ou non).")
+    parser.add_argument("target", help="Fichier restauré.")
+    args = parser.parse_args()
+    restore_version(args.version, args.target)
@@ -2,6 +2,20 @@
 #
 # Historique des versions:
 #
+# Version 3.40 (2026-10-19):
+#   - Boutons Pause et Reprendre à côté de Start/Stop (`pause_sync_process`, `resume_sync_process`) :
+#     la synchronisation s'interrompt entre deux fichiers et reprend sans reparcourir la source.
+#     Statut de tâche 'paused' suivi par le timer (barre de progression figée, bouton Reprendre actif).
+#
+# Version 3.39 (2026-10-19):
+#   - Statut de tâche 'stopping' (arrêt demandé, le moteur termine les copies en cours) : la tâche reste
+#     suivie par le timer, le bouton Stop est désactivé et la barre de progression l'indique.
+#
+# Version 3.38 (2026-10-19):
+#   - Statut de tâche 'completed_with_errors' (synchronisation terminée malgré des fichiers non
+#     synchronisés) : message dédié dans la barre de progression et le journal, et synthèse affichée
+#     comme pour une tâche terminée.
+#
 # Version 3.37 (2025-05-21):
 #   - Correction de l'AttributeError: 'NoneType' object has no attribute 'setText' dans `update_ui_texts`.
 #     L'appel à `self.language_combo.setCurrentIndex()` a été retiré de l'initialisation pour éviter
@@ -458,7 +472,7 @@ class MainWindow(QMainWindow):
         self.main_layout.addWidget(self.separator_line)
 
         # ---------------------------------------------
-        # Ligne 10: Boutons d'action (Start/Stop/Synthèse) - Répartis
+        # Ligne 10: Boutons d'action (Start/Pause/Reprendre/Stop/Synthèse) - Répartis
         # ---------------------------------------------
         self.action_buttons_layout = QHBoxLayout()
         self.start_button = QPushButton(self.texts[self.current_lang]["start_button"])
@@ -469,6 +483,14 @@ class MainWindow(QMainWindow):
         self.stop_button.setObjectName("stopButton")
         self.stop_button.clicked.connect(self.stop_sync_process)
 
+        self.pause_button = QPushButton(self.texts[self.current_lang]["pause_button"])
+        self.pause_button.setObjectName("darkBlueButton")
+        self.pause_button.clicked.connect(self.pause_sync_process)
+
+        self.resume_button = QPushButton(self.texts[self.current_lang]["resume_button"])
+        self.resume_button.setObjectName("darkBlueButton")
+        self.resume_button.clicked.connect(self.resume_sync_process)
+
         self.synthesis_button = QPushButton(self.texts[self.current_lang]["synthesis_button"])
         self.synthesis_button.setObjectName("darkBlueButton")
         self.synthesis_button.clicked.connect(self.get_synthesis)
@@ -476,6 +498,9 @@ class MainWindow(QMainWindow):
         self.action_buttons_layout.addStretch(1)
         self.action_buttons_layout.addWidget(self.start_button)
         self.action_buttons_layout.addStretch(1)
+        self.action_buttons_layout.addWidget(self.pause_button)
+        self.action_buttons_layout.addWidget(self.resume_button)
+        self.action_buttons_layout.addStretch(1)
         self.action_buttons_layout.addWidget(self.stop_button)
         self.action_buttons_layout.addStretch(1)
         self.action_buttons_layout.addWidget(self.synthesis_button)
@@ -632,6 +657,8 @@ class MainWindow(QMainWindow):
         self.delete_config_button.setText(texts["delete_config_button"])
         self.start_button.setText(texts["start_button"])
         self.stop_button.setText(texts["stop_button"])
+        self.pause_button.setText(texts["pause_button"])
+        self.resume_button.setText(texts["resume_button"])
         self.synthesis_button.setText(texts["synthesis_button"])
         self.clear_log_button.setText(texts["clear_log_button"])
         self.copy_log_button.setText(texts["copy_log_button"])
@@ -1060,7 +1087,7 @@ class MainWindow(QMainWindow):
     def update_start_button_state(self, is_running: bool, final_status: str = None):
         """
         Met à jour l'état visuel du bouton Start et la barre de progression.
-        final_status: 'completed', 'stopped', 'error' si la tâche vient de se terminer.
+        final_status: 'completed', 'completed_with_errors', 'stopped', 'error' si la tâche vient de se terminer.
         """
         current_texts = self.texts.get(self.current_lang, self.texts["en"])
         self.is_sync_running = is_running
@@ -1069,6 +1096,8 @@ class MainWindow(QMainWindow):
             self.start_button.setText(current_texts["start_button"]) # Texte "En Cours..."
             self.start_button.setEnabled(False)
             self.stop_button.setEnabled(True)
+            self.pause_button.setEnabled(True)
+            self.resume_button.setEnabled(False)
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
             self.progress_bar.setFormat(current_texts["log_sync_in_progress"].format(progress=0)) # Réinitialise le format
@@ -1077,12 +1106,18 @@ class MainWindow(QMainWindow):
             self.start_button.setText(current_texts["start_button"])
             self.start_button.setEnabled(True)
             self.stop_button.setEnabled(False)
+            self.pause_button.setEnabled(False)
+            self.resume_button.setEnabled(False)
             
             if final_status:
                 if final_status == "completed":
                     self.progress_bar.setValue(100)
                     self.progress_bar.setFormat(current_texts["log_sync_completed"])
                     self.log_message("log_sync_completed", is_formatted_key=True)
+                elif final_status == "completed_with_errors":
+                    self.progress_bar.setValue(100)
+                    self.progress_bar.setFormat(current_texts["log_sync_completed_with_errors"])
+                    self.log_message("log_sync_completed_with_errors", is_error=True, is_formatted_key=True)
                 elif final_status == "stopped":
                     self.progress_bar.setFormat(current_texts["log_sync_stopped"])
                     self.log_message("log_sync_stopped", is_formatted_key=True)
@@ -1142,6 +1177,32 @@ class MainWindow(QMainWindow):
         else:
             self.log_message("log_stop_error", is_error=True, error_code="API003", is_formatted_key=True, error_message=data.get('error', 'Erreur inconnue'))
 
+    def pause_sync_process(self):
+        """Met en pause la synchronisation sélectionnée via le backend (reprise sans nouveau parcours)."""
+        config_name = Path(self.source_input.text()).name or "default_config"
+
+        data, status_code = self.api_client.pause_sync_task(config_name)
+        if status_code == 200:
+            self.log_message("log_pause_sent", is_formatted_key=True, config_name=config_name, message=data.get('message'))
+            self.active_sync_tasks[config_name] = "paused"
+            self.pause_button.setEnabled(False)
+            self.resume_button.setEnabled(True)
+        else:
+            self.log_message("log_pause_error", is_error=True, error_code="API005", is_formatted_key=True, error_message=data.get('error', 'Erreur inconnue'))
+
+    def resume_sync_process(self):
+        """Reprend la synchronisation sélectionnée, mise en pause, là où elle s'était arrêtée."""
+        config_name = Path(self.source_input.text()).name or "default_config"
+
+        data, status_code = self.api_client.resume_sync_task(config_name)
+        if status_code == 200:
+            self.log_message("log_resume_sent", is_formatted_key=True, config_name=config_name, message=data.get('message'))
+            self.active_sync_tasks[config_name] = "running"
+            self.pause_button.setEnabled(True)
+            self.resume_button.setEnabled(False)
+        else:
+            self.log_message("log_resume_error", is_error=True, error_code="API006", is_formatted_key=True, error_message=data.get('error', 'Erreur inconnue'))
+
     def check_sync_status(self):
         """
         Vérifie périodiquement le statut de toutes les tâches de synchronisation
@@ -1166,8 +1227,8 @@ class MainWindow(QMainWindow):
             for task_name, backend_task in active_tasks_from_backend.items():
                 status = backend_task.get('status')
                 
-                if status == "running":
-                    self.active_sync_tasks[task_name] = "running" # Suivre toutes les tâches en cours
+                if status in ["running", "paused", "stopping"]:
+                    self.active_sync_tasks[task_name] = status # Suivre toutes les tâches en cours
                 elif task_name in self.active_sync_tasks:
                     del self.active_sync_tasks[task_name] # Retirer les tâches non running de notre suivi
 
@@ -1177,7 +1238,19 @@ class MainWindow(QMainWindow):
                         self.update_start_button_state(True) # Met l'UI en état "en cours"
                         self.progress_bar.setValue(backend_task.get('progress', 0))
                         self.progress_bar.setFormat(current_texts["log_sync_in_progress"].format(progress=backend_task.get('progress', 0)))
-                    elif status in ["completed", "stopped", "error"]:
+                    elif status == "paused":
+                        self.update_start_button_state(True)
+                        self.pause_button.setEnabled(False)
+                        self.resume_button.setEnabled(True)
+                        self.progress_bar.setValue(backend_task.get('progress', 0))
+                        self.progress_bar.setFormat(current_texts["log_sync_paused"].format(progress=backend_task.get('progress', 0)))
+                    elif status == "stopping":
+                        self.update_start_button_state(True)
+                        self.stop_button.setEnabled(False) # Arrêt déjà demandé
+                        self.pause_button.setEnabled(False)
+                        self.progress_bar.setValue(backend_task.get('progress', 0))
+                        self.progress_bar.setFormat(current_texts["log_sync_stopping"])
+                    elif status in ["completed", "completed_with_errors", "stopped", "error"]:
                         self.update_start_button_state(False, final_status=status)
                         self.get_synthesis(specific_task_name=task_name)
                         # Le timer sera arrêté plus bas si aucune tâche n'est active.
@@ -1266,7 +1339,7 @@ class MainWindow(QMainWindow):
                     self.log_message("log_synthesis_task_header", is_formatted_key=True, config_name=config_name, status=status.upper())
                     
                     # Affichage des détails si la tâche est terminée/arrêtée/en erreur
-                    if status in ["completed", "stopped", "error"]:
+                    if status in ["completed", "completed_with_errors", "stopped", "error"]:
                         self.log_message("log_synthesis_duration", is_formatted_key=True, duration=duration_str)
                         self.log_message("log_synthesis_dirs_added", is_formatted_key=True, count=dirs_added)
                         self.log_message("log_synthesis_files_added", is_formatted_key=True, count=files_added)